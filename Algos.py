@@ -1,2 +1,3 @@
 from Algos_py.Sorts import Sorts
-from Algos_py.MinimumSpanningTree import MinimumSpanningTree as MST
\ No newline at end of file
+from Algos_py.MinimumSpanningTree import MinimumSpanningTree as MST
+from Algos_py.DynamicMST import DynamicMST
\ No newline at end of file
@@ -0,0 +1,177 @@
+// Edges per thread below which Boruvka's rounds are not worth splitting
+const int BORUVKA_GRAIN = 1 << 14;
+
+// Parallel Boruvka's algorithm over a frozen graph. Each round every thread
+// scans its slice of the remaining edges, drops the ones inside a component
+// and offers the others to both endpoint components, whose cheapest edge is
+// kept in an atomic slot updated by compare-and-swap. Each thread then merges
+// the cheapest edges of its share of the components through a concurrent
+// union-find, and component ids are flattened in parallel for the next round.
+// Edges are compared by (weight, edge index), the order Kruskal's algorithm
+// uses, so the minimum spanning tree is unique and both algorithms return the
+// same edges, added in the same order
+Graph* BoruvkaMST(FrozenGraph* g, int threads){
+    if(g->GetSize() == 0)
+        return new Graph(false);
+
+    if(g->IsDirected())
+        throw std::invalid_argument("Graph is directed");
+
+    const std::vector<int>& ids = g->GetIds();
+    const std::vector<int>& from = g->GetEdgeFrom();
+    const std::vector<int>& to = g->GetEdgeTo();
+    const std::vector<double>& weights = g->GetEdgeWeights();
+    int n = ids.size();
+    int m = from.size();
+    threads = std::max(1, std::min(ResolveThreads(threads), std::max(m, n) / BORUVKA_GRAIN));
+
+    auto lighter = [&](int a, int b){
+        return weights[a] < weights[b] || (weights[a] == weights[b] && a < b);
+    };
+
+    // Concurrent union-find: roots are only linked by compare-and-swap, the
+    // larger index under the smaller so no cycle can form, and path halving
+    // only ever points a vertex at one of its ancestors, so racing finds and
+    // unions always see a valid forest. comp[v] is the root of v as of the
+    // start of the round
+    std::vector<std::atomic<int>> parent(n);
+    std::vector<int> comp(n);
+    for(int v = 0; v < n; v++)
+        parent[v].store(v, std::memory_order_relaxed);
+    std::iota(comp.begin(), comp.end(), 0);
+    auto find = [&](int x){
+        while(true){
+            int p = parent[x].load(std::memory_order_relaxed);
+            if(p == x)
+                return x;
+            int grandparent = parent[p].load(std::memory_order_relaxed);
+            if(grandparent != p)
+                parent[x].compare_exchange_weak(p, grandparent, std::memory_order_relaxed);
+            x = grandparent;
+        }
+    };
+    auto unite = [&](int a, int b){
+        while(true){
+            a = find(a);
+            b = find(b);
+            if(a == b)
+                return false;
+            if(a < b)
+                std::swap(a, b);
+            int root = a;
+            if(parent[a].compare_exchange_strong(root, b, std::memory_order_relaxed))
+                return true;
+        }
+    };
+
+    std::vector<std::atomic<int>> best(n);
+    for(std::atomic<int>& slot : best)
+        slot.store(-1, std::memory_order_relaxed);
+    auto offer = [&](int c, int e){
+        int current = best[c].load(std::memory_order_relaxed);
+        while(current == -1 || lighter(e, current))
+            if(best[c].compare_exchange_weak(current, e, std::memory_order_relaxed))
+                break;
+    };
+
+    // Remaining edges with their endpoints, so each scan is sequential,
+    // split into one slice per thread that shrinks in place
+    struct AliveEdge{
+        int u;
+        int v;
+        int index;
+    };
+    std::vector<AliveEdge> alive(m);
+    for(int e = 0; e < m; e++)
+        alive[e] = {from[e], to[e], e};
+    std::vector<int> sliceBegin(threads), sliceEnd(threads);
+    for(int t = 0; t < threads; t++){
+        sliceBegin[t] = (long long)m * t / threads;
+        sliceEnd[t] = (long long)m * (t + 1) / threads;
+    }
+
+    std::vector<int> chosen;
+    chosen.reserve(n - 1);
+    std::vector<std::vector<int>> picked(threads);
+    std::vector<std::function<void()>> tasks(threads);
+    while(true){
+        for(int t = 0; t < threads; t++){
+            tasks[t] = [&, t]{
+                int kept = sliceBegin[t];
+                for(int i = sliceBegin[t]; i < sliceEnd[t]; i++){
+                    AliveEdge edge = alive[i];
+                    int a = comp[edge.u];
+                    int b = comp[edge.v];
+                    if(a == b)
+                        continue;
+                    alive[kept++] = edge;
+                    offer(a, edge.index);
+                    offer(b, edge.index);
+                }
+                sliceEnd[t] = kept;
+            };
+        }
+        RunTasks(tasks);
+
+        // The cheapest edges form a forest, so every distinct one joins two
+        // components; an edge chosen by both of its sides is kept only once
+        for(int t = 0; t < threads; t++){
+            tasks[t] = [&, t]{
+                int end = (long long)n * (t + 1) / threads;
+                for(int c = (long long)n * t / threads; c < end; c++){
+                    int e = best[c].load(std::memory_order_relaxed);
+                    if(e == -1)
+                        continue;
+                    best[c].store(-1, std::memory_order_relaxed);
+                    if(unite(from[e], to[e]))
+                        picked[t].push_back(e);
+                }
+            };
+        }
+        RunTasks(tasks);
+
+        bool merged = false;
+        for(std::vector<int>& edges : picked){
+            merged = merged || !edges.empty();
+            chosen.insert(chosen.end(), edges.begin(), edges.end());
+            edges.clear();
+        }
+        if(!merged)
+            break;
+
+        // No unions run here, so every vertex settles on the same root and
+        // can point at it directly
+        for(int t = 0; t < threads; t++){
+            tasks[t] = [&, t]{
+                int end = (long long)n * (t + 1) / threads;
+                for(int v = (long long)n * t / threads; v < end; v++){
+                    comp[v] = find(v);
+                    parent[v].store(comp[v], std::memory_order_relaxed);
+                }
+            };
+        }
+        RunTasks(tasks);
+    }
+
+    if((int)chosen.size() != n - 1)
+        throw std::invalid_argument("Graph is not connected");
+
+    std::vector<KruskalEdge> edges(chosen.size());
+    for(size_t i = 0; i < chosen.size(); i++)
+        edges[i] = {weights[chosen[i]], from[chosen[i]], to[chosen[i]], chosen[i]};
+    IntroSort(edges.data(), edges.size());
+
+    std::vector<int> src(edges.size()), dst(edges.size());
+    std::vector<double> w(edges.size());
+    for(size_t i = 0; i < edges.size(); i++){
+        src[i] = ids[edges[i].u];
+        dst[i] = ids[edges[i].v];
+        w[i] = edges[i].weight;
+    }
+    return SpanningTreeGraph(ids, src, dst, w);
+}
+
+// Boruvka's algorithm over the graph's CSR snapshot
+Graph* BoruvkaMST(Graph* g, int threads){
+    return BoruvkaMST(g->Snapshot(), threads);
+}
\ No newline at end of file
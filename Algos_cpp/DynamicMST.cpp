@@ -0,0 +1,319 @@
+// Dynamic Minimum Spanning Forest
+
+// What DynamicMST::AddEdge did with the new edge
+enum DynamicMSTChange{DYNAMIC_MST_REJECTED, DYNAMIC_MST_JOINED, DYNAMIC_MST_REPLACED};
+
+// Minimum spanning forest maintained under edge insertions. The forest is
+// kept in a link-cut tree in which every tree edge is a node of its own
+// between its two endpoint vertices, so a path query returns the heaviest
+// edge on the cycle a new edge would close. Inserting (u, v, w) then costs
+// O(log V) amortized: link it if u and v are in different trees, otherwise
+// swap it for the heaviest cycle edge when that one is heavier. Edges are
+// ordered by (weight, insertion order), so the forest is the one Kruskal's
+// algorithm would pick over all the edges inserted so far
+class DynamicMST{
+    private:
+        // Link-cut tree nodes, one per vertex and one per forest edge; the
+        // nodes of edges that leave the forest are recycled
+        std::vector<int> parent;
+        std::vector<int> left;
+        std::vector<int> right;
+        std::vector<char> flipped;
+        // Heaviest node of each splay subtree
+        std::vector<int> heaviest;
+        std::vector<char> isEdge;
+        std::vector<double> weight;
+        std::vector<long long> order;
+        // Endpoint nodes of edge nodes, vertex value of vertex nodes
+        std::vector<int> edgeU;
+        std::vector<int> edgeV;
+        std::vector<int> value;
+        std::vector<int> freeNodes;
+        std::vector<int> path;
+
+        // Vertex value -> node, and the vertex values in insertion order
+        std::unordered_map<int, int> index;
+        std::vector<int> ids;
+
+        long long inserted;
+        int edgeCount;
+        double total;
+
+        // Strict (weight, insertion order) comparison; vertices weigh nothing
+        bool Heavier(int a, int b) const{
+            if(!isEdge[b])
+                return isEdge[a];
+            if(!isEdge[a])
+                return false;
+            if(weight[a] != weight[b])
+                return weight[a] > weight[b];
+            return order[a] > order[b];
+        }
+
+        bool IsSplayRoot(int x) const{
+            int p = parent[x];
+            return p == -1 || (left[p] != x && right[p] != x);
+        }
+
+        void Pull(int x){
+            heaviest[x] = x;
+            if(left[x] != -1 && Heavier(heaviest[left[x]], heaviest[x]))
+                heaviest[x] = heaviest[left[x]];
+            if(right[x] != -1 && Heavier(heaviest[right[x]], heaviest[x]))
+                heaviest[x] = heaviest[right[x]];
+        }
+
+        void Push(int x){
+            if(!flipped[x])
+                return;
+            std::swap(left[x], right[x]);
+            if(left[x] != -1)
+                flipped[left[x]] ^= 1;
+            if(right[x] != -1)
+                flipped[right[x]] ^= 1;
+            flipped[x] = 0;
+        }
+
+        void Rotate(int x){
+            int p = parent[x];
+            int g = parent[p];
+            if(!IsSplayRoot(p)){
+                if(left[g] == p)
+                    left[g] = x;
+                else
+                    right[g] = x;
+            }
+            parent[x] = g;
+            if(left[p] == x){
+                left[p] = right[x];
+                if(right[x] != -1)
+                    parent[right[x]] = p;
+                right[x] = p;
+            }
+            else{
+                right[p] = left[x];
+                if(left[x] != -1)
+                    parent[left[x]] = p;
+                left[x] = p;
+            }
+            parent[p] = x;
+            Pull(p);
+            Pull(x);
+        }
+
+        void Splay(int x){
+            // Push pending flips from the splay root down to x first
+            path.clear();
+            for(int y = x; ; y = parent[y]){
+                path.push_back(y);
+                if(IsSplayRoot(y))
+                    break;
+            }
+            for(auto it = path.rbegin(); it != path.rend(); ++it)
+                Push(*it);
+
+            while(!IsSplayRoot(x)){
+                int p = parent[x];
+                if(!IsSplayRoot(p)){
+                    int g = parent[p];
+                    bool zigZig = (left[g] == p) == (left[p] == x);
+                    Rotate(zigZig ? p : x);
+                }
+                Rotate(x);
+            }
+        }
+
+        void Access(int x){
+            int last = -1;
+            for(int y = x; y != -1; y = parent[y]){
+                Splay(y);
+                right[y] = last;
+                Pull(y);
+                last = y;
+            }
+            Splay(x);
+        }
+
+        void MakeRoot(int x){
+            Access(x);
+            flipped[x] ^= 1;
+        }
+
+        int FindRoot(int x){
+            Access(x);
+            for(Push(x); left[x] != -1; Push(x))
+                x = left[x];
+            Splay(x);
+            return x;
+        }
+
+        void Link(int x, int y){
+            MakeRoot(x);
+            parent[x] = y;
+        }
+
+        // Remove the tree edge between x and its neighbor y
+        void Cut(int x, int y){
+            MakeRoot(x);
+            Access(y);
+            left[y] = -1;
+            parent[x] = -1;
+            Pull(y);
+        }
+
+        int NewNode(bool edge, double w){
+            int x;
+            if(!freeNodes.empty()){
+                x = freeNodes.back();
+                freeNodes.pop_back();
+            }
+            else{
+                x = parent.size();
+                parent.push_back(-1);
+                left.push_back(-1);
+                right.push_back(-1);
+                flipped.push_back(0);
+                heaviest.push_back(x);
+                isEdge.push_back(0);
+                weight.push_back(0);
+                order.push_back(0);
+                edgeU.push_back(-1);
+                edgeV.push_back(-1);
+                value.push_back(0);
+            }
+            parent[x] = left[x] = right[x] = -1;
+            flipped[x] = 0;
+            heaviest[x] = x;
+            isEdge[x] = edge;
+            weight[x] = w;
+            order[x] = inserted++;
+            return x;
+        }
+
+        int VertexNode(int v){
+            auto it = index.find(v);
+            if(it != index.end())
+                return it->second;
+            int x = NewNode(false, 0);
+            index[v] = x;
+            value[x] = v;
+            ids.push_back(v);
+            return x;
+        }
+
+        int VertexNodeOrThrow(int v){
+            auto it = index.find(v);
+            if(it == index.end())
+                throw std::invalid_argument("Vertex " + std::to_string(v) + " does not exist");
+            return it->second;
+        }
+
+    public:
+        DynamicMST(): inserted(0), edgeCount(0), total(0) {}
+
+        // Start from the minimum spanning forest of a frozen graph
+        DynamicMST(FrozenGraph* g): DynamicMST(){
+            for(int id : g->GetIds())
+                VertexNode(id);
+            std::vector<int> src, dst;
+            std::vector<double> w;
+            KruskalForest(g, src, dst, w);
+            for(size_t i = 0; i < src.size(); i++)
+                AddEdge(src[i], dst[i], w[i]);
+        }
+
+        int GetSize(){
+            return ids.size();
+        }
+
+        int GetEdgeCount(){
+            return edgeCount;
+        }
+
+        double GraphWeight(){
+            return total;
+        }
+
+        void AddVertex(int v){
+            VertexNode(v);
+        }
+
+        bool IsConnected(int u, int v){
+            int a = VertexNodeOrThrow(u);
+            int b = VertexNodeOrThrow(v);
+            return a == b || FindRoot(a) == FindRoot(b);
+        }
+
+        // Insert the edge (u, v, w), creating missing vertices. If it replaces
+        // a heavier cycle edge, that edge is written to removedU, removedV and
+        // removedWeight. Self-loops never enter the forest
+        int AddEdge(int u, int v, double w, int& removedU, int& removedV, double& removedWeight){
+            int a = VertexNode(u);
+            int b = VertexNode(v);
+            if(a == b)
+                return DYNAMIC_MST_REJECTED;
+
+            int e = NewNode(true, w);
+            if(FindRoot(a) != FindRoot(b)){
+                edgeU[e] = a;
+                edgeV[e] = b;
+                Link(a, e);
+                Link(e, b);
+                edgeCount++;
+                total += w;
+                return DYNAMIC_MST_JOINED;
+            }
+
+            MakeRoot(a);
+            Access(b);
+            int worst = heaviest[b];
+            if(!Heavier(worst, e)){
+                isEdge[e] = 0;
+                freeNodes.push_back(e);
+                return DYNAMIC_MST_REJECTED;
+            }
+
+            removedU = value[edgeU[worst]];
+            removedV = value[edgeV[worst]];
+            removedWeight = weight[worst];
+            Cut(edgeU[worst], worst);
+            Cut(worst, edgeV[worst]);
+            isEdge[worst] = 0;
+            freeNodes.push_back(worst);
+            total -= removedWeight;
+
+            edgeU[e] = a;
+            edgeV[e] = b;
+            Link(a, e);
+            Link(e, b);
+            total += w;
+            return DYNAMIC_MST_REPLACED;
+        }
+
+        int AddEdge(int u, int v, double w){
+            int removedU, removedV;
+            double removedWeight;
+            return AddEdge(u, v, w, removedU, removedV, removedWeight);
+        }
+
+        // Forest edges as vertex values, in insertion order
+        void GetEdges(std::vector<int>& src, std::vector<int>& dst, std::vector<double>& w){
+            std::vector<int> edges;
+            for(size_t x = 0; x < isEdge.size(); x++)
+                if(isEdge[x])
+                    edges.push_back(x);
+            std::sort(edges.begin(), edges.end(), [&](int a, int b){ return order[a] < order[b]; });
+            src.clear();
+            dst.clear();
+            w.clear();
+            for(int e : edges){
+                src.push_back(value[edgeU[e]]);
+                dst.push_back(value[edgeV[e]]);
+                w.push_back(weight[e]);
+            }
+        }
+
+        const std::vector<int>& GetIds(){
+            return ids;
+        }
+};
\ No newline at end of file
@@ -0,0 +1,195 @@
+// External Sort
+typedef void (*SortProgressCallback)(long long done, long long total);
+
+const long long EXTERNAL_SORT_MIN_BLOCK = 1 << 12;
+
+// Order used when merging sorted runs: NaN keys come after every other key,
+// matching SortWith
+template <typename T>
+bool MergeLess(T a, T b){
+    if constexpr (std::is_floating_point<T>::value){
+        if(std::isnan(a))
+            return false;
+        if(std::isnan(b))
+            return true;
+    }
+    return a < b;
+}
+
+// Open an anonymous temporary file in dir. The file is unlinked right away,
+// so it disappears as soon as it is closed
+inline FILE* OpenTempFile(const char* dir){
+    std::string pattern = std::string(dir) + "/dsalgos-run-XXXXXX";
+    std::vector<char> path(pattern.begin(), pattern.end());
+    path.push_back('\0');
+
+    int fd = mkstemp(path.data());
+    if(fd == -1)
+        throw std::runtime_error("Cannot create a temporary file in " + std::string(dir));
+    unlink(path.data());
+
+    FILE* file = fdopen(fd, "w+b");
+    if(file == nullptr){
+        close(fd);
+        throw std::runtime_error("Cannot open a temporary file in " + std::string(dir));
+    }
+    return file;
+}
+
+template <typename T>
+void WriteAll(FILE* file, const T data[], size_t count){
+    if(fwrite(data, sizeof(T), count, file) != count)
+        throw std::runtime_error("Write failed while sorting file");
+}
+
+// Buffered reader over one sorted run
+template <typename T>
+struct RunReader{
+    FILE* file;
+    std::vector<T> block;
+    size_t position;
+    size_t length;
+
+    bool Refill(){
+        length = fread(block.data(), sizeof(T), block.size(), file);
+        position = 0;
+        return length > 0;
+    }
+};
+
+// Sort a binary file of T values that may not fit in memory. The input is
+// memory-mapped and cut into runs of at most memoryLimit bytes (including
+// the sort's scratch space); each run is sorted with the given algorithm and
+// spilled to a temporary file, then all runs are k-way merged with a heap
+// through large buffered reads and writes
+template <typename T>
+void ExternalSort(const char* inPath, const char* outPath, long long memoryLimit, const char* tempDir, int algorithm, SortProgressCallback progress){
+    int fd = open(inPath, O_RDONLY);
+    if(fd == -1)
+        throw std::runtime_error("Cannot open " + std::string(inPath));
+
+    struct stat info;
+    if(fstat(fd, &info) == -1){
+        close(fd);
+        throw std::runtime_error("Cannot stat " + std::string(inPath));
+    }
+    if(info.st_size % sizeof(T) != 0){
+        close(fd);
+        throw std::invalid_argument("File size is not a multiple of the element size");
+    }
+    // Opening the output truncates it, which would destroy a mapped input
+    struct stat target;
+    if(stat(outPath, &target) == 0 && target.st_dev == info.st_dev && target.st_ino == info.st_ino){
+        close(fd);
+        throw std::invalid_argument("Output file is the same file as the input");
+    }
+
+    long long total = info.st_size / sizeof(T);
+    const T* input = nullptr;
+    if(total > 0){
+        void* mapped = mmap(nullptr, info.st_size, PROT_READ, MAP_PRIVATE, fd, 0);
+        if(mapped == MAP_FAILED){
+            close(fd);
+            throw std::runtime_error("Cannot memory-map " + std::string(inPath));
+        }
+        madvise(mapped, info.st_size, MADV_SEQUENTIAL);
+        input = (const T*)mapped;
+    }
+    close(fd);
+
+    std::vector<FILE*> runs;
+    FILE* out = nullptr;
+    try{
+        out = fopen(outPath, "wb");
+        if(out == nullptr)
+            throw std::runtime_error("Cannot open " + std::string(outPath));
+
+        long long runLength = std::max(EXTERNAL_SORT_MIN_BLOCK, memoryLimit / (long long)(2 * sizeof(T)));
+        runLength = std::min(runLength, std::min(total, (long long)INT_MAX));
+        std::vector<T> chunk(runLength);
+        std::vector<T> scratch(runLength);
+
+        for(long long start = 0; start < total; start += runLength){
+            int length = (int)std::min(runLength, total - start);
+            std::copy(input + start, input + start + length, chunk.data());
+            SortWith(chunk.data(), length, algorithm, scratch.data());
+
+            if(length == total)
+                WriteAll(out, chunk.data(), length);
+            else{
+                runs.push_back(OpenTempFile(tempDir));
+                WriteAll(runs.back(), chunk.data(), length);
+            }
+            if(progress)
+                progress(start + length, 2 * total);
+        }
+        std::vector<T>().swap(chunk);
+        std::vector<T>().swap(scratch);
+        if(input)
+            munmap((void*)input, info.st_size);
+        input = nullptr;
+
+        if(!runs.empty()){
+            long long blockLength = std::max(EXTERNAL_SORT_MIN_BLOCK, memoryLimit / (long long)((runs.size() + 1) * sizeof(T)));
+
+            std::vector<RunReader<T>> readers(runs.size());
+            typedef std::pair<T, int> HeapItem;
+            auto after = [](const HeapItem& a, const HeapItem& b){
+                if(MergeLess(b.first, a.first))
+                    return true;
+                if(MergeLess(a.first, b.first))
+                    return false;
+                return a.second > b.second;
+            };
+            std::priority_queue<HeapItem, std::vector<HeapItem>, decltype(after)> heap(after);
+
+            for(size_t r = 0; r < runs.size(); r++){
+                rewind(runs[r]);
+                readers[r].file = runs[r];
+                readers[r].block.resize(blockLength);
+                if(readers[r].Refill())
+                    heap.push({readers[r].block[0], (int)r});
+            }
+
+            std::vector<T> output;
+            output.reserve(blockLength);
+            long long written = 0;
+            while(!heap.empty()){
+                HeapItem top = heap.top();
+                heap.pop();
+                output.push_back(top.first);
+
+                RunReader<T>& reader = readers[top.second];
+                reader.position++;
+                if(reader.position < reader.length || reader.Refill())
+                    heap.push({reader.block[reader.position], top.second});
+
+                if((long long)output.size() == blockLength){
+                    WriteAll(out, output.data(), output.size());
+                    written += output.size();
+                    output.clear();
+                    if(progress)
+                        progress(total + written, 2 * total);
+                }
+            }
+            WriteAll(out, output.data(), output.size());
+            if(progress)
+                progress(2 * total, 2 * total);
+        }
+        else if(progress)
+            progress(2 * total, 2 * total);
+    } catch(...) {
+        if(input)
+            munmap((void*)input, info.st_size);
+        for(FILE* run : runs)
+            fclose(run);
+        if(out)
+            fclose(out);
+        throw;
+    }
+
+    for(FILE* run : runs)
+        fclose(run);
+    if(fclose(out) != 0)
+        throw std::runtime_error("Cannot write " + std::string(outPath));
+}
@@ -0,0 +1,140 @@
+// K-Way Merge
+
+// Type-erased base, so the handle can be queried and destroyed from C
+// without knowing the element type
+struct KWayMergeBase{
+    virtual ~KWayMergeBase(){}
+    virtual int Needs() const = 0;
+};
+
+// Streaming merge of k sorted sources through a loser tree. Each source is
+// fed in batches; when the winning source runs out of buffered values before
+// it is finished, Next stops and reports that source through Needs() so the
+// caller can feed exactly that one. Equal values are taken from the source
+// with the lower index first, so the merge is stable, and NaNs come last
+template <typename T>
+class KWayMerge : public KWayMergeBase{
+    private:
+        struct Source{
+            std::vector<T> values;
+            size_t position = 0;
+            bool fed = false;
+            bool finished = false;
+        };
+
+        int k;
+        std::vector<Source> sources;
+        // tree[0] is the overall winner, tree[1..k-1] hold the loser of each match
+        std::vector<int> tree;
+        bool built;
+        int needs;
+
+        bool Empty(int s) const{
+            return sources[s].position == sources[s].values.size();
+        }
+
+        // True if source a must be emitted before source b. A finished empty
+        // source plays as +infinity
+        bool Beats(int a, int b) const{
+            if(Empty(a))
+                return false;
+            if(Empty(b))
+                return true;
+            const T& x = sources[a].values[sources[a].position];
+            const T& y = sources[b].values[sources[b].position];
+            if(MergeLess(x, y))
+                return true;
+            if(MergeLess(y, x))
+                return false;
+            return a < b;
+        }
+
+        int Build(int node){
+            if(node >= k)
+                return node - k;
+            int a = Build(2 * node);
+            int b = Build(2 * node + 1);
+            if(Beats(a, b)){
+                tree[node] = b;
+                return a;
+            }
+            tree[node] = a;
+            return b;
+        }
+
+        // Replay the matches on the path from source s to the root
+        void Replay(int s){
+            int winner = s;
+            for(int node = (s + k) / 2; node > 0; node /= 2){
+                if(Beats(tree[node], winner))
+                    std::swap(tree[node], winner);
+            }
+            tree[0] = winner;
+        }
+
+    public:
+        KWayMerge(int k) : k(k), sources(k), tree(k > 0 ? k : 1, 0), built(k == 0), needs(k > 0 ? 0 : -1){
+            if(k < 0)
+                throw std::invalid_argument("Number of sources must be non-negative");
+        }
+
+        // Index of the source that must be fed before Next can continue, or -1
+        int Needs() const override{
+            return needs;
+        }
+
+        // Replace the buffered values of source s with the next batch. A batch
+        // with finished set is the source's last one and may be empty
+        void Feed(int s, const T values[], int count, bool finished){
+            if(s < 0 || s >= k)
+                throw std::out_of_range("Source index out of range");
+            Source& source = sources[s];
+            if(source.finished || !Empty(s))
+                throw std::logic_error("Source fed before its values were consumed");
+            source.values.assign(values, values + count);
+            source.position = 0;
+            source.fed = true;
+            source.finished = finished;
+            if(count == 0 && !finished)
+                return;
+
+            if(built){
+                if(s == needs){
+                    needs = -1;
+                    Replay(s);
+                }
+                return;
+            }
+            // Before the first merge every source is fed once, in order
+            while(needs < k && sources[needs].fed && (sources[needs].finished || !Empty(needs)))
+                needs++;
+            if(needs == k){
+                needs = -1;
+                if(k > 1)
+                    tree[0] = Build(1);
+                built = true;
+            }
+        }
+
+        // Write up to capacity merged values to out and return how many were
+        // written. Fewer than capacity means either every source is exhausted
+        // or Needs() names the source to feed next
+        int Next(T out[], int capacity){
+            if(k == 0 || !built || needs != -1)
+                return 0;
+            int count = 0;
+            while(count < capacity){
+                int w = tree[0];
+                if(Empty(w))
+                    break;
+                Source& source = sources[w];
+                out[count++] = source.values[source.position++];
+                if(Empty(w) && !source.finished){
+                    needs = w;
+                    break;
+                }
+                Replay(w);
+            }
+            return count;
+        }
+};
@@ -1,87 +1,121 @@
-void Merge(std::vector<Edge*>& A, int left, int mid, int right){
-    int n1 = mid - left + 1;
-    int n2 = right - mid;
+// One edge of a Kruskal run by dense vertex index. Equal weights are ordered
+// by the edge's position in the graph, so the in-place introsort picks the
+// same tree as a stable sort would
+struct KruskalEdge{
+    double weight;
+    int u;
+    int v;
+    int index;
 
-    std::vector<Edge*> L(n1);
-    std::vector<Edge*> R(n2);
+    bool operator<(const KruskalEdge& other) const{
+        if(weight != other.weight)
+            return weight < other.weight;
+        return index < other.index;
+    }
+};
+
+// Minimum spanning forest of a frozen graph by Kruskal's algorithm. The
+// edges are copied once into a compact (weight, u, v) array that is
+// introsorted in place, then joined through an array union-find (union by
+// size, path halving). src, dst and w receive the forest's edges as vertex
+// values. If labels is given, it receives the component of every dense
+// index, numbered in order of their first vertex like
+// WeaklyConnectedComponents, and componentWeights the weight of each tree.
+// Returns the number of components
+int KruskalForest(FrozenGraph* g, std::vector<int>& src, std::vector<int>& dst, std::vector<double>& w,
+                  std::vector<int>* labels = nullptr, std::vector<double>* componentWeights = nullptr){
+    if(g->IsDirected())
+        throw std::invalid_argument("Graph is directed");
 
-    for(int i = 0; i < n1; i++)
-        L[i] = A[left + i];
-    for(int j = 0; j < n2; j++)
-        R[j] = A[mid + j + 1];
-        
-    int i = 0;
-    int j = 0;
-    int k = left;
+    const std::vector<int>& ids = g->GetIds();
+    const std::vector<int>& from = g->GetEdgeFrom();
+    const std::vector<int>& to = g->GetEdgeTo();
+    const std::vector<double>& weights = g->GetEdgeWeights();
+    int n = ids.size();
+    int m = from.size();
 
-    while (i < n1 && j < n2) {
-        if (L[i]->GetWeight() <= R[j]->GetWeight()) {
-            A[k] = L[i];
-            i++;
-        } else {
-            A[k] = R[j];
-            j++;
+    std::vector<KruskalEdge> edges(m);
+    for(int e = 0; e < m; e++)
+        edges[e] = {weights[e], from[e], to[e], e};
+    IntroSort(edges.data(), m);
+
+    // size and treeWeight are only meaningful at roots
+    std::vector<int> parent(n), size(n, 1);
+    std::vector<double> treeWeight(n, 0);
+    std::iota(parent.begin(), parent.end(), 0);
+    auto find = [&](int x){
+        while(parent[x] != x){
+            parent[x] = parent[parent[x]];
+            x = parent[x];
         }
-        k++;
-    }
+        return x;
+    };
 
-    while (i < n1) {
-        A[k] = L[i];
-        i++;
-        k++;
+    src.clear();
+    dst.clear();
+    w.clear();
+    for(const KruskalEdge& e : edges){
+        int a = find(e.u);
+        int b = find(e.v);
+        if(a == b)
+            continue;
+        if(size[a] < size[b])
+            std::swap(a, b);
+        parent[b] = a;
+        size[a] += size[b];
+        treeWeight[a] += treeWeight[b] + e.weight;
+        src.push_back(ids[e.u]);
+        dst.push_back(ids[e.v]);
+        w.push_back(e.weight);
+        if((int)src.size() == n - 1)
+            break;
     }
 
-    while (j < n2) {
-        A[k] = R[j];
-        j++;
-        k++;
+    int components = n - src.size();
+    if(labels != nullptr){
+        labels->assign(n, -1);
+        std::vector<int> rootLabel(n, -1);
+        if(componentWeights != nullptr)
+            componentWeights->assign(components, 0);
+        int count = 0;
+        for(int v = 0; v < n; v++){
+            int r = find(v);
+            if(rootLabel[r] == -1){
+                rootLabel[r] = count++;
+                if(componentWeights != nullptr)
+                    (*componentWeights)[rootLabel[r]] = treeWeight[r];
+            }
+            (*labels)[v] = rootLabel[r];
+        }
     }
+    return components;
 }
 
-void MergeSort(std::vector<Edge*>& A, int left, int right){
-    if(left < right){
-        int mid = (left + right) / 2;
-        MergeSort(A, left, mid);
-        MergeSort(A, mid + 1, right);
-        Merge(A, left, mid, right);
-    }
+// Undirected graph holding every vertex of ids and the given tree edges,
+// added in one bulk AddEdges call
+Graph* SpanningTreeGraph(const std::vector<int>& ids, std::vector<int>& src, std::vector<int>& dst, std::vector<double>& w){
+    Graph* A = new Graph(false);
+    std::vector<int> rejected;
+    int duplicates = 0, selfLoops = 0;
+    A->AddVertices(ids.data(), ids.size());
+    A->AddEdges(src.data(), dst.data(), w.data(), src.size(), DUPLICATE_ERROR, SELF_LOOP_ERROR, rejected, duplicates, selfLoops);
+    return A;
 }
 
-Graph* KruskalMST(Graph* g){
+// Kruskal's algorithm over a frozen graph: its spanning forest, which must
+// be a single tree
+Graph* KruskalMST(FrozenGraph* g){
     if(g->GetSize() == 0)
         return new Graph(false);
 
-    if(g->IsDirected())
-        throw std::invalid_argument("Graph is directed");
-
-    if(!g->IsConnected())
+    std::vector<int> src, dst;
+    std::vector<double> w;
+    if(KruskalForest(g, src, dst, w) != 1)
         throw std::invalid_argument("Graph is not connected");
+    return SpanningTreeGraph(g->GetIds(), src, dst, w);
+}
 
-    Graph* A = new Graph(false);
-    DisjointSets* ds = new DisjointSets();
-
-    LinkedList* vertices = g->GetVertices();
-    Node<int>* head = vertices->GetHead();
-    while(head != nullptr){
-        A->CreateVertex(head->GetData());
-        ds->MakeSet(head->GetData());
-        head = head->GetNext();
-    }
-
-    std::vector<Edge*> edges = g->GetEdges();
-
-    if (!edges.empty())
-        MergeSort(edges, 0, edges.size() - 1);
-
-    for(Edge* e : edges){
-        if(ds->FindSet(e->GetV())->GetData() != ds->FindSet(e->GetU())->GetData()){
-            A->CreateEdge(e->GetV(), e->GetU(), e->GetWeight());
-            ds->Union(e->GetV(), e->GetU());
-        }
-    }
-
-    delete vertices;
-    delete ds;
-    
-    return A;
+// Kruskal's algorithm over the graph's CSR snapshot
+Graph* KruskalMST(Graph* g){
+    return KruskalMST(g->Snapshot());
 }
\ No newline at end of file
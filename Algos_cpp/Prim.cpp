@@ -1,75 +1,59 @@
-int findKeyByValue(const std::map<int, double>& m, double value) {
-    for (const auto& pair : m) {
-        if (pair.second == value)
-            return pair.first;
-    }
-    return -1;
-}
-
-Graph* PrimMST(Graph* g){
+// Prim's algorithm over a frozen graph, walking the CSR neighbor ranges.
+// Every vertex sits in an indexed min-heap at most once, keyed by its
+// lightest edge to the tree so far, and a lighter edge lowers its key in
+// place (decrease-key), so the heap never holds more than V entries.
+// Equal keys are taken in dense index order
+Graph* PrimMST(FrozenGraph* g){
     if(g->GetSize() == 0)
         return new Graph(false);
 
     if(g->IsDirected())
         throw std::invalid_argument("Graph is directed");
 
-    if(!g->IsConnected())
-        throw std::invalid_argument("Graph is not connected");
-
-    Graph* A = new Graph(false);
-
-    std::map<int, double> keys;
-    std::map<int, int> parents;
-
-    LinkedList* vertices = g->GetVertices();
-    Node<int>* current = vertices->GetHead();
-    while(current){
-        int data = current->GetData();
-        A->CreateVertex(data);
-        keys[data] = INT_MAX;
-        parents[data] = INT_MIN;
-        current = current->GetNext();
-    }
-    
-    keys[vertices->GetHead()->GetData()] = 0;
-    
-    PriorityQueue* pq = new PriorityQueue(false);
-    for(auto pair : keys){
-        pq->Insert(pair.second);
-    }
-    
-    while(pq->GetSize() != 0){
-        double u_key = pq->ExtractTop();
-        int u = findKeyByValue(keys, u_key);
-        keys.erase(u);
-
-        LinkedList* neighbors = g->GetNeighbors(u);
-        Node<int>* current = neighbors->GetHead();
-        while(current){
-            int v = current->GetData();
-            
-            double edge_weight = g->EdgeWeight(u, v);  
-            
-            auto key_it = keys.find(v);
-            if(key_it != keys.end() && pq->IndexOf(key_it->second) != -1 && edge_weight < key_it->second){
+    const std::vector<int>& ids = g->GetIds();
+    const std::vector<int>& offsets = g->GetOffsets();
+    const std::vector<int>& targets = g->GetTargets();
+    const std::vector<double>& weights = g->GetWeights();
+    int n = ids.size();
+
+    std::vector<double> keys(n, std::numeric_limits<double>::infinity());
+    std::vector<int> parents(n, -1);
+    std::vector<char> done(n, 0);
+
+    IndexedPriorityQueue pq(n);
+    keys[0] = 0;
+    pq.Push(0, 0);
+    int reached = 0;
+
+    while(!pq.IsEmpty()){
+        int u = pq.Pop();
+        done[u] = 1;
+        reached++;
+
+        for(int i = offsets[u]; i < offsets[u + 1]; i++){
+            int v = targets[i];
+            if(!done[v] && weights[i] < keys[v]){
+                keys[v] = weights[i];
                 parents[v] = u;
-                pq->UpdateKey(pq->IndexOf(key_it->second), edge_weight);
-                key_it->second = edge_weight;
+                pq.Push(v, weights[i]);
             }
-            
-            current = current->GetNext();
         }
-
-        delete neighbors;
-    }    
-
-    for(auto pair: parents){
-        if(pair.second != INT_MIN)
-            A->CreateEdge(pair.second, pair.first, g->EdgeWeight(pair.first, pair.second));
     }
 
-    delete pq;
-    delete vertices;
+    if(reached != n)
+        throw std::invalid_argument("Graph is not connected");
+
+    Graph* A = new Graph(false);
+    for(int id : ids)
+        A->CreateVertex(id);
+    for(int v = 0; v < n; v++)
+        if(parents[v] != -1)
+            A->CreateEdge(ids[parents[v]], ids[v], keys[v]);
 
     return A;
+}
+
+// Prim's algorithm over the graph's CSR snapshot
+Graph* PrimMST(Graph* g){
+    return PrimMST(g->Snapshot());
 }
\ No newline at end of file
@@ -1,9 +1,33 @@
+// Key-Value pairs, ordered by key only, so every comparison sort below can
+// carry a payload along with its keys
+template <typename K, typename V>
+struct KeyValue{
+    K key;
+    V value;
+};
+
+template <typename K, typename V>
+bool operator<(const KeyValue<K, V>& a, const KeyValue<K, V>& b){
+    return a.key < b.key;
+}
+
+template <typename T>
+T SortKey(const T& x){
+    return x;
+}
+
+template <typename K, typename V>
+K SortKey(const KeyValue<K, V>& x){
+    return x.key;
+}
+
 // Insertion Sort
-void InsertionSort(int A[], int size){
+template <typename T>
+void InsertionSort(T A[], int size){
     for (int j = 1; j <= size - 1; j++){
-        int key = A[j];
+        T key = A[j];
         int i = j - 1;
-        while(i >= 0 && A[i] > key){
+        while(i >= 0 && key < A[i]){
             A[i + 1] = A[i];
             i--;
         }
@@ -11,66 +35,26 @@ void InsertionSort(int A[], int size){
     }
 }
 
-// Merge Sort
-void Merge(int A[], int left, int mid, int right){
-    int n1 = mid - left + 1;
-    int n2 = right - mid;
-
-    int* L = new int[n1 + 1];
-    int* R = new int[n2 + 1];
-
-    for(int i = 0; i < n1; i++)
-        L[i] = A[left + i];
-    for(int j = 0; j < n2; j++)
-        R[j] = A[mid + j + 1];
-    L[n1] = INT_MAX;
-    R[n2] = INT_MAX;
-        
-    int i = 0;
-    int j = 0;
-
-    for(int k = left; k <= right; k++){
-        if(L[i] <= R[j]){
-            A[k] = L[i];
-            i++;
-        }
-        else{
-            A[k] = R[j];
-            j++;
-        }
-    }
-
-    delete[] L;
-    delete[] R;
-}
-
-void MergeSort(int A[], int left, int right){
-    if(left < right){
-        int mid = (left + right) / 2;
-        MergeSort(A, left, mid);
-        MergeSort(A, mid + 1, right);
-        Merge(A, left, mid, right);
-    }
-}
-
 // Quick Sort
-int Partition(int A[], int left, int right){
+template <typename T>
+int Partition(T A[], int left, int right){
     int i = left - 1;
     for(int j = left; j <= right - 1; j++){
-        if(A[j] <= A[right]){
+        if(!(A[right] < A[j])){
             i++;
-            int temp = A[i];
+            T temp = A[i];
             A[i] = A[j];
             A[j] = temp;
         }
     }
-    int temp = A[i + 1];
+    T temp = A[i + 1];
     A[i + 1] = A[right];
     A[right] = temp;
     return i + 1;
 }
 
-void QuickSort(int A[], int left, int right){
+template <typename T>
+void QuickSort(T A[], int left, int right){
     if(left < right){
         int p = Partition(A, left, right);
         QuickSort(A, left, p - 1);
@@ -79,17 +63,624 @@ void QuickSort(int A[], int left, int right){
 }
 
 // Counting Sort
-void CountingSort(int A[], int B[], int k, int size){
-    int* C = new int[k + 1];
-    for(int i = 0; i <= k; i++)
-        C[i] = 0;
+// Counts are offset by the minimum, so only max - min + 1 buckets are needed
+const long long COUNTING_SORT_MAX_RANGE = 1LL << 28;
+
+template <typename T>
+void CountingSort(T A[], T B[], int size){
+    long long min = SortKey(A[0]);
+    long long max = SortKey(A[0]);
+    for(int i = 1; i < size; i++){
+        long long key = SortKey(A[i]);
+        if(key < min)
+            min = key;
+        if(key > max)
+            max = key;
+    }
+
+    // Unsigned, since max - min overflows long long for wide int64 ranges
+    unsigned long long k = (unsigned long long)max - (unsigned long long)min;
+    if(k >= (unsigned long long)COUNTING_SORT_MAX_RANGE)
+        throw std::length_error("Range of values is too large for counting sort");
+
+    std::vector<int> C(k + 1, 0);
     for(int i = 0; i < size; i++)
-        C[A[i]] = C[A[i]] + 1;
-    for(int i = 1; i <= k; i++)
+        C[SortKey(A[i]) - min] = C[SortKey(A[i]) - min] + 1;
+    for(unsigned long long i = 1; i <= k; i++)
         C[i] = C[i] + C[i - 1];
     for(int i = size - 1; i >= 0; i--){
-        B[C[A[i]] - 1] = A[i];
-        C[A[i]] = C[A[i]] -1;
+        B[C[SortKey(A[i]) - min] - 1] = A[i];
+        C[SortKey(A[i]) - min] = C[SortKey(A[i]) - min] - 1;
+    }
+}
+
+
+// Intro Sort
+const int INSERTION_SORT_CUTOFF = 16;
+const int NINTHER_THRESHOLD = 128;
+
+template <typename T>
+void InsertionSortRange(T A[], int left, int right){
+    for(int j = left + 1; j <= right; j++){
+        T key = A[j];
+        int i = j - 1;
+        while(i >= left && key < A[i]){
+            A[i + 1] = A[i];
+            i--;
+        }
+        A[i + 1] = key;
+    }
+}
+
+template <typename T>
+void SiftDown(T A[], int left, int i, int size){
+    T item = A[left + i];
+    while(2 * i + 1 < size){
+        int child = 2 * i + 1;
+        if(child + 1 < size && A[left + child] < A[left + child + 1])
+            child++;
+        if(!(item < A[left + child]))
+            break;
+        A[left + i] = A[left + child];
+        i = child;
+    }
+    A[left + i] = item;
+}
+
+template <typename T>
+void HeapSortRange(T A[], int left, int right){
+    int size = right - left + 1;
+    for(int i = size / 2 - 1; i >= 0; i--)
+        SiftDown(A, left, i, size);
+    for(int end = size - 1; end > 0; end--){
+        std::swap(A[left], A[left + end]);
+        SiftDown(A, left, 0, end);
+    }
+}
+
+template <typename T>
+int MedianOfThree(T A[], int a, int b, int c){
+    if(A[a] < A[b]){
+        if(A[b] < A[c])
+            return b;
+        return A[a] < A[c] ? c : a;
+    }
+    if(A[a] < A[c])
+        return a;
+    return A[b] < A[c] ? c : b;
+}
+
+// Median of three for small ranges, Tukey's ninther for large ones
+template <typename T>
+int ChoosePivot(T A[], int left, int right){
+    int mid = left + (right - left) / 2;
+    if(right - left + 1 < NINTHER_THRESHOLD)
+        return MedianOfThree(A, left, mid, right);
+
+    int step = (right - left + 1) / 8;
+    int a = MedianOfThree(A, left, left + step, left + 2 * step);
+    int b = MedianOfThree(A, mid - step, mid, mid + step);
+    int c = MedianOfThree(A, right - 2 * step, right - step, right);
+    return MedianOfThree(A, a, b, c);
+}
+
+// Dutch national flag partition: on return A[left..lt-1] < pivot,
+// A[lt..gt] == pivot and A[gt+1..right] > pivot
+template <typename T>
+void ThreeWayPartition(T A[], int left, int right, int pivotIndex, int& lt, int& gt){
+    T pivot = A[pivotIndex];
+    lt = left;
+    gt = right;
+    int i = left;
+    while(i <= gt){
+        if(A[i] < pivot)
+            std::swap(A[lt++], A[i++]);
+        else if(pivot < A[i])
+            std::swap(A[i], A[gt--]);
+        else
+            i++;
+    }
+}
+
+template <typename T>
+void IntroSortLoop(T A[], int left, int right, int depthLimit){
+    while(right - left + 1 > INSERTION_SORT_CUTOFF){
+        if(depthLimit == 0){
+            HeapSortRange(A, left, right);
+            return;
+        }
+        depthLimit--;
+
+        int lt, gt;
+        ThreeWayPartition(A, left, right, ChoosePivot(A, left, right), lt, gt);
+
+        // Recurse into the smaller side and loop on the larger one,
+        // which bounds the stack depth by O(log n)
+        if(lt - left < right - gt){
+            IntroSortLoop(A, left, lt - 1, depthLimit);
+            left = gt + 1;
+        }
+        else{
+            IntroSortLoop(A, gt + 1, right, depthLimit);
+            right = lt - 1;
+        }
+    }
+    InsertionSortRange(A, left, right);
+}
+
+template <typename T>
+void IntroSort(T A[], int size){
+    if(size < 2)
+        return;
+    int depthLimit = 0;
+    for(int n = size; n > 1; n >>= 1)
+        depthLimit += 2;
+    IntroSortLoop(A, 0, size - 1, depthLimit);
+}
+
+
+// Natural Merge Sort
+const int MIN_RUN = 32;
+
+// Find the run starting at `start`, reversing it if it is strictly descending,
+// and return the index one past its end
+template <typename T>
+int FindRun(T A[], int start, int size){
+    int end = start + 1;
+    if(end == size)
+        return end;
+
+    if(A[end] < A[start]){
+        while(end + 1 < size && A[end + 1] < A[end])
+            end++;
+        end++;
+        std::reverse(A + start, A + end);
+    }
+    else{
+        while(end + 1 < size && !(A[end + 1] < A[end]))
+            end++;
+        end++;
+    }
+    return end;
+}
+
+// Merge the adjacent sorted runs A[lo..mid-1] and A[mid..hi-1] through buffer
+template <typename T>
+void MergeRuns(T A[], int lo, int mid, int hi, T buffer[]){
+    if(!(A[mid] < A[mid - 1]))
+        return;
+
+    // Elements of the left run that are not greater than A[mid] are already in place
+    lo = std::upper_bound(A + lo, A + mid, A[mid]) - A;
+
+    int n1 = mid - lo;
+    std::copy(A + lo, A + mid, buffer);
+
+    int i = 0;
+    int j = mid;
+    int k = lo;
+    while(i < n1 && j < hi){
+        if(A[j] < buffer[i])
+            A[k++] = A[j++];
+        else
+            A[k++] = buffer[i++];
+    }
+    while(i < n1)
+        A[k++] = buffer[i++];
+}
+
+// Bottom-up merge sort over natural runs. Uses one scratch buffer of `size`
+// elements, either supplied by the caller or allocated once per call
+template <typename T>
+void NaturalMergeSort(T A[], int size, T buffer[] = nullptr){
+    if(size < 2)
+        return;
+
+    std::vector<int> runs;
+    int start = 0;
+    while(start < size){
+        int end = FindRun(A, start, size);
+        if(end - start < MIN_RUN){
+            end = std::min(start + MIN_RUN, size);
+            InsertionSortRange(A, start, end - 1);
+        }
+        runs.push_back(start);
+        start = end;
+    }
+    runs.push_back(size);
+
+    std::vector<T> owned;
+    if(buffer == nullptr){
+        owned.resize(size);
+        buffer = owned.data();
+    }
+
+    while(runs.size() > 2){
+        std::vector<int> merged;
+        size_t count = runs.size() - 1;
+        for(size_t r = 0; r + 1 < count; r += 2){
+            MergeRuns(A, runs[r], runs[r + 1], runs[r + 2], buffer);
+            merged.push_back(runs[r]);
+        }
+        if(count % 2 == 1)
+            merged.push_back(runs[count - 1]);
+        merged.push_back(size);
+        runs.swap(merged);
+    }
+}
+
+
+// Radix Sort
+// Map each key to an unsigned integer with the same order. Signed integers
+// have their sign bit flipped so negative values come first
+inline uint32_t RadixKey(int x){
+    return (uint32_t)x ^ 0x80000000u;
+}
+
+inline uint64_t RadixKey(long long x){
+    return (uint64_t)x ^ 0x8000000000000000ull;
+}
+
+inline uint32_t RadixKey(uint32_t x){
+    return x;
+}
+
+// Floats flip every bit when negative and only the sign bit otherwise
+inline uint32_t RadixKey(float x){
+    uint32_t bits;
+    std::memcpy(&bits, &x, sizeof(bits));
+    return (bits & 0x80000000u) ? ~bits : bits ^ 0x80000000u;
+}
+
+inline uint64_t RadixKey(double x){
+    uint64_t bits;
+    std::memcpy(&bits, &x, sizeof(bits));
+    return (bits & 0x8000000000000000ull) ? ~bits : bits ^ 0x8000000000000000ull;
+}
+
+template <typename K, typename V>
+auto RadixKey(const KeyValue<K, V>& x){
+    return RadixKey(x.key);
+}
+
+// LSD radix sort over 8-bit digits. All digit histograms are built in a single
+// pass and digits shared by every key are skipped
+template <typename T>
+void RadixSort(T A[], int size, T buffer[] = nullptr){
+    if(size < 2)
+        return;
+
+    const int passes = sizeof(RadixKey(A[0]));
+    std::vector<int> counts(passes * 256, 0);
+    for(int i = 0; i < size; i++){
+        auto key = RadixKey(A[i]);
+        for(int p = 0; p < passes; p++)
+            counts[p * 256 + ((key >> (8 * p)) & 0xFF)]++;
+    }
+
+    std::vector<T> owned;
+    if(buffer == nullptr){
+        owned.resize(size);
+        buffer = owned.data();
+    }
+
+    T* src = A;
+    T* dst = buffer;
+    for(int p = 0; p < passes; p++){
+        int* C = &counts[p * 256];
+        if(C[(RadixKey(src[0]) >> (8 * p)) & 0xFF] == size)
+            continue;
+
+        int offset = 0;
+        for(int d = 0; d < 256; d++){
+            int count = C[d];
+            C[d] = offset;
+            offset += count;
+        }
+
+        for(int i = 0; i < size; i++)
+            dst[C[(RadixKey(src[i]) >> (8 * p)) & 0xFF]++] = src[i];
+        std::swap(src, dst);
+    }
+
+    if(src != A)
+        std::copy(src, src + size, A);
+}
+
+
+// Sort Dispatch
+enum SortAlgorithm{
+    INSERTION_SORT,
+    MERGE_SORT,
+    QUICK_SORT,
+    LOMUTO_QUICK_SORT,
+    COUNTING_SORT,
+    RADIX_SORT
+};
+
+// Move NaN keys behind every other key, keeping the relative order of both
+// groups, and return the number of non-NaN keys
+template <typename T>
+int MoveNaNsLast(T A[], int size){
+    std::vector<T> nans;
+    int count = 0;
+    for(int i = 0; i < size; i++){
+        if(std::isnan(SortKey(A[i])))
+            nans.push_back(A[i]);
+        else
+            A[count++] = A[i];
+    }
+    std::copy(nans.begin(), nans.end(), A + count);
+    return count;
+}
+
+// Sort A with the given algorithm. NaN keys are ordered after every other
+// key. The optional buffer of `size` elements is used as scratch space by
+// merge sort and radix sort
+template <typename T>
+void SortWith(T A[], int size, int algorithm, T buffer[] = nullptr){
+    typedef decltype(SortKey(A[0])) Key;
+
+    if constexpr (!std::is_integral<Key>::value)
+        if(algorithm == COUNTING_SORT)
+            throw std::invalid_argument("Counting sort requires integer keys");
+
+    if constexpr (std::is_floating_point<Key>::value)
+        size = MoveNaNsLast(A, size);
+
+    if(size < 2)
+        return;
+
+    switch(algorithm){
+        case INSERTION_SORT:
+            InsertionSort(A, size);
+            break;
+        case MERGE_SORT:
+            NaturalMergeSort(A, size, buffer);
+            break;
+        case QUICK_SORT:
+            IntroSort(A, size);
+            break;
+        case LOMUTO_QUICK_SORT:
+            QuickSort(A, 0, size - 1);
+            break;
+        case COUNTING_SORT:
+            if constexpr (std::is_integral<Key>::value){
+                std::vector<T> B(size);
+                CountingSort(A, B.data(), size);
+                std::copy(B.begin(), B.end(), A);
+            }
+            break;
+        case RADIX_SORT:
+            RadixSort(A, size, buffer);
+            break;
+        default:
+            throw std::invalid_argument("Unknown sort algorithm");
+    }
+}
+
+// Write into idx the permutation that sorts keys
+template <typename K>
+void ArgSortWith(K keys[], int idx[], int size, int algorithm){
+    std::vector<KeyValue<K, int>> pairs(size);
+    for(int i = 0; i < size; i++)
+        pairs[i] = {keys[i], i};
+
+    SortWith(pairs.data(), size, algorithm);
+
+    for(int i = 0; i < size; i++)
+        idx[i] = pairs[i].value;
+}
+
+// Sort keys and apply the same permutation to values
+template <typename K, typename V>
+void SortByKeyWith(K keys[], V values[], int size, int algorithm){
+    std::vector<KeyValue<K, V>> pairs(size);
+    for(int i = 0; i < size; i++)
+        pairs[i] = {keys[i], values[i]};
+
+    SortWith(pairs.data(), size, algorithm);
+
+    for(int i = 0; i < size; i++){
+        keys[i] = pairs[i].key;
+        values[i] = pairs[i].value;
+    }
+}
+
+
+// Parallel Sort
+// Number of elements of a that precede the k-th output element when a and b
+// are merged stably (merge path co-rank)
+template <typename T>
+int CoRank(int k, const T a[], int na, const T b[], int nb){
+    int lo = std::max(0, k - nb);
+    int hi = std::min(k, na);
+    while(lo < hi){
+        int i = lo + (hi - lo) / 2;
+        int j = k - i;
+        if(j > 0 && !(b[j - 1] < a[i]))
+            lo = i + 1;
+        else
+            hi = i;
+    }
+    return lo;
+}
+
+// Stable merge of a and b into out, split along the merge path into
+// `pieces` independent tasks
+template <typename T>
+void AddMergeTasks(std::vector<std::function<void()>>& tasks, const T a[], int na, const T b[], int nb, T out[], int pieces){
+    int total = na + nb;
+    for(int p = 0; p < pieces; p++){
+        int k0 = (int)((long long)total * p / pieces);
+        int k1 = (int)((long long)total * (p + 1) / pieces);
+        tasks.push_back([=](){
+            int i = CoRank(k0, a, na, b, nb);
+            int j = k0 - i;
+            int iEnd = CoRank(k1, a, na, b, nb);
+            int jEnd = k1 - iEnd;
+            std::merge(a + i, a + iEnd, b + j, b + jEnd, out + k0);
+        });
+    }
+}
+
+// Sort chunks of A concurrently with the given algorithm, then merge them
+// pairwise, each merge itself split across the available threads. Inputs
+// smaller than `threshold` are sorted serially. A caller-provided buffer of
+// size elements is used as the scratch space instead of allocating one
+template <typename T>
+void ParallelSortWith(T A[], int size, int algorithm, int threads, int threshold, T buffer[] = nullptr){
+    threads = std::min(ResolveThreads(threads), std::max(1, size / 2));
+    if(threads <= 1 || size < threshold){
+        SortWith(A, size, algorithm, buffer);
+        return;
     }
-    delete[] C;
-}
\ No newline at end of file
+
+    typedef decltype(SortKey(A[0])) Key;
+    if constexpr (std::is_floating_point<Key>::value)
+        size = MoveNaNsLast(A, size);
+
+    std::vector<int> runs;
+    for(int t = 0; t <= threads; t++)
+        runs.push_back((int)((long long)size * t / threads));
+
+    std::vector<T> owned;
+    T* scratch = buffer;
+    if(scratch == nullptr){
+        owned.resize(size);
+        scratch = owned.data();
+    }
+    std::vector<std::function<void()>> tasks;
+    for(int t = 0; t < threads; t++){
+        int lo = runs[t];
+        int hi = runs[t + 1];
+        T* chunkBuffer = scratch + lo;
+        tasks.push_back([=](){ SortWith(A + lo, hi - lo, algorithm, chunkBuffer); });
+    }
+    RunTasks(tasks);
+
+    T* src = A;
+    T* dst = scratch;
+    while(runs.size() > 2){
+        tasks.clear();
+        std::vector<int> merged;
+        size_t count = runs.size() - 1;
+        int pairs = count / 2;
+        int pieces = std::max(1, threads / pairs);
+        for(size_t r = 0; r + 1 < count; r += 2){
+            int lo = runs[r];
+            int mid = runs[r + 1];
+            int hi = runs[r + 2];
+            AddMergeTasks(tasks, src + lo, mid - lo, src + mid, hi - mid, dst + lo, pieces);
+            merged.push_back(lo);
+        }
+        if(count % 2 == 1){
+            int lo = runs[count - 1];
+            tasks.push_back([=](){ std::copy(src + lo, src + size, dst + lo); });
+            merged.push_back(lo);
+        }
+        merged.push_back(size);
+        RunTasks(tasks);
+        runs.swap(merged);
+        std::swap(src, dst);
+    }
+
+    if(src != A)
+        std::copy(src, src + size, A);
+}
+
+
+// Selection
+// Introselect: reorder A so that A[k] holds the value it would have if A were
+// sorted, with no greater value before it and no smaller value after it.
+// Uses the introsort pivot and partition, falling back to heap sort of the
+// remaining range at the depth limit
+template <typename T>
+void IntroSelect(T A[], int size, int k){
+    typedef decltype(SortKey(A[0])) Key;
+    if constexpr (std::is_floating_point<Key>::value){
+        size = MoveNaNsLast(A, size);
+        if(k >= size)
+            return;
+    }
+
+    int left = 0;
+    int right = size - 1;
+    int depthLimit = 0;
+    for(int n = size; n > 1; n >>= 1)
+        depthLimit += 2;
+
+    while(right - left + 1 > INSERTION_SORT_CUTOFF){
+        if(depthLimit == 0){
+            HeapSortRange(A, left, right);
+            return;
+        }
+        depthLimit--;
+
+        int lt, gt;
+        ThreeWayPartition(A, left, right, ChoosePivot(A, left, right), lt, gt);
+        if(k < lt)
+            right = lt - 1;
+        else if(k > gt)
+            left = gt + 1;
+        else
+            return;
+    }
+    InsertionSortRange(A, left, right);
+}
+
+// Reorder A so that A[0..k-1] holds its k smallest values in sorted order.
+// Small k keep a bounded max-heap of the best candidates (O(n log k)); large
+// k select the k-th value first and sort the prefix (O(n + k log k))
+template <typename T>
+void PartialSort(T A[], int size, int k){
+    typedef decltype(SortKey(A[0])) Key;
+    if constexpr (std::is_floating_point<Key>::value)
+        size = MoveNaNsLast(A, size);
+    k = std::min(k, size);
+    if(k <= 0)
+        return;
+
+    if(k > size / 8){
+        if(k < size)
+            IntroSelect(A, size, k - 1);
+        IntroSort(A, k);
+        return;
+    }
+
+    for(int i = k / 2 - 1; i >= 0; i--)
+        SiftDown(A, 0, i, k);
+    for(int i = k; i < size; i++){
+        if(A[i] < A[0]){
+            std::swap(A[0], A[i]);
+            SiftDown(A, 0, 0, k);
+        }
+    }
+    for(int end = k - 1; end > 0; end--){
+        std::swap(A[0], A[end]);
+        SiftDown(A, 0, 0, end);
+    }
+}
+
+// Write into out the k largest (or smallest) values of A, best first.
+// A is reordered in the process
+template <typename T>
+void TopK(T A[], int size, int k, bool largest, T out[]){
+    if(!largest){
+        PartialSort(A, size, k);
+        std::copy(A, A + k, out);
+        return;
+    }
+
+    if(k < size)
+        IntroSelect(A, size, size - k);
+    std::copy(A + size - k, A + size, out);
+
+    // NaNs rank above every other value, so they lead once reversed
+    int count = k;
+    typedef decltype(SortKey(A[0])) Key;
+    if constexpr (std::is_floating_point<Key>::value)
+        count = MoveNaNsLast(out, k);
+    IntroSort(out, count);
+    std::reverse(out, out + k);
+}
@@ -0,0 +1,136 @@
+"""
+Dynamic Minimum Spanning Forest.
+
+This module provides a Python wrapper for the C++ DynamicMST, a minimum
+spanning forest kept up to date under edge insertions.
+"""
+from __future__ import annotations
+
+import os
+import array
+import ctypes
+from DataStructures import Graph, FrozenGraph
+
+# Load the library
+lib = ctypes.CDLL(os.path.join(os.path.dirname(__file__), "../Build/algos.so"))
+
+# --- C Library Signatures ---
+lib.Create_DynamicMST.argtypes = []
+lib.Create_DynamicMST.restype = ctypes.c_void_p
+
+lib.Create_DynamicMST_Graph.argtypes = [ctypes.c_void_p]
+lib.Create_DynamicMST_Graph.restype = ctypes.c_void_p
+
+lib.Create_DynamicMST_FrozenGraph.argtypes = [ctypes.c_void_p]
+lib.Create_DynamicMST_FrozenGraph.restype = ctypes.c_void_p
+
+lib.Destroy_DynamicMST.argtypes = [ctypes.c_void_p]
+lib.Destroy_DynamicMST.restype = None
+
+lib.AddVertex_DynamicMST.argtypes = [ctypes.c_void_p, ctypes.c_int]
+lib.AddVertex_DynamicMST.restype = None
+
+lib.AddEdge_DynamicMST.argtypes = [ctypes.c_void_p, ctypes.c_int, ctypes.c_int, ctypes.c_double, ctypes.POINTER(ctypes.c_int),
+                                   ctypes.POINTER(ctypes.c_double)]
+lib.AddEdge_DynamicMST.restype = ctypes.c_int
+
+lib.GetSize_DynamicMST.argtypes = [ctypes.c_void_p]
+lib.GetSize_DynamicMST.restype = ctypes.c_int
+
+lib.GetEdgeCount_DynamicMST.argtypes = [ctypes.c_void_p]
+lib.GetEdgeCount_DynamicMST.restype = ctypes.c_int
+
+lib.GraphWeight_DynamicMST.argtypes = [ctypes.c_void_p]
+lib.GraphWeight_DynamicMST.restype = ctypes.c_double
+
+lib.IsConnected_DynamicMST.argtypes = [ctypes.c_void_p, ctypes.c_int, ctypes.c_int]
+lib.IsConnected_DynamicMST.restype = ctypes.c_int
+
+lib.GetEdges_DynamicMST.argtypes = [ctypes.c_void_p, ctypes.POINTER(ctypes.c_int), ctypes.POINTER(ctypes.c_int),
+                                    ctypes.POINTER(ctypes.c_double)]
+lib.GetEdges_DynamicMST.restype = None
+
+lib.ToGraph_DynamicMST.argtypes = [ctypes.c_void_p]
+lib.ToGraph_DynamicMST.restype = ctypes.c_void_p
+
+# DynamicMSTChange values
+_REJECTED = 0
+_JOINED = 1
+_REPLACED = 2
+
+class DynamicMST:
+    """
+    Minimum spanning forest maintained under edge insertions.
+
+    The forest lives in a native link-cut tree, so AddEdge runs in O(log V)
+    amortized time: a new edge joining two trees is linked, and one closing
+    a cycle replaces the heaviest edge on that cycle if it is lighter. Equal
+    weights keep the earlier edge, so the forest always matches what
+    MinimumSpanningTree.Kruskal returns over every edge inserted so far. The
+    total weight is kept up to date and read in O(1).
+    """
+    def __init__(self, graph: Graph | FrozenGraph | None = None) -> None:
+        """Start from the minimum spanning forest of graph, or from an empty forest."""
+        if graph is None:
+            self.ptr = lib.Create_DynamicMST()
+        elif isinstance(graph, FrozenGraph):
+            self.ptr = lib.Create_DynamicMST_FrozenGraph(graph.ptr)
+        else:
+            self.ptr = lib.Create_DynamicMST_Graph(graph.ptr)
+        if not self.ptr:
+            raise ValueError("DynamicMST requires an undirected graph")
+
+    def __del__(self) -> None:
+        """Automatically destroy the forest when the object is collected."""
+        if hasattr(self, 'ptr') and self.ptr:
+            lib.Destroy_DynamicMST(self.ptr)
+            self.ptr = None
+
+    def AddVertex(self, vertex: int) -> None:
+        """Add an isolated vertex; existing vertices are left unchanged."""
+        lib.AddVertex_DynamicMST(self.ptr, vertex)
+
+    def AddEdge(self, u: int, v: int, weight: float = 0) -> tuple[bool, tuple[int, int, float] | None]:
+        """
+        Insert the edge (u, v) with the given weight, creating missing vertices.
+
+        Returns (added, removed): whether the edge entered the forest, and the
+        (u, v, weight) of the forest edge it replaced, or None. Self-loops and
+        edges no lighter than every edge of the cycle they close are not added.
+        """
+        removed = (ctypes.c_int * 2)()
+        removed_weight = ctypes.c_double()
+        change = lib.AddEdge_DynamicMST(self.ptr, u, v, weight, removed, ctypes.byref(removed_weight))
+        if change == _REPLACED:
+            return True, (removed[0], removed[1], removed_weight.value)
+        return change == _JOINED, None
+
+    def GetSize(self) -> int:
+        """Get the number of vertices."""
+        return lib.GetSize_DynamicMST(self.ptr)
+
+    def GetEdgeCount(self) -> int:
+        """Get the number of forest edges."""
+        return lib.GetEdgeCount_DynamicMST(self.ptr)
+
+    def GraphWeight(self) -> float:
+        """Get the total weight of the forest, without rescanning its edges."""
+        return lib.GraphWeight_DynamicMST(self.ptr)
+
+    def IsConnected(self, u: int, v: int) -> bool | None:
+        """Check if two vertices are in the same tree, or None if one does not exist."""
+        result = lib.IsConnected_DynamicMST(self.ptr, u, v)
+        return None if result == -1 else bool(result)
+
+    def GetEdges(self) -> tuple[array.array, array.array, array.array]:
+        """Get the forest edges as (src, dst, weights) arrays, in insertion order."""
+        count = self.GetEdgeCount()
+        src = (ctypes.c_int * count)()
+        dst = (ctypes.c_int * count)()
+        weights = (ctypes.c_double * count)()
+        lib.GetEdges_DynamicMST(self.ptr, src, dst, weights)
+        return array.array("i", src), array.array("i", dst), array.array("d", weights)
+
+    def ToGraph(self) -> Graph:
+        """Build an undirected Graph holding every vertex and the forest edges."""
+        return Graph(ptr=lib.ToGraph_DynamicMST(self.ptr))
\ No newline at end of file
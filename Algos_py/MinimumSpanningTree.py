@@ -1,12 +1,18 @@
 """
 Minimum Spanning Tree algorithms.
 
-This module provides Python wrappers for C++ MST algorithms, including
-Kruskal's algorithm.
+This module provides Python wrappers for C++ MST algorithms: Kruskal's
+algorithm, Prim's algorithm on an indexed heap, a parallel Boruvka's
+algorithm, and MinimumSpanningForest for disconnected graphs, returned as
+edge arrays or as a Graph.
+
+Every algorithm accepts either a Graph or a FrozenGraph; a Graph is
+processed through its CSR snapshot.
 """
 import os
+import array
 import ctypes
-from DataStructures import Graph
+from DataStructures import Graph, FrozenGraph
 
 # Load the library
 lib = ctypes.CDLL(os.path.join(os.path.dirname(__file__), "../Build/algos.so"))
@@ -15,20 +21,41 @@ lib = ctypes.CDLL(os.path.join(os.path.dirname(__file__), "../Build/algos.so"))
 lib.Kruskal.argtypes = [ctypes.c_void_p]
 lib.Kruskal.restype = ctypes.c_void_p
 
+lib.Kruskal_FrozenGraph.argtypes = [ctypes.c_void_p]
+lib.Kruskal_FrozenGraph.restype = ctypes.c_void_p
+
+_FOREST_ARGTYPES = [ctypes.c_void_p, ctypes.POINTER(ctypes.c_int), ctypes.POINTER(ctypes.c_int), ctypes.POINTER(ctypes.c_double),
+                    ctypes.POINTER(ctypes.c_double), ctypes.POINTER(ctypes.c_int)]
+
+lib.MinimumSpanningForest.argtypes = _FOREST_ARGTYPES
+lib.MinimumSpanningForest.restype = ctypes.c_int
+
+lib.MinimumSpanningForest_FrozenGraph.argtypes = _FOREST_ARGTYPES
+lib.MinimumSpanningForest_FrozenGraph.restype = ctypes.c_int
+
+lib.Boruvka.argtypes = [ctypes.c_void_p, ctypes.c_int]
+lib.Boruvka.restype = ctypes.c_void_p
+
+lib.Boruvka_FrozenGraph.argtypes = [ctypes.c_void_p, ctypes.c_int]
+lib.Boruvka_FrozenGraph.restype = ctypes.c_void_p
+
 lib.Prim.argtypes = [ctypes.c_void_p]
 lib.Prim.restype = ctypes.c_void_p
 
+lib.Prim_FrozenGraph.argtypes = [ctypes.c_void_p]
+lib.Prim_FrozenGraph.restype = ctypes.c_void_p
+
 class MinimumSpanningTree:
     """A collection of Minimum Spanning Tree algorithms."""
 
     @staticmethod
-    def Kruskal(graph: Graph) -> Graph | None:
+    def Kruskal(graph: Graph | FrozenGraph) -> Graph | None:
         """
         Find a Minimum Spanning Tree using Kruskal's algorithm.
 
         Parameters
         ----------
-        graph : Graph
+        graph : Graph or FrozenGraph
             The input graph.
 
         Returns
@@ -38,22 +65,27 @@ class MinimumSpanningTree:
 
         Notes
         -----
-        - Time complexity: Best: O(E + alpha(V)) when the edges are already sorted, Average: O(E log V)
+        - Time complexity: O(E log E) for the in-place sort of a compact (weight, u, v) edge array,
+          then near-linear union-find with path halving
+        - Equal weights are taken in edge insertion order
         """
         if not graph:
             return None
         
-        mst_ptr = lib.Kruskal(graph.ptr)
+        if isinstance(graph, FrozenGraph):
+            mst_ptr = lib.Kruskal_FrozenGraph(graph.ptr)
+        else:
+            mst_ptr = lib.Kruskal(graph.ptr)
         return Graph(ptr=mst_ptr) if mst_ptr else None
 
     @staticmethod
-    def Prim(graph: Graph) -> Graph | None:
+    def Prim(graph: Graph | FrozenGraph) -> Graph | None:
         """
         Find a Minimum Spanning Tree using Prim's algorithm.
 
         Parameters
         ----------
-        graph : Graph
+        graph : Graph or FrozenGraph
             The input graph.
 
         Returns
@@ -63,10 +95,105 @@ class MinimumSpanningTree:
 
         Notes
         -----
-        - Time complexity: Best: O(E log V)
+        - Time complexity: O(E log V), with an indexed binary heap of at most V vertices
+        - A Graph is processed through its cached CSR snapshot
         """
         if not graph:
             return None
 
-        mst_ptr = lib.Prim(graph.ptr)
-        return Graph(ptr=mst_ptr) if mst_ptr else None
\ No newline at end of file
+        if isinstance(graph, FrozenGraph):
+            mst_ptr = lib.Prim_FrozenGraph(graph.ptr)
+        else:
+            mst_ptr = lib.Prim(graph.ptr)
+        return Graph(ptr=mst_ptr) if mst_ptr else None
+
+    @staticmethod
+    def Boruvka(graph: Graph | FrozenGraph, threads: int | None = None) -> Graph | None:
+        """
+        Find a Minimum Spanning Tree using a parallel Boruvka's algorithm.
+
+        Parameters
+        ----------
+        graph : Graph or FrozenGraph
+            The input graph.
+        threads : int, optional
+            Number of native threads. Defaults to one per hardware core; small
+            graphs run on fewer.
+
+        Returns
+        -------
+        Graph
+            The Minimum Spanning Tree, with the same edges in the same order as
+            Kruskal returns.
+
+        Notes
+        -----
+        - Time complexity: O(E log V) work over at most log V rounds, each split across the threads
+        - Ties between equal weights are broken by edge insertion order, like Kruskal
+        - The GIL is released for the whole native call
+        """
+        if threads is not None and threads < 1:
+            raise ValueError("threads must be a positive integer")
+        if not graph:
+            return None
+
+        native_threads = threads or 0
+        if isinstance(graph, FrozenGraph):
+            mst_ptr = lib.Boruvka_FrozenGraph(graph.ptr, native_threads)
+        else:
+            mst_ptr = lib.Boruvka(graph.ptr, native_threads)
+        return Graph(ptr=mst_ptr) if mst_ptr else None
+
+    @staticmethod
+    def MinimumSpanningForest(graph: Graph | FrozenGraph, output: str = "edges") -> tuple | None:
+        """
+        Find a minimum spanning forest: a minimum spanning tree of every connected component.
+
+        Parameters
+        ----------
+        graph : Graph or FrozenGraph
+            The input graph, which may be disconnected.
+        output : {"edges", "graph"}
+            Return the forest as compact edge arrays, or as a new Graph.
+
+        Returns
+        -------
+        tuple
+            With output="edges", (src, dst, weights, component_weights): int32
+            arrays of edge endpoints, a float64 array of their weights, and the
+            float64 weight of each component's tree. With output="graph",
+            (forest, component_weights) with forest a Graph holding every vertex.
+            Components are numbered in order of their first vertex, like
+            Graph.WeaklyConnectedComponents. None for a directed graph.
+
+        Notes
+        -----
+        - Time complexity: O(E log E), Kruskal's algorithm with no connectivity precheck
+        """
+        if output not in ("edges", "graph"):
+            raise ValueError(f"Unknown output {output!r}, expected 'edges' or 'graph'")
+        if not graph:
+            return None
+
+        size = graph.GetSize()
+        src = array.array("i", bytes(4 * size))
+        dst = array.array("i", bytes(4 * size))
+        weights = array.array("d", bytes(8 * size))
+        component_weights = array.array("d", bytes(8 * size))
+        components = ctypes.c_int()
+        c_arrays = [(ctypes.c_int * size).from_buffer(src), (ctypes.c_int * size).from_buffer(dst),
+                    (ctypes.c_double * size).from_buffer(weights), (ctypes.c_double * size).from_buffer(component_weights)]
+
+        forest = lib.MinimumSpanningForest_FrozenGraph if isinstance(graph, FrozenGraph) else lib.MinimumSpanningForest
+        count = forest(graph.ptr, *c_arrays, ctypes.byref(components))
+        del c_arrays
+        if count == -1:
+            return None
+        for buffer in (src, dst, weights):
+            del buffer[count:]
+        del component_weights[components.value:]
+
+        if output == "graph":
+            result, _ = Graph.FromEdges(src, dst, weights, vertices=graph.GetIds())
+            return result, component_weights
+        return src, dst, weights, component_weights
\ No newline at end of file
@@ -2,143 +2,1008 @@
 Sort algorithms operations.
 
 This module provides Python wrappers for C++ sort operations including
-insertion sort, merge sort, quick sort, and counting sort.
+insertion sort, merge sort, quick sort, counting sort and radix sort, plus
+argsort and sort-by-key variants of each of them.
+
+Every sort accepts either a list or any writable buffer of int32, int64,
+uint32, float32 or float64 elements, and dispatches to the C++ entry point
+matching the buffer's format code. Buffers are handed to the C++ library
+directly, so passing inplace=True sorts them without a single Python-level
+copy. NaN values are ordered after every other value.
 """
 import os
 import ctypes
+import itertools
+import tempfile
+from collections.abc import Iterable, Iterator
+from DataStructures_py.Utils import C_INT_MAX, C_INT_MIN, C_LONG_LONG_MAX, C_LONG_LONG_MIN, NATIVE_PREFIXES
 
 # Load the library
 lib = ctypes.CDLL(os.path.join(os.path.dirname(__file__), "../Build/algos.so"))
 
 # --- C Library Signatures ---
-lib.Insertion.argtypes = [ctypes.POINTER(ctypes.c_int), ctypes.c_int]
-lib.Insertion.restype = None
+# Progress callback of SortFile: (elements processed, total work)
+_PROGRESS_CALLBACK = ctypes.CFUNCTYPE(None, ctypes.c_longlong, ctypes.c_longlong)
+
+lib.Sort_int32.argtypes = [ctypes.POINTER(ctypes.c_int), ctypes.c_int, ctypes.c_int, ctypes.POINTER(ctypes.c_int)]
+lib.Sort_int32.restype = ctypes.c_bool
+
+lib.ParallelSort_int32.argtypes = [ctypes.POINTER(ctypes.c_int), ctypes.c_int, ctypes.c_int, ctypes.c_int, ctypes.c_int, ctypes.POINTER(ctypes.c_int)]
+lib.ParallelSort_int32.restype = ctypes.c_bool
+
+lib.Select_int32.argtypes = [ctypes.POINTER(ctypes.c_int), ctypes.c_int, ctypes.c_int]
+lib.Select_int32.restype = ctypes.c_bool
+
+lib.PartialSort_int32.argtypes = [ctypes.POINTER(ctypes.c_int), ctypes.c_int, ctypes.c_int]
+lib.PartialSort_int32.restype = ctypes.c_bool
+
+lib.TopK_int32.argtypes = [ctypes.POINTER(ctypes.c_int), ctypes.c_int, ctypes.c_int, ctypes.c_bool, ctypes.POINTER(ctypes.c_int)]
+lib.TopK_int32.restype = ctypes.c_bool
+
+lib.SortFile_int32.argtypes = [ctypes.c_char_p, ctypes.c_char_p, ctypes.c_longlong, ctypes.c_char_p, ctypes.c_int, _PROGRESS_CALLBACK]
+lib.SortFile_int32.restype = ctypes.c_bool
+
+lib.ArgSort_int32.argtypes = [ctypes.POINTER(ctypes.c_int), ctypes.POINTER(ctypes.c_int), ctypes.c_int, ctypes.c_int]
+lib.ArgSort_int32.restype = ctypes.c_bool
+
+lib.SortByKey_int32.argtypes = [ctypes.POINTER(ctypes.c_int), ctypes.c_void_p, ctypes.c_int, ctypes.c_int, ctypes.c_int]
+lib.SortByKey_int32.restype = ctypes.c_bool
+
+lib.Sort_int64.argtypes = [ctypes.POINTER(ctypes.c_longlong), ctypes.c_int, ctypes.c_int, ctypes.POINTER(ctypes.c_longlong)]
+lib.Sort_int64.restype = ctypes.c_bool
+
+lib.ParallelSort_int64.argtypes = [ctypes.POINTER(ctypes.c_longlong), ctypes.c_int, ctypes.c_int, ctypes.c_int, ctypes.c_int, ctypes.POINTER(ctypes.c_longlong)]
+lib.ParallelSort_int64.restype = ctypes.c_bool
+
+lib.Select_int64.argtypes = [ctypes.POINTER(ctypes.c_longlong), ctypes.c_int, ctypes.c_int]
+lib.Select_int64.restype = ctypes.c_bool
+
+lib.PartialSort_int64.argtypes = [ctypes.POINTER(ctypes.c_longlong), ctypes.c_int, ctypes.c_int]
+lib.PartialSort_int64.restype = ctypes.c_bool
+
+lib.TopK_int64.argtypes = [ctypes.POINTER(ctypes.c_longlong), ctypes.c_int, ctypes.c_int, ctypes.c_bool, ctypes.POINTER(ctypes.c_longlong)]
+lib.TopK_int64.restype = ctypes.c_bool
+
+lib.SortFile_int64.argtypes = [ctypes.c_char_p, ctypes.c_char_p, ctypes.c_longlong, ctypes.c_char_p, ctypes.c_int, _PROGRESS_CALLBACK]
+lib.SortFile_int64.restype = ctypes.c_bool
+
+lib.ArgSort_int64.argtypes = [ctypes.POINTER(ctypes.c_longlong), ctypes.POINTER(ctypes.c_int), ctypes.c_int, ctypes.c_int]
+lib.ArgSort_int64.restype = ctypes.c_bool
+
+lib.SortByKey_int64.argtypes = [ctypes.POINTER(ctypes.c_longlong), ctypes.c_void_p, ctypes.c_int, ctypes.c_int, ctypes.c_int]
+lib.SortByKey_int64.restype = ctypes.c_bool
+
+lib.Sort_uint32.argtypes = [ctypes.POINTER(ctypes.c_uint32), ctypes.c_int, ctypes.c_int, ctypes.POINTER(ctypes.c_uint32)]
+lib.Sort_uint32.restype = ctypes.c_bool
+
+lib.ParallelSort_uint32.argtypes = [ctypes.POINTER(ctypes.c_uint32), ctypes.c_int, ctypes.c_int, ctypes.c_int, ctypes.c_int, ctypes.POINTER(ctypes.c_uint32)]
+lib.ParallelSort_uint32.restype = ctypes.c_bool
+
+lib.Select_uint32.argtypes = [ctypes.POINTER(ctypes.c_uint32), ctypes.c_int, ctypes.c_int]
+lib.Select_uint32.restype = ctypes.c_bool
+
+lib.PartialSort_uint32.argtypes = [ctypes.POINTER(ctypes.c_uint32), ctypes.c_int, ctypes.c_int]
+lib.PartialSort_uint32.restype = ctypes.c_bool
+
+lib.TopK_uint32.argtypes = [ctypes.POINTER(ctypes.c_uint32), ctypes.c_int, ctypes.c_int, ctypes.c_bool, ctypes.POINTER(ctypes.c_uint32)]
+lib.TopK_uint32.restype = ctypes.c_bool
+
+lib.SortFile_uint32.argtypes = [ctypes.c_char_p, ctypes.c_char_p, ctypes.c_longlong, ctypes.c_char_p, ctypes.c_int, _PROGRESS_CALLBACK]
+lib.SortFile_uint32.restype = ctypes.c_bool
+
+lib.ArgSort_uint32.argtypes = [ctypes.POINTER(ctypes.c_uint32), ctypes.POINTER(ctypes.c_int), ctypes.c_int, ctypes.c_int]
+lib.ArgSort_uint32.restype = ctypes.c_bool
+
+lib.SortByKey_uint32.argtypes = [ctypes.POINTER(ctypes.c_uint32), ctypes.c_void_p, ctypes.c_int, ctypes.c_int, ctypes.c_int]
+lib.SortByKey_uint32.restype = ctypes.c_bool
+
+lib.Sort_float32.argtypes = [ctypes.POINTER(ctypes.c_float), ctypes.c_int, ctypes.c_int, ctypes.POINTER(ctypes.c_float)]
+lib.Sort_float32.restype = ctypes.c_bool
+
+lib.ParallelSort_float32.argtypes = [ctypes.POINTER(ctypes.c_float), ctypes.c_int, ctypes.c_int, ctypes.c_int, ctypes.c_int, ctypes.POINTER(ctypes.c_float)]
+lib.ParallelSort_float32.restype = ctypes.c_bool
+
+lib.Select_float32.argtypes = [ctypes.POINTER(ctypes.c_float), ctypes.c_int, ctypes.c_int]
+lib.Select_float32.restype = ctypes.c_bool
+
+lib.PartialSort_float32.argtypes = [ctypes.POINTER(ctypes.c_float), ctypes.c_int, ctypes.c_int]
+lib.PartialSort_float32.restype = ctypes.c_bool
+
+lib.TopK_float32.argtypes = [ctypes.POINTER(ctypes.c_float), ctypes.c_int, ctypes.c_int, ctypes.c_bool, ctypes.POINTER(ctypes.c_float)]
+lib.TopK_float32.restype = ctypes.c_bool
+
+lib.SortFile_float32.argtypes = [ctypes.c_char_p, ctypes.c_char_p, ctypes.c_longlong, ctypes.c_char_p, ctypes.c_int, _PROGRESS_CALLBACK]
+lib.SortFile_float32.restype = ctypes.c_bool
+
+lib.ArgSort_float32.argtypes = [ctypes.POINTER(ctypes.c_float), ctypes.POINTER(ctypes.c_int), ctypes.c_int, ctypes.c_int]
+lib.ArgSort_float32.restype = ctypes.c_bool
+
+lib.SortByKey_float32.argtypes = [ctypes.POINTER(ctypes.c_float), ctypes.c_void_p, ctypes.c_int, ctypes.c_int, ctypes.c_int]
+lib.SortByKey_float32.restype = ctypes.c_bool
+
+lib.Sort_float64.argtypes = [ctypes.POINTER(ctypes.c_double), ctypes.c_int, ctypes.c_int, ctypes.POINTER(ctypes.c_double)]
+lib.Sort_float64.restype = ctypes.c_bool
+
+lib.ParallelSort_float64.argtypes = [ctypes.POINTER(ctypes.c_double), ctypes.c_int, ctypes.c_int, ctypes.c_int, ctypes.c_int, ctypes.POINTER(ctypes.c_double)]
+lib.ParallelSort_float64.restype = ctypes.c_bool
+
+lib.Select_float64.argtypes = [ctypes.POINTER(ctypes.c_double), ctypes.c_int, ctypes.c_int]
+lib.Select_float64.restype = ctypes.c_bool
+
+lib.PartialSort_float64.argtypes = [ctypes.POINTER(ctypes.c_double), ctypes.c_int, ctypes.c_int]
+lib.PartialSort_float64.restype = ctypes.c_bool
+
+lib.TopK_float64.argtypes = [ctypes.POINTER(ctypes.c_double), ctypes.c_int, ctypes.c_int, ctypes.c_bool, ctypes.POINTER(ctypes.c_double)]
+lib.TopK_float64.restype = ctypes.c_bool
+
+lib.SortFile_float64.argtypes = [ctypes.c_char_p, ctypes.c_char_p, ctypes.c_longlong, ctypes.c_char_p, ctypes.c_int, _PROGRESS_CALLBACK]
+lib.SortFile_float64.restype = ctypes.c_bool
+
+lib.ArgSort_float64.argtypes = [ctypes.POINTER(ctypes.c_double), ctypes.POINTER(ctypes.c_int), ctypes.c_int, ctypes.c_int]
+lib.ArgSort_float64.restype = ctypes.c_bool
+
+lib.SortByKey_float64.argtypes = [ctypes.POINTER(ctypes.c_double), ctypes.c_void_p, ctypes.c_int, ctypes.c_int, ctypes.c_int]
+lib.SortByKey_float64.restype = ctypes.c_bool
+
+lib.KWayMerge_Create_int32.argtypes = [ctypes.c_int]
+lib.KWayMerge_Create_int32.restype = ctypes.c_void_p
+
+lib.KWayMerge_Feed_int32.argtypes = [ctypes.c_void_p, ctypes.c_int, ctypes.POINTER(ctypes.c_int), ctypes.c_int, ctypes.c_bool]
+lib.KWayMerge_Feed_int32.restype = ctypes.c_bool
+
+lib.KWayMerge_Next_int32.argtypes = [ctypes.c_void_p, ctypes.POINTER(ctypes.c_int), ctypes.c_int]
+lib.KWayMerge_Next_int32.restype = ctypes.c_int
+
+lib.KWayMerge_Create_int64.argtypes = [ctypes.c_int]
+lib.KWayMerge_Create_int64.restype = ctypes.c_void_p
+
+lib.KWayMerge_Feed_int64.argtypes = [ctypes.c_void_p, ctypes.c_int, ctypes.POINTER(ctypes.c_longlong), ctypes.c_int, ctypes.c_bool]
+lib.KWayMerge_Feed_int64.restype = ctypes.c_bool
+
+lib.KWayMerge_Next_int64.argtypes = [ctypes.c_void_p, ctypes.POINTER(ctypes.c_longlong), ctypes.c_int]
+lib.KWayMerge_Next_int64.restype = ctypes.c_int
+
+lib.KWayMerge_Create_uint32.argtypes = [ctypes.c_int]
+lib.KWayMerge_Create_uint32.restype = ctypes.c_void_p
+
+lib.KWayMerge_Feed_uint32.argtypes = [ctypes.c_void_p, ctypes.c_int, ctypes.POINTER(ctypes.c_uint32), ctypes.c_int, ctypes.c_bool]
+lib.KWayMerge_Feed_uint32.restype = ctypes.c_bool
+
+lib.KWayMerge_Next_uint32.argtypes = [ctypes.c_void_p, ctypes.POINTER(ctypes.c_uint32), ctypes.c_int]
+lib.KWayMerge_Next_uint32.restype = ctypes.c_int
+
+lib.KWayMerge_Create_float32.argtypes = [ctypes.c_int]
+lib.KWayMerge_Create_float32.restype = ctypes.c_void_p
+
+lib.KWayMerge_Feed_float32.argtypes = [ctypes.c_void_p, ctypes.c_int, ctypes.POINTER(ctypes.c_float), ctypes.c_int, ctypes.c_bool]
+lib.KWayMerge_Feed_float32.restype = ctypes.c_bool
+
+lib.KWayMerge_Next_float32.argtypes = [ctypes.c_void_p, ctypes.POINTER(ctypes.c_float), ctypes.c_int]
+lib.KWayMerge_Next_float32.restype = ctypes.c_int
+
+lib.KWayMerge_Create_float64.argtypes = [ctypes.c_int]
+lib.KWayMerge_Create_float64.restype = ctypes.c_void_p
+
+lib.KWayMerge_Feed_float64.argtypes = [ctypes.c_void_p, ctypes.c_int, ctypes.POINTER(ctypes.c_double), ctypes.c_int, ctypes.c_bool]
+lib.KWayMerge_Feed_float64.restype = ctypes.c_bool
+
+lib.KWayMerge_Next_float64.argtypes = [ctypes.c_void_p, ctypes.POINTER(ctypes.c_double), ctypes.c_int]
+lib.KWayMerge_Next_float64.restype = ctypes.c_int
+
+lib.KWayMerge_Needs.argtypes = [ctypes.c_void_p]
+lib.KWayMerge_Needs.restype = ctypes.c_int
+
+lib.Destroy_KWayMerge.argtypes = [ctypes.c_void_p]
+lib.Destroy_KWayMerge.restype = None
 
-lib.Merge.argtypes = [ctypes.POINTER(ctypes.c_int), ctypes.c_int, ctypes.c_int]
-lib.Merge.restype = None
+# Algorithm codes understood by the C++ sort dispatch
+_ALGORITHMS = {"insertion": 0, "merge": 1, "quick": 2, "lomuto": 3, "counting": 4, "radix": 5}
 
-lib.Quick.argtypes = [ctypes.POINTER(ctypes.c_int), ctypes.c_int, ctypes.c_int]
-lib.Quick.restype = None
+# Element type and typed C++ entry points for each supported buffer typecode
+_C_TYPES = {
+    "i": ctypes.c_int,
+    "q": ctypes.c_longlong,
+    "I": ctypes.c_uint32,
+    "f": ctypes.c_float,
+    "d": ctypes.c_double,
+}
+_SORT = {"i": lib.Sort_int32, "q": lib.Sort_int64, "I": lib.Sort_uint32, "f": lib.Sort_float32, "d": lib.Sort_float64}
+_PARALLEL_SORT = {
+    "i": lib.ParallelSort_int32,
+    "q": lib.ParallelSort_int64,
+    "I": lib.ParallelSort_uint32,
+    "f": lib.ParallelSort_float32,
+    "d": lib.ParallelSort_float64,
+}
+_SELECT = {"i": lib.Select_int32, "q": lib.Select_int64, "I": lib.Select_uint32, "f": lib.Select_float32, "d": lib.Select_float64}
+_PARTIAL_SORT = {
+    "i": lib.PartialSort_int32,
+    "q": lib.PartialSort_int64,
+    "I": lib.PartialSort_uint32,
+    "f": lib.PartialSort_float32,
+    "d": lib.PartialSort_float64,
+}
+_TOP_K = {"i": lib.TopK_int32, "q": lib.TopK_int64, "I": lib.TopK_uint32, "f": lib.TopK_float32, "d": lib.TopK_float64}
+_SORT_FILE = {
+    "i": lib.SortFile_int32,
+    "q": lib.SortFile_int64,
+    "I": lib.SortFile_uint32,
+    "f": lib.SortFile_float32,
+    "d": lib.SortFile_float64,
+}
+_ARGSORT = {"i": lib.ArgSort_int32, "q": lib.ArgSort_int64, "I": lib.ArgSort_uint32, "f": lib.ArgSort_float32, "d": lib.ArgSort_float64}
+_SORT_BY_KEY = {"i": lib.SortByKey_int32, "q": lib.SortByKey_int64, "I": lib.SortByKey_uint32, "f": lib.SortByKey_float32, "d": lib.SortByKey_float64}
+_KWAY_MERGE = {
+    "i": (lib.KWayMerge_Create_int32, lib.KWayMerge_Feed_int32, lib.KWayMerge_Next_int32),
+    "q": (lib.KWayMerge_Create_int64, lib.KWayMerge_Feed_int64, lib.KWayMerge_Next_int64),
+    "I": (lib.KWayMerge_Create_uint32, lib.KWayMerge_Feed_uint32, lib.KWayMerge_Next_uint32),
+    "f": (lib.KWayMerge_Create_float32, lib.KWayMerge_Feed_float32, lib.KWayMerge_Next_float32),
+    "d": (lib.KWayMerge_Create_float64, lib.KWayMerge_Feed_float64, lib.KWayMerge_Next_float64),
+}
 
-lib.Counting.argtypes = [ctypes.POINTER(ctypes.c_int), ctypes.POINTER(ctypes.c_int), ctypes.c_int, ctypes.c_int]
-lib.Counting.restype = None
+def _typecode(array) -> str:
+    """
+    Return the typecode of the C++ entry point able to hold `array` exactly.
+
+    Buffers are dispatched on their format code: 32-bit and 64-bit signed
+    integers, 32-bit unsigned integers, and 32-bit and 64-bit floats are
+    supported, raw bytes are read as 32-bit signed integers, and anything else
+    is rejected rather than truncated. Lists holding a float are sorted as
+    float64, and integer lists as int32 or int64 depending on their range.
+    """
+    if isinstance(array, (list, tuple)):
+        if any(isinstance(x, float) for x in array):
+            return "d"
+        low, high = min(array), max(array)
+        if C_INT_MIN <= low and high <= C_INT_MAX:
+            return "i"
+        if C_LONG_LONG_MIN <= low and high <= C_LONG_LONG_MAX:
+            return "q"
+        raise OverflowError("Sorts supports integers of at most 64 bits")
+
+    view = memoryview(array)
+    fmt = view.format.lstrip(NATIVE_PREFIXES)
+    if fmt in ("B", "b", "c"):
+        return "i"
+    if len(fmt) == 1:
+        if fmt in "bhilqn" and view.itemsize in (4, 8):
+            return "i" if view.itemsize == 4 else "q"
+        if fmt in "BHILQN" and view.itemsize == 4:
+            return "I"
+        if fmt in "fd":
+            return fmt
+    raise TypeError(f"Sorts does not support buffer format '{view.format}'")
+
+def _as_c_array(array, inplace: bool, typecode: str = "i"):
+    """
+    Return a ctypes array of the `typecode` element type holding the data of `array`.
+
+    Writable buffers (array.array, memoryview, bytearray, NumPy arrays) are
+    wrapped without any Python-level copy when `inplace` is set, and copied
+    with a single memcpy otherwise. Lists are converted element by element.
+    """
+    c_type = _C_TYPES[typecode]
+    if isinstance(array, (list, tuple)):
+        if inplace and isinstance(array, tuple):
+            raise TypeError("inplace sorting requires a list or a writable buffer")
+        return (c_type * len(array))(*array)
+
+    view = memoryview(array)
+    if view.ndim != 1 or not view.c_contiguous:
+        raise TypeError("Sorts requires a one-dimensional contiguous buffer")
+    if _typecode(view) != typecode:
+        raise TypeError(f"Expected a buffer of typecode '{typecode}', got buffer format '{view.format}'")
+    if view.format in ("B", "b", "c"):
+        if view.nbytes % ctypes.sizeof(c_type):
+            raise TypeError("Raw byte buffers must hold a whole number of 32-bit integers")
+        view = view.cast("B").cast(typecode)
+
+    array_type = c_type * len(view)
+    if inplace:
+        if view.readonly:
+            raise TypeError("inplace sorting requires a writable buffer")
+        return array_type.from_buffer(view)
+    return array_type.from_buffer_copy(view)
+
+def _as_payload_array(values, inplace: bool):
+    """
+    Return a ctypes array over `values` for use as a sort payload.
+
+    Payloads are only moved, never compared, so any buffer of 4-byte or
+    8-byte elements is accepted regardless of its format.
+    """
+    if isinstance(values, (list, tuple)):
+        return _as_c_array(values, inplace, _typecode(values))
+
+    view = memoryview(values)
+    if view.ndim != 1 or not view.c_contiguous:
+        raise TypeError("Sorts requires a one-dimensional contiguous buffer")
+    if view.itemsize not in (4, 8):
+        raise TypeError(f"Sort payloads must have 4-byte or 8-byte elements, got buffer format '{view.format}'")
+
+    array_type = (ctypes.c_uint32 if view.itemsize == 4 else ctypes.c_uint64) * len(view)
+    if inplace:
+        if view.readonly:
+            raise TypeError("inplace sorting requires a writable buffer")
+        return array_type.from_buffer(view)
+    return array_type.from_buffer_copy(view)
+
+def _payload_result(values, c_values, inplace: bool):
+    """Return a sorted payload, decoding buffer copies with the caller's own format."""
+    if inplace or isinstance(values, (list, tuple)):
+        return _result(values, c_values, inplace)
+    fmt = memoryview(values).format.lstrip(NATIVE_PREFIXES)
+    return memoryview(c_values).cast("B").cast(fmt).tolist()
+
+def _algorithm_code(algorithm: str) -> int:
+    """Translate an algorithm name into its C++ dispatch code."""
+    if algorithm not in _ALGORITHMS:
+        raise ValueError(f"Unknown sort algorithm '{algorithm}', expected one of {', '.join(_ALGORITHMS)}")
+    return _ALGORITHMS[algorithm]
+
+def _sort(array, algorithm: str, inplace: bool, buffer=None, threads: int = 1, threshold: int = 0):
+    """
+    Sort `array` through the typed C++ entry point matching its element type.
+
+    With threads != 1 the parallel entry point is used; threads <= 0 means one
+    thread per hardware core. ctypes releases the GIL for the whole native call.
+    """
+    if not len(array):
+        return array if inplace else []
+
+    typecode = _typecode(array)
+    c_array = _as_c_array(array, inplace, typecode)
+    c_buffer = None
+    if buffer is not None:
+        c_buffer = _as_c_array(buffer, True, typecode)
+        if len(c_buffer) < len(c_array):
+            raise ValueError("Sort buffer must hold at least len(array) elements")
+
+    if threads != 1:
+        if not _PARALLEL_SORT[typecode](c_array, len(c_array), _ALGORITHMS[algorithm], threads, threshold, c_buffer):
+            return None
+        return _result(array, c_array, inplace)
+
+    if not _SORT[typecode](c_array, len(c_array), _ALGORITHMS[algorithm], c_buffer):
+        return None
+    return _result(array, c_array, inplace)
+
+def _thread_count(parallel: bool, threads: int | None) -> int:
+    """Translate the parallel/threads options into a native thread count (0 = all cores)."""
+    if threads is not None:
+        if threads < 1:
+            raise ValueError("threads must be a positive integer")
+        return threads
+    return 0 if parallel else 1
+
+def _merge_batches(source, batch_size: int):
+    """Yield successive batches of one MergeK input, as lists or buffer slices."""
+    try:
+        view = memoryview(source)
+    except TypeError:
+        iterator = iter(source)
+        while True:
+            batch = list(itertools.islice(iterator, batch_size))
+            if not batch:
+                return
+            yield batch
+    else:
+        if view.ndim != 1 or not view.c_contiguous:
+            raise TypeError("MergeK requires one-dimensional contiguous buffers")
+        if view.format in ("B", "b", "c"):
+            view = view.cast("B").cast("i")
+        for start in range(0, len(view), batch_size):
+            yield view[start:start + batch_size]
+
+def _merge_typecode(inputs, batches) -> str:
+    """
+    Pick the element type of a merge before any value is merged.
+
+    Buffers keep their own type when they all agree. Lists and tuples are
+    scanned whole, while other iterables can only be judged by their first
+    batch; integers are merged as int64, and a float promotes the whole merge
+    to float64.
+    """
+    typecodes = set()
+    for source, batch in zip(inputs, batches):
+        if isinstance(batch, memoryview):
+            typecodes.add(_typecode(batch))
+        elif batch is not None:
+            values = source if isinstance(source, (list, tuple)) else batch
+            typecodes.add("d" if _typecode(values) == "d" else "q")
+    if len(typecodes) == 1:
+        return typecodes.pop()
+    return "d" if typecodes & {"f", "d"} else "q"
+
+# Value ranges of the integer merge types
+_INT_RANGES = {
+    "i": (C_INT_MIN, C_INT_MAX),
+    "q": (C_LONG_LONG_MIN, C_LONG_LONG_MAX),
+    "I": (0, 2 ** 32 - 1),
+}
+
+def _check_merge_batch(batch, typecode: str):
+    """Reject a batch that the merge type cannot hold exactly, instead of letting ctypes wrap it."""
+    if typecode in ("f", "d"):
+        return
+    values = batch.tolist() if isinstance(batch, memoryview) else batch
+    if any(isinstance(x, float) for x in values):
+        raise TypeError("MergeK found a float in a merge typed as integers; "
+                        "pass dtype='d' for iterables whose first batch holds only integers")
+    low, high = _INT_RANGES[typecode]
+    if values and (min(values) < low or max(values) > high):
+        raise OverflowError(f"MergeK values do not fit dtype '{typecode}'")
+
+def _k_way_merge(sources, batches, typecode: str, batch_size: int):
+    """Drive a native k-way merger, feeding whichever input it asks for next."""
+    create, feed, next_values = _KWAY_MERGE[typecode]
+    c_type = _C_TYPES[typecode]
+    out = (c_type * batch_size)()
+    merger = create(len(sources))
+    if not merger:
+        raise MemoryError("Could not allocate the k-way merger")
+
+    def feed_source(source, batch):
+        if batch is None:
+            ok = feed(merger, source, None, 0, True)
+        elif isinstance(batch, memoryview) and _typecode(batch) == typecode:
+            ok = feed(merger, source, (c_type * len(batch)).from_buffer_copy(batch), len(batch), False)
+        else:
+            _check_merge_batch(batch, typecode)
+            ok = feed(merger, source, (c_type * len(batch))(*batch), len(batch), False)
+        if not ok:
+            raise MemoryError("Could not buffer the next batch of the k-way merge")
+
+    try:
+        for source, batch in enumerate(batches):
+            feed_source(source, batch)
+        while True:
+            count = next_values(merger, out, batch_size)
+            yield from out[:count]
+            source = lib.KWayMerge_Needs(merger)
+            if source != -1:
+                feed_source(source, next(sources[source], None))
+            elif count < batch_size:
+                return
+    finally:
+        lib.Destroy_KWayMerge(merger)
+
+def _result(array, c_array, inplace: bool):
+    """Return the sorted data either as a new list or as the caller's own object."""
+    if not inplace:
+        return list(c_array)
+    if isinstance(array, list):
+        array[:] = c_array
+    return array
 
 class Sorts:
     """A collection of sorting algorithms wrapped from C++."""
 
+    # Inputs shorter than this are sorted serially even when parallel sorting is requested
+    PARALLEL_THRESHOLD = 1 << 16
+
+    # Default memory budget of SortFile, in bytes
+    SORT_FILE_MEMORY_LIMIT = 256 << 20
+
     @staticmethod
-    def InsertionSort(array: list[int]) -> list[int]:
+    def InsertionSort(array: list[int], inplace: bool = False) -> list[int]:
         """
         Sort an array using the insertion sort algorithm.
 
         Parameters
         ----------
-        array : list[int]
-            List of integers to sort.
+        array : list[int] or writable buffer
+            List of numbers, or a buffer of int32, int64, uint32, float32 or float64
+            elements (array.array, memoryview, bytearray, NumPy array).
+        inplace : bool, optional
+            If True, sort the input in place and return the same object
+            instead of a new list. Buffers are then sorted without any copy.
 
         Returns
         -------
         list[int]
-            A new sorted list (original list is not modified).
+            A new sorted list (original list is not modified), or the input
+            object itself when `inplace` is True.
 
         Notes
         -----
         - Time complexity: Best: O(n), Average: O(n^2), Worst: O(n^2)
         - Space complexity: O(1) auxiliary space
         """
-        if not array:
-            return []
-        c_array = (ctypes.c_int * len(array))(*array)
-        lib.Insertion(c_array, len(array))
-        return list(c_array)
+        return _sort(array, "insertion", inplace)
 
     @staticmethod
-    def MergeSort(array: list[int]) -> list[int]:
+    def MergeSort(array: list[int], inplace: bool = False, buffer=None,
+                  parallel: bool = False, threads: int | None = None) -> list[int]:
         """
         Sort an array using the merge sort algorithm.
 
+        Runs an iterative, bottom-up natural merge sort: existing ascending and
+        strictly descending runs are detected (short ones are extended to 32
+        elements with insertion sort) and then merged pairwise. Merges whose
+        runs are already in order are skipped, so sorted input costs O(n).
+
         Parameters
         ----------
-        array : list[int]
-            List of integers to sort.
+        array : list[int] or writable buffer
+            List of numbers, or a buffer of int32, int64, uint32, float32 or float64
+            elements (array.array, memoryview, bytearray, NumPy array).
+        inplace : bool, optional
+            If True, sort the input in place and return the same object
+            instead of a new list. Buffers are then sorted without any copy.
+        buffer : writable buffer, optional
+            Scratch space of at least len(array) elements of the same type as
+            `array`, used by both the serial and the parallel sort. When given,
+            the serial sort performs no allocation at all, and the parallel
+            sort allocates nothing but its threads, so the same buffer can be
+            reused across calls.
+        parallel : bool, optional
+            If True, sort chunks of the input concurrently on native threads, one
+            per core, and combine them with a parallel stable merge. Inputs
+            shorter than Sorts.PARALLEL_THRESHOLD are sorted serially.
+        threads : int, optional
+            Number of threads to use. Setting it implies `parallel`.
 
         Returns
         -------
         list[int]
-            A new sorted list (original list is not modified).
+            A new sorted list (original list is not modified), or the input
+            object itself when `inplace` is True.
 
         Notes
         -----
-        - Time complexity: O(n log n)
-        - Space complexity: O(n) auxiliary space
+        - Time complexity: Best: O(n) on already sorted input, Average: O(n log n), Worst: O(n log n)
+        - Space complexity: O(n) auxiliary space, allocated once per call unless `buffer` is given
+        - Stable
         """
-        if not array:
-            return []
-        c_array = (ctypes.c_int * len(array))(*array)
-        lib.Merge(c_array, 0, len(array) - 1)
-        return list(c_array)
+        return _sort(array, "merge", inplace, buffer, _thread_count(parallel, threads), Sorts.PARALLEL_THRESHOLD)
 
     @staticmethod
-    def QuickSort(array: list[int]) -> list[int]:
+    def QuickSort(array: list[int], inplace: bool = False,
+                  parallel: bool = False, threads: int | None = None) -> list[int]:
         """
         Sort an array using the quick sort algorithm.
+
+        Runs an introsort: ninther (median of medians of three) pivot selection,
+        three-way partitioning so runs of equal keys are handled in one pass,
+        insertion sort for ranges of at most 16 elements and a heap sort
+        fallback once the recursion depth exceeds 2 * log2(n).
         
         Parameters
         ----------
-        array : list[int]
-            List of integers to sort.
+        array : list[int] or writable buffer
+            List of numbers, or a buffer of int32, int64, uint32, float32 or float64
+            elements (array.array, memoryview, bytearray, NumPy array).
+        inplace : bool, optional
+            If True, sort the input in place and return the same object
+            instead of a new list. Buffers are then sorted without any copy.
+        parallel : bool, optional
+            If True, introsort chunks of the input concurrently on native threads,
+            one per core, and combine them with a parallel merge. Inputs shorter
+            than Sorts.PARALLEL_THRESHOLD are sorted serially.
+        threads : int, optional
+            Number of threads to use. Setting it implies `parallel`.
             
         Returns
         -------
         list[int]
-            A new sorted list (original list is not modified).
+            A new sorted list (original list is not modified), or the input
+            object itself when `inplace` is True.
+            
+        Notes
+        -----
+        - Time complexity: Best: O(n) when all keys are equal, Average: O(n log n), Worst: O(n log n)
+        - Space complexity: O(log n) auxiliary space for the recursion stack, O(n) when parallel
+        - Not stable
+        """
+        return _sort(array, "quick", inplace, None, _thread_count(parallel, threads), Sorts.PARALLEL_THRESHOLD)
+
+    @staticmethod
+    def LomutoQuickSort(array: list[int], inplace: bool = False) -> list[int]:
+        """
+        Sort an array using the textbook quick sort algorithm.
+
+        Lomuto partitioning around the last element. Kept for reference and
+        teaching; prefer QuickSort, which does not degrade on sorted input.
+        
+        Parameters
+        ----------
+        array : list[int] or writable buffer
+            List of numbers, or a buffer of int32, int64, uint32, float32 or float64
+            elements (array.array, memoryview, bytearray, NumPy array).
+        inplace : bool, optional
+            If True, sort the input in place and return the same object
+            instead of a new list. Buffers are then sorted without any copy.
+            
+        Returns
+        -------
+        list[int]
+            A new sorted list (original list is not modified), or the input
+            object itself when `inplace` is True.
             
         Notes
         -----
         - Time complexity: Best: O(n log n), Average: O(n log n), Worst: O(n^2)
         - Space complexity: O(log n) auxiliary space for recursion stack in best/average case, O(n) auxiliary space in worst case
         """
-        if not array:
-            return []
-        c_array = (ctypes.c_int * len(array))(*array)
-        lib.Quick(c_array, 0, len(array) - 1)
-        return list(c_array)
+        return _sort(array, "lomuto", inplace)
 
     @staticmethod
-    def CountingSort(array: list[int]) -> list[int] | None:
+    def CountingSort(array: list[int], inplace: bool = False) -> list[int] | None:
         """
         Sort an array using the counting sort algorithm.
         
         Parameters
         ----------
-        array : list[int]
-            List of non-negative integers to sort.
+        array : list[int] or writable buffer
+            List of integers, or a buffer of int32, int64 or uint32 elements
+            (array.array, memoryview, bytearray, NumPy array).
+        inplace : bool, optional
+            If True, write the sorted values back into the input and return the
+            same object instead of a new list.
             
         Returns
         -------
         list[int]
-            A new sorted list (original list is not modified), or None if input contains negative numbers.
+            A new sorted list (original list is not modified), or the input object
+            itself when `inplace` is True. None if the range of values is too large
+            or the values are floating point.
             
         Notes
         -----
-        - Time complexity: O(n + k) where n is the number of elements and k is the range of input
-        - Space complexity: O(k) auxiliary space where k is the range of input values
-        - Counting sort is a non-comparison based sorting algorithm that works only
-            with non-negative integers.
+        - Time complexity: O(n + k) where n is the number of elements and k = max - min + 1
+        - Space complexity: O(n + k) auxiliary space
+        - Counting sort is a non-comparison based sorting algorithm. Counts are offset
+            by the minimum value, so negative numbers are supported and only k buckets
+            are allocated. Ranges above 2^28 values are rejected; use RadixSort instead.
+        """
+        return _sort(array, "counting", inplace)
+
+    @staticmethod
+    def RadixSort(array: list[int], inplace: bool = False) -> list[int]:
+        """
+        Sort an array using the LSD radix sort algorithm.
+
+        Parameters
+        ----------
+        array : list[int] or writable buffer
+            List of numbers, or a buffer of int32, int64, uint32, float32 or float64
+            elements (array.array, memoryview, bytearray, NumPy array).
+        inplace : bool, optional
+            If True, sort the input in place and return the same object
+            instead of a new list. Buffers are then sorted without any copy.
+
+        Returns
+        -------
+        list[int]
+            A new sorted list (original list is not modified), or the input
+            object itself when `inplace` is True.
+
+        Notes
+        -----
+        - Time complexity: O(w * n) where w is the number of bytes per key (4 or 8)
+        - Space complexity: O(n) auxiliary space, independent of the range of values
+        - Negative values are handled by flipping the sign bit of each key (every
+            bit for negative floats), and byte positions shared by every key are skipped
+        - Stable
+        """
+        return _sort(array, "radix", inplace)
+
+    @staticmethod
+    def Select(array: list[int], k: int, inplace: bool = False) -> int | float | None:
+        """
+        Find the k-th smallest value of an array (nth_element).
+
+        Parameters
+        ----------
+        array : list[int] or writable buffer
+            List of numbers, or a buffer of int32, int64, uint32, float32 or float64
+            elements (array.array, memoryview, bytearray, NumPy array).
+        k : int
+            Zero-based rank of the value to find; k = len(array) // 2 gives the median.
+        inplace : bool, optional
+            If True, the input is reordered in place so that array[k] holds the
+            result, no greater value precedes it and no smaller value follows it.
+
+        Returns
+        -------
+        int or float
+            The value that would be at index k if the array were sorted, or None
+            if the native selection failed.
+
+        Notes
+        -----
+        - Time complexity: Average: O(n), Worst: O(n log n) through the heap sort fallback
+        - Space complexity: O(1) auxiliary space, O(n) for the copy unless `inplace` is True
+        """
+        if not len(array):
+            raise ValueError("Select requires a non-empty array")
+        typecode = _typecode(array)
+        c_array = _as_c_array(array, inplace, typecode)
+        if not 0 <= k < len(c_array):
+            raise ValueError("Select requires 0 <= k < len(array)")
+        if not _SELECT[typecode](c_array, len(c_array), k):
+            return None
+        if inplace:
+            _result(array, c_array, inplace)
+        return c_array[k]
+
+    @staticmethod
+    def PartialSort(array: list[int], k: int, inplace: bool = False) -> list[int] | None:
+        """
+        Move the k smallest values of an array to its front, in sorted order.
+
+        Parameters
+        ----------
+        array : list[int] or writable buffer
+            List of numbers, or a buffer of int32, int64, uint32, float32 or float64
+            elements (array.array, memoryview, bytearray, NumPy array).
+        k : int
+            Number of leading values to sort. The remaining values follow in an
+            unspecified order.
+        inplace : bool, optional
+            If True, reorder the input in place and return the same object
+            instead of a new list.
+
+        Returns
+        -------
+        list[int]
+            The partially sorted values, or the input object itself when `inplace` is True.
+            None if the native sort failed.
+
+        Notes
+        -----
+        - Time complexity: O(n log k) with a bounded heap for k <= n / 8, O(n + k log k) otherwise
+        - Space complexity: O(1) auxiliary space
         """
-        if not array:
+        if not len(array):
+            if k != 0:
+                raise ValueError("PartialSort requires 0 <= k <= len(array)")
+            return array if inplace else []
+        typecode = _typecode(array)
+        c_array = _as_c_array(array, inplace, typecode)
+        if not 0 <= k <= len(c_array):
+            raise ValueError("PartialSort requires 0 <= k <= len(array)")
+        if not _PARTIAL_SORT[typecode](c_array, len(c_array), k):
+            return None
+        return _result(array, c_array, inplace)
+
+    @staticmethod
+    def TopK(array: list[int], k: int, largest: bool = True) -> list[int] | None:
+        """
+        Return the k largest (or smallest) values of an array, best first.
+
+        Parameters
+        ----------
+        array : list[int] or buffer
+            List of numbers, or a buffer of int32, int64, uint32, float32 or float64
+            elements. The input is never modified.
+        k : int
+            Number of values to return.
+        largest : bool, optional
+            If True (default) return the k largest values in descending order,
+            otherwise the k smallest in ascending order.
+
+        Returns
+        -------
+        list[int]
+            The selected values, or None if the native selection failed. NaNs
+            rank above every other value.
+
+        Notes
+        -----
+        - Time complexity: Average: O(n + k log k)
+        - Space complexity: O(n) for the working copy
+        """
+        if not len(array):
+            if k != 0:
+                raise ValueError("TopK requires 0 <= k <= len(array)")
             return []
+        typecode = _typecode(array)
+        c_array = _as_c_array(array, False, typecode)
+        if not 0 <= k <= len(c_array):
+            raise ValueError("TopK requires 0 <= k <= len(array)")
+        c_out = (_C_TYPES[typecode] * k)()
+        if not _TOP_K[typecode](c_array, len(c_array), k, largest, c_out):
+            return None
+        return list(c_out)
+
+    @staticmethod
+    def MergeK(inputs: Iterable, dtype: str | None = None, batch_size: int = 4096) -> Iterator:
+        """
+        Lazily merge k inputs that are each already sorted.
 
-        max_item = max(array)
-        min_item = min(array)
+        Every input may be a buffer (array.array, memoryview, NumPy array) or
+        any iterable, including a generator. Inputs are pulled in batches of
+        `batch_size` values, and only the input whose batch ran out is read
+        again, so heavily skewed shard sizes cost no extra work and memory
+        stays at O(k * batch_size).
 
-        if min_item < 0:
-            print("CountingSort only works for non-negative integers.")
+        Parameters
+        ----------
+        inputs : iterable
+            The sorted inputs. Inputs that are not sorted in ascending order
+            produce an unspecified order.
+        dtype : str, optional
+            Typecode of the values: "i", "q", "I", "f" or "d". By default buffers
+            keep their own type when they all agree; otherwise integers are
+            merged as int64 and floats as float64. Lists and tuples are scanned
+            whole for floats, but other iterables only through their first
+            batch, so pass dtype="d" when a float may first appear later.
+        batch_size : int, optional
+            Number of values exchanged with the C++ merger per call.
+
+        Returns
+        -------
+        Iterator
+            The merged values in ascending order. Equal values keep the order of
+            their inputs, and NaNs come last.
+
+        Raises
+        ------
+        TypeError
+            If a float appears in a merge typed as integers, such as in a later
+            batch of an iterable input.
+        OverflowError
+            If an integer does not fit the explicit `dtype`.
+
+        Notes
+        -----
+        - Time complexity: O(n log k) through a loser tree
+        - Space complexity: O(k * batch_size)
+        """
+        if dtype is not None and dtype not in _KWAY_MERGE:
+            raise ValueError(f"Unsupported dtype '{dtype}', expected one of {', '.join(_KWAY_MERGE)}")
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+
+        inputs = list(inputs)
+        sources = [_merge_batches(source, batch_size) for source in inputs]
+        batches = [next(source, None) for source in sources]
+        typecode = dtype or _merge_typecode(inputs, batches)
+        return _k_way_merge(sources, batches, typecode, batch_size)
+
+    @staticmethod
+    def SortFile(in_path: str, out_path: str, dtype: str = "i", memory_limit: int | None = None,
+                 progress=None, temp_dir: str | None = None, algorithm: str = "radix") -> bool:
+        """
+        Sort a binary file of fixed-size values that may not fit in memory.
+
+        The input is memory-mapped and cut into runs that fit in `memory_limit`;
+        each run is sorted natively and spilled to a temporary file, then all
+        runs are merged with a k-way heap merge using large buffered reads and
+        writes. Inputs that fit in a single run are sorted without temporary files.
+
+        Parameters
+        ----------
+        in_path : str
+            File of raw values in native byte order.
+        out_path : str
+            File receiving the sorted values. Must not be the same file as `in_path`.
+        dtype : str, optional
+            Typecode of the values: "i" (int32, default), "q" (int64), "I" (uint32),
+            "f" (float32) or "d" (float64).
+        memory_limit : int, optional
+            Memory budget in bytes for run buffers, defaults to Sorts.SORT_FILE_MEMORY_LIMIT.
+        progress : callable, optional
+            Called as progress(done, total) after every run and every merged
+            output block; the work is complete when done == total.
+        temp_dir : str, optional
+            Directory for the temporary runs, defaults to tempfile.gettempdir().
+        algorithm : str, optional
+            Algorithm used to sort each run, "radix" by default.
+
+        Returns
+        -------
+        bool
+            True on success, False if the file could not be sorted.
+
+        Raises
+        ------
+        ValueError
+            If `dtype` is not supported or `out_path` is the same file as `in_path`.
+
+        Notes
+        -----
+        - Time complexity: O(n log k) for the merge of k runs, plus the cost of the run sorts
+        - I/O: every value is read and written twice when more than one run is needed
+        """
+        if dtype not in _SORT_FILE:
+            raise ValueError(f"Unsupported dtype '{dtype}', expected one of {', '.join(_SORT_FILE)}")
+        if os.path.exists(in_path) and os.path.exists(out_path) and os.path.samefile(in_path, out_path):
+            raise ValueError("out_path must not be the same file as in_path")
+        code = _algorithm_code(algorithm)
+        if memory_limit is None:
+            memory_limit = Sorts.SORT_FILE_MEMORY_LIMIT
+        if temp_dir is None:
+            temp_dir = tempfile.gettempdir()
+
+        callback = _PROGRESS_CALLBACK(progress) if progress else _PROGRESS_CALLBACK()
+        return _SORT_FILE[dtype](os.fsencode(in_path), os.fsencode(out_path), memory_limit,
+                                 os.fsencode(temp_dir), code, callback)
+
+    @staticmethod
+    def ArgSort(array: list[int], algorithm: str = "merge", out=None) -> list[int] | None:
+        """
+        Compute the permutation that sorts an array.
+
+        Parameters
+        ----------
+        array : list[int] or buffer
+            List of numbers, or a buffer of int32, int64, uint32, float32 or float64
+            elements. The input is never modified.
+        algorithm : str, optional
+            One of "insertion", "merge", "quick", "lomuto", "counting" or "radix".
+            Defaults to "merge", which is stable, so equal keys keep their order.
+        out : writable buffer, optional
+            Buffer of at least len(array) 32-bit integers receiving the indices.
+            When given it is filled and returned instead of a new list.
+
+        Returns
+        -------
+        list[int]
+            Indices i such that array[i[0]] <= array[i[1]] <= ..., or `out` when given.
+            None if the chosen algorithm cannot sort the input.
+
+        Notes
+        -----
+        - Time and space complexity are those of the chosen algorithm, plus O(n)
+            for the (key, index) pairs sorted natively
+        """
+        code = _algorithm_code(algorithm)
+        if not len(array):
+            return out if out is not None else []
+
+        typecode = _typecode(array)
+        c_keys = _as_c_array(array, False, typecode)
+        if out is not None:
+            c_idx = _as_c_array(out, True)
+            if len(c_idx) < len(c_keys):
+                raise ValueError("ArgSort out buffer must hold at least len(array) elements")
+        else:
+            c_idx = (ctypes.c_int * len(c_keys))()
+
+        if not _ARGSORT[typecode](c_keys, c_idx, len(c_keys), code):
             return None
-        
-        temp_array = [-1 for i in range(len(array))]
-        
-        c_array = (ctypes.c_int * len(array))(*array)
-        c_array_temp = (ctypes.c_int * len(temp_array))(*temp_array)
-        lib.Counting(c_array, c_array_temp, max_item, len(array))
-        return list(c_array_temp)
\ No newline at end of file
+        return out if out is not None else list(c_idx)
+
+    @staticmethod
+    def SortByKey(keys: list[int], values: list, algorithm: str = "merge",
+                  inplace: bool = False) -> tuple[list[int], list] | None:
+        """
+        Sort keys and apply the same permutation to a payload array in one pass.
+
+        Parameters
+        ----------
+        keys : list[int] or writable buffer
+            List of numbers, or a buffer of int32, int64, uint32, float32 or float64
+            elements.
+        values : list[int] or writable buffer
+            Payload of the same length as keys, e.g. row ids. Buffers may hold
+            any 4-byte or 8-byte elements (ints, floats), which are moved verbatim.
+        algorithm : str, optional
+            One of "insertion", "merge", "quick", "lomuto", "counting" or "radix".
+            Defaults to "merge", which is stable, so equal keys keep their order.
+        inplace : bool, optional
+            If True, reorder keys and values in place and return the same objects.
+
+        Returns
+        -------
+        tuple
+            The sorted keys and co-permuted values, as new lists or as the input
+            objects themselves when `inplace` is True. None if the chosen
+            algorithm cannot sort the input.
+        """
+        code = _algorithm_code(algorithm)
+        if len(keys) != len(values):
+            raise ValueError("SortByKey requires keys and values of the same length")
+        if not len(keys):
+            return (keys, values) if inplace else ([], [])
+
+        typecode = _typecode(keys)
+        c_keys = _as_c_array(keys, inplace, typecode)
+        c_values = _as_payload_array(values, inplace)
+
+        if not _SORT_BY_KEY[typecode](c_keys, c_values, ctypes.sizeof(c_values) // len(c_values), len(c_keys), code):
+            return None
+        return _result(keys, c_keys, inplace), _payload_result(values, c_values, inplace)
@@ -1,24 +1,554 @@
 #include "algos.h"
 
 extern "C"{
-    // Insertion Sort
-    void Insertion(int A[], int size){
-        InsertionSort(A, size);
+    // Typed sorts over int32 keys
+    bool Sort_int32(int A[], int size, int algorithm, int buffer[]){
+        try{
+            SortWith(A, size, algorithm, buffer);
+            return true;
+        } catch(const std::exception& e) {
+            std::cerr << "Error: " << e.what() << std::endl;
+            return false;
+        }
+    }
+
+    bool ParallelSort_int32(int A[], int size, int algorithm, int threads, int threshold, int buffer[]){
+        try{
+            ParallelSortWith(A, size, algorithm, threads, threshold, buffer);
+            return true;
+        } catch(const std::exception& e) {
+            std::cerr << "Error: " << e.what() << std::endl;
+            return false;
+        }
+    }
+
+    bool Select_int32(int A[], int size, int k){
+        try{
+            IntroSelect(A, size, k);
+            return true;
+        } catch(const std::exception& e) {
+            std::cerr << "Error: " << e.what() << std::endl;
+            return false;
+        }
+    }
+
+    bool PartialSort_int32(int A[], int size, int k){
+        try{
+            PartialSort(A, size, k);
+            return true;
+        } catch(const std::exception& e) {
+            std::cerr << "Error: " << e.what() << std::endl;
+            return false;
+        }
+    }
+
+    bool TopK_int32(int A[], int size, int k, bool largest, int out[]){
+        try{
+            TopK(A, size, k, largest, out);
+            return true;
+        } catch(const std::exception& e) {
+            std::cerr << "Error: " << e.what() << std::endl;
+            return false;
+        }
+    }
+
+    bool SortFile_int32(const char* inPath, const char* outPath, long long memoryLimit, const char* tempDir, int algorithm, SortProgressCallback progress){
+        try{
+            ExternalSort<int>(inPath, outPath, memoryLimit, tempDir, algorithm, progress);
+            return true;
+        } catch(const std::exception& e) {
+            std::cerr << "Error: " << e.what() << std::endl;
+            return false;
+        }
+    }
+
+    bool ArgSort_int32(int keys[], int idx[], int size, int algorithm){
+        try{
+            ArgSortWith(keys, idx, size, algorithm);
+            return true;
+        } catch(const std::exception& e) {
+            std::cerr << "Error: " << e.what() << std::endl;
+            return false;
+        }
+    }
+
+    // Values are moved as raw 32-bit or 64-bit words
+    bool SortByKey_int32(int keys[], void* values, int width, int size, int algorithm){
+        try{
+            if(width == 8)
+                SortByKeyWith(keys, (uint64_t*)values, size, algorithm);
+            else
+                SortByKeyWith(keys, (uint32_t*)values, size, algorithm);
+            return true;
+        } catch(const std::exception& e) {
+            std::cerr << "Error: " << e.what() << std::endl;
+            return false;
+        }
+    }
+
+    // Typed sorts over int64 keys
+    bool Sort_int64(long long A[], int size, int algorithm, long long buffer[]){
+        try{
+            SortWith(A, size, algorithm, buffer);
+            return true;
+        } catch(const std::exception& e) {
+            std::cerr << "Error: " << e.what() << std::endl;
+            return false;
+        }
+    }
+
+    bool ParallelSort_int64(long long A[], int size, int algorithm, int threads, int threshold, long long buffer[]){
+        try{
+            ParallelSortWith(A, size, algorithm, threads, threshold, buffer);
+            return true;
+        } catch(const std::exception& e) {
+            std::cerr << "Error: " << e.what() << std::endl;
+            return false;
+        }
+    }
+
+    bool Select_int64(long long A[], int size, int k){
+        try{
+            IntroSelect(A, size, k);
+            return true;
+        } catch(const std::exception& e) {
+            std::cerr << "Error: " << e.what() << std::endl;
+            return false;
+        }
+    }
+
+    bool PartialSort_int64(long long A[], int size, int k){
+        try{
+            PartialSort(A, size, k);
+            return true;
+        } catch(const std::exception& e) {
+            std::cerr << "Error: " << e.what() << std::endl;
+            return false;
+        }
+    }
+
+    bool TopK_int64(long long A[], int size, int k, bool largest, long long out[]){
+        try{
+            TopK(A, size, k, largest, out);
+            return true;
+        } catch(const std::exception& e) {
+            std::cerr << "Error: " << e.what() << std::endl;
+            return false;
+        }
     }
-    
-    // Merge Sort
-    void Merge(int A[], int left, int right){
-        MergeSort(A, left, right);
+
+    bool SortFile_int64(const char* inPath, const char* outPath, long long memoryLimit, const char* tempDir, int algorithm, SortProgressCallback progress){
+        try{
+            ExternalSort<long long>(inPath, outPath, memoryLimit, tempDir, algorithm, progress);
+            return true;
+        } catch(const std::exception& e) {
+            std::cerr << "Error: " << e.what() << std::endl;
+            return false;
+        }
     }
 
-    // Quick Sort
-    void Quick(int A[], int left, int right){
-        QuickSort(A, left, right);
+    bool ArgSort_int64(long long keys[], int idx[], int size, int algorithm){
+        try{
+            ArgSortWith(keys, idx, size, algorithm);
+            return true;
+        } catch(const std::exception& e) {
+            std::cerr << "Error: " << e.what() << std::endl;
+            return false;
+        }
     }
 
-    // Counting Sort
-    void Counting(int A[], int B[], int k, int size){
-        CountingSort(A, B, k, size);
+    // Values are moved as raw 32-bit or 64-bit words
+    bool SortByKey_int64(long long keys[], void* values, int width, int size, int algorithm){
+        try{
+            if(width == 8)
+                SortByKeyWith(keys, (uint64_t*)values, size, algorithm);
+            else
+                SortByKeyWith(keys, (uint32_t*)values, size, algorithm);
+            return true;
+        } catch(const std::exception& e) {
+            std::cerr << "Error: " << e.what() << std::endl;
+            return false;
+        }
+    }
+
+    // Typed sorts over uint32 keys
+    bool Sort_uint32(uint32_t A[], int size, int algorithm, uint32_t buffer[]){
+        try{
+            SortWith(A, size, algorithm, buffer);
+            return true;
+        } catch(const std::exception& e) {
+            std::cerr << "Error: " << e.what() << std::endl;
+            return false;
+        }
+    }
+
+    bool ParallelSort_uint32(uint32_t A[], int size, int algorithm, int threads, int threshold, uint32_t buffer[]){
+        try{
+            ParallelSortWith(A, size, algorithm, threads, threshold, buffer);
+            return true;
+        } catch(const std::exception& e) {
+            std::cerr << "Error: " << e.what() << std::endl;
+            return false;
+        }
+    }
+
+    bool Select_uint32(uint32_t A[], int size, int k){
+        try{
+            IntroSelect(A, size, k);
+            return true;
+        } catch(const std::exception& e) {
+            std::cerr << "Error: " << e.what() << std::endl;
+            return false;
+        }
+    }
+
+    bool PartialSort_uint32(uint32_t A[], int size, int k){
+        try{
+            PartialSort(A, size, k);
+            return true;
+        } catch(const std::exception& e) {
+            std::cerr << "Error: " << e.what() << std::endl;
+            return false;
+        }
+    }
+
+    bool TopK_uint32(uint32_t A[], int size, int k, bool largest, uint32_t out[]){
+        try{
+            TopK(A, size, k, largest, out);
+            return true;
+        } catch(const std::exception& e) {
+            std::cerr << "Error: " << e.what() << std::endl;
+            return false;
+        }
+    }
+
+    bool SortFile_uint32(const char* inPath, const char* outPath, long long memoryLimit, const char* tempDir, int algorithm, SortProgressCallback progress){
+        try{
+            ExternalSort<uint32_t>(inPath, outPath, memoryLimit, tempDir, algorithm, progress);
+            return true;
+        } catch(const std::exception& e) {
+            std::cerr << "Error: " << e.what() << std::endl;
+            return false;
+        }
+    }
+
+    bool ArgSort_uint32(uint32_t keys[], int idx[], int size, int algorithm){
+        try{
+            ArgSortWith(keys, idx, size, algorithm);
+            return true;
+        } catch(const std::exception& e) {
+            std::cerr << "Error: " << e.what() << std::endl;
+            return false;
+        }
+    }
+
+    // Values are moved as raw 32-bit or 64-bit words
+    bool SortByKey_uint32(uint32_t keys[], void* values, int width, int size, int algorithm){
+        try{
+            if(width == 8)
+                SortByKeyWith(keys, (uint64_t*)values, size, algorithm);
+            else
+                SortByKeyWith(keys, (uint32_t*)values, size, algorithm);
+            return true;
+        } catch(const std::exception& e) {
+            std::cerr << "Error: " << e.what() << std::endl;
+            return false;
+        }
+    }
+
+    // Typed sorts over float32 keys
+    bool Sort_float32(float A[], int size, int algorithm, float buffer[]){
+        try{
+            SortWith(A, size, algorithm, buffer);
+            return true;
+        } catch(const std::exception& e) {
+            std::cerr << "Error: " << e.what() << std::endl;
+            return false;
+        }
+    }
+
+    bool ParallelSort_float32(float A[], int size, int algorithm, int threads, int threshold, float buffer[]){
+        try{
+            ParallelSortWith(A, size, algorithm, threads, threshold, buffer);
+            return true;
+        } catch(const std::exception& e) {
+            std::cerr << "Error: " << e.what() << std::endl;
+            return false;
+        }
+    }
+
+    bool Select_float32(float A[], int size, int k){
+        try{
+            IntroSelect(A, size, k);
+            return true;
+        } catch(const std::exception& e) {
+            std::cerr << "Error: " << e.what() << std::endl;
+            return false;
+        }
+    }
+
+    bool PartialSort_float32(float A[], int size, int k){
+        try{
+            PartialSort(A, size, k);
+            return true;
+        } catch(const std::exception& e) {
+            std::cerr << "Error: " << e.what() << std::endl;
+            return false;
+        }
+    }
+
+    bool TopK_float32(float A[], int size, int k, bool largest, float out[]){
+        try{
+            TopK(A, size, k, largest, out);
+            return true;
+        } catch(const std::exception& e) {
+            std::cerr << "Error: " << e.what() << std::endl;
+            return false;
+        }
+    }
+
+    bool SortFile_float32(const char* inPath, const char* outPath, long long memoryLimit, const char* tempDir, int algorithm, SortProgressCallback progress){
+        try{
+            ExternalSort<float>(inPath, outPath, memoryLimit, tempDir, algorithm, progress);
+            return true;
+        } catch(const std::exception& e) {
+            std::cerr << "Error: " << e.what() << std::endl;
+            return false;
+        }
+    }
+
+    bool ArgSort_float32(float keys[], int idx[], int size, int algorithm){
+        try{
+            ArgSortWith(keys, idx, size, algorithm);
+            return true;
+        } catch(const std::exception& e) {
+            std::cerr << "Error: " << e.what() << std::endl;
+            return false;
+        }
+    }
+
+    // Values are moved as raw 32-bit or 64-bit words
+    bool SortByKey_float32(float keys[], void* values, int width, int size, int algorithm){
+        try{
+            if(width == 8)
+                SortByKeyWith(keys, (uint64_t*)values, size, algorithm);
+            else
+                SortByKeyWith(keys, (uint32_t*)values, size, algorithm);
+            return true;
+        } catch(const std::exception& e) {
+            std::cerr << "Error: " << e.what() << std::endl;
+            return false;
+        }
+    }
+
+    // Typed sorts over float64 keys
+    bool Sort_float64(double A[], int size, int algorithm, double buffer[]){
+        try{
+            SortWith(A, size, algorithm, buffer);
+            return true;
+        } catch(const std::exception& e) {
+            std::cerr << "Error: " << e.what() << std::endl;
+            return false;
+        }
+    }
+
+    bool ParallelSort_float64(double A[], int size, int algorithm, int threads, int threshold, double buffer[]){
+        try{
+            ParallelSortWith(A, size, algorithm, threads, threshold, buffer);
+            return true;
+        } catch(const std::exception& e) {
+            std::cerr << "Error: " << e.what() << std::endl;
+            return false;
+        }
+    }
+
+    bool Select_float64(double A[], int size, int k){
+        try{
+            IntroSelect(A, size, k);
+            return true;
+        } catch(const std::exception& e) {
+            std::cerr << "Error: " << e.what() << std::endl;
+            return false;
+        }
+    }
+
+    bool PartialSort_float64(double A[], int size, int k){
+        try{
+            PartialSort(A, size, k);
+            return true;
+        } catch(const std::exception& e) {
+            std::cerr << "Error: " << e.what() << std::endl;
+            return false;
+        }
+    }
+
+    bool TopK_float64(double A[], int size, int k, bool largest, double out[]){
+        try{
+            TopK(A, size, k, largest, out);
+            return true;
+        } catch(const std::exception& e) {
+            std::cerr << "Error: " << e.what() << std::endl;
+            return false;
+        }
+    }
+
+    bool SortFile_float64(const char* inPath, const char* outPath, long long memoryLimit, const char* tempDir, int algorithm, SortProgressCallback progress){
+        try{
+            ExternalSort<double>(inPath, outPath, memoryLimit, tempDir, algorithm, progress);
+            return true;
+        } catch(const std::exception& e) {
+            std::cerr << "Error: " << e.what() << std::endl;
+            return false;
+        }
+    }
+
+    bool ArgSort_float64(double keys[], int idx[], int size, int algorithm){
+        try{
+            ArgSortWith(keys, idx, size, algorithm);
+            return true;
+        } catch(const std::exception& e) {
+            std::cerr << "Error: " << e.what() << std::endl;
+            return false;
+        }
+    }
+
+    // Values are moved as raw 32-bit or 64-bit words
+    bool SortByKey_float64(double keys[], void* values, int width, int size, int algorithm){
+        try{
+            if(width == 8)
+                SortByKeyWith(keys, (uint64_t*)values, size, algorithm);
+            else
+                SortByKeyWith(keys, (uint32_t*)values, size, algorithm);
+            return true;
+        } catch(const std::exception& e) {
+            std::cerr << "Error: " << e.what() << std::endl;
+            return false;
+        }
+    }
+
+    // Streaming k-way merge; the handle is created and fed with the typed
+    // functions and queried or destroyed with the untyped ones
+    KWayMergeBase* KWayMerge_Create_int32(int k){
+        try{
+            return new KWayMerge<int>(k);
+        } catch(const std::exception& e) {
+            std::cerr << "Error: " << e.what() << std::endl;
+            return nullptr;
+        }
+    }
+
+    bool KWayMerge_Feed_int32(KWayMergeBase* merger, int source, int values[], int count, bool finished){
+        try{
+            static_cast<KWayMerge<int>*>(merger)->Feed(source, values, count, finished);
+            return true;
+        } catch(const std::exception& e) {
+            std::cerr << "Error: " << e.what() << std::endl;
+            return false;
+        }
+    }
+
+    int KWayMerge_Next_int32(KWayMergeBase* merger, int out[], int capacity){
+        return static_cast<KWayMerge<int>*>(merger)->Next(out, capacity);
+    }
+
+    KWayMergeBase* KWayMerge_Create_int64(int k){
+        try{
+            return new KWayMerge<long long>(k);
+        } catch(const std::exception& e) {
+            std::cerr << "Error: " << e.what() << std::endl;
+            return nullptr;
+        }
+    }
+
+    bool KWayMerge_Feed_int64(KWayMergeBase* merger, int source, long long values[], int count, bool finished){
+        try{
+            static_cast<KWayMerge<long long>*>(merger)->Feed(source, values, count, finished);
+            return true;
+        } catch(const std::exception& e) {
+            std::cerr << "Error: " << e.what() << std::endl;
+            return false;
+        }
+    }
+
+    int KWayMerge_Next_int64(KWayMergeBase* merger, long long out[], int capacity){
+        return static_cast<KWayMerge<long long>*>(merger)->Next(out, capacity);
+    }
+
+    KWayMergeBase* KWayMerge_Create_uint32(int k){
+        try{
+            return new KWayMerge<uint32_t>(k);
+        } catch(const std::exception& e) {
+            std::cerr << "Error: " << e.what() << std::endl;
+            return nullptr;
+        }
+    }
+
+    bool KWayMerge_Feed_uint32(KWayMergeBase* merger, int source, uint32_t values[], int count, bool finished){
+        try{
+            static_cast<KWayMerge<uint32_t>*>(merger)->Feed(source, values, count, finished);
+            return true;
+        } catch(const std::exception& e) {
+            std::cerr << "Error: " << e.what() << std::endl;
+            return false;
+        }
+    }
+
+    int KWayMerge_Next_uint32(KWayMergeBase* merger, uint32_t out[], int capacity){
+        return static_cast<KWayMerge<uint32_t>*>(merger)->Next(out, capacity);
+    }
+
+    KWayMergeBase* KWayMerge_Create_float32(int k){
+        try{
+            return new KWayMerge<float>(k);
+        } catch(const std::exception& e) {
+            std::cerr << "Error: " << e.what() << std::endl;
+            return nullptr;
+        }
+    }
+
+    bool KWayMerge_Feed_float32(KWayMergeBase* merger, int source, float values[], int count, bool finished){
+        try{
+            static_cast<KWayMerge<float>*>(merger)->Feed(source, values, count, finished);
+            return true;
+        } catch(const std::exception& e) {
+            std::cerr << "Error: " << e.what() << std::endl;
+            return false;
+        }
+    }
+
+    int KWayMerge_Next_float32(KWayMergeBase* merger, float out[], int capacity){
+        return static_cast<KWayMerge<float>*>(merger)->Next(out, capacity);
+    }
+
+    KWayMergeBase* KWayMerge_Create_float64(int k){
+        try{
+            return new KWayMerge<double>(k);
+        } catch(const std::exception& e) {
+            std::cerr << "Error: " << e.what() << std::endl;
+            return nullptr;
+        }
+    }
+
+    bool KWayMerge_Feed_float64(KWayMergeBase* merger, int source, double values[], int count, bool finished){
+        try{
+            static_cast<KWayMerge<double>*>(merger)->Feed(source, values, count, finished);
+            return true;
+        } catch(const std::exception& e) {
+            std::cerr << "Error: " << e.what() << std::endl;
+            return false;
+        }
+    }
+
+    int KWayMerge_Next_float64(KWayMergeBase* merger, double out[], int capacity){
+        return static_cast<KWayMerge<double>*>(merger)->Next(out, capacity);
+    }
+
+    int KWayMerge_Needs(KWayMergeBase* merger){
+        return merger->Needs();
+    }
+
+    void Destroy_KWayMerge(KWayMergeBase* merger){
+        delete merger;
     }
 
     // Kruskal's Algorithm
@@ -31,6 +561,43 @@ extern "C"{
         }
     }
 
+    Graph* Kruskal_FrozenGraph(FrozenGraph* g){
+        try{
+            return KruskalMST(g);
+        } catch(const std::invalid_argument& e) {
+            std::cerr << "Error: " << e.what() << std::endl;
+            return nullptr;
+        }
+    }
+
+    // Minimum Spanning Forest
+    // Writes the forest's edges (at most V - 1) as vertex values and the
+    // weight of every component's tree; returns the number of edges, or -1
+    int MinimumSpanningForest_FrozenGraph(FrozenGraph* g, int src[], int dst[], double weights[], double componentWeights[], int* components){
+        try{
+            std::vector<int> s, d, labels;
+            std::vector<double> w, cw;
+            *components = KruskalForest(g, s, d, w, &labels, &cw);
+            std::copy(s.begin(), s.end(), src);
+            std::copy(d.begin(), d.end(), dst);
+            std::copy(w.begin(), w.end(), weights);
+            std::copy(cw.begin(), cw.end(), componentWeights);
+            return s.size();
+        } catch(const std::exception& e) {
+            std::cerr << "Error: " << e.what() << std::endl;
+            return -1;
+        }
+    }
+
+    int MinimumSpanningForest(Graph* g, int src[], int dst[], double weights[], double componentWeights[], int* components){
+        try{
+            return MinimumSpanningForest_FrozenGraph(g->Snapshot(), src, dst, weights, componentWeights, components);
+        } catch(const std::exception& e) {
+            std::cerr << "Error: " << e.what() << std::endl;
+            return -1;
+        }
+    }
+
     // Prim's Algorithm
     Graph* Prim(Graph* g){
         try{
@@ -40,4 +607,102 @@ extern "C"{
             return nullptr;
         }
     }
+
+    Graph* Prim_FrozenGraph(FrozenGraph* g){
+        try{
+            return PrimMST(g);
+        } catch(const std::invalid_argument& e) {
+            std::cerr << "Error: " << e.what() << std::endl;
+            return nullptr;
+        }
+    }
+
+    // Boruvka's Algorithm
+    Graph* Boruvka(Graph* g, int threads){
+        try{
+            return BoruvkaMST(g, threads);
+        } catch(const std::exception& e) {
+            std::cerr << "Error: " << e.what() << std::endl;
+            return nullptr;
+        }
+    }
+
+    Graph* Boruvka_FrozenGraph(FrozenGraph* g, int threads){
+        try{
+            return BoruvkaMST(g, threads);
+        } catch(const std::exception& e) {
+            std::cerr << "Error: " << e.what() << std::endl;
+            return nullptr;
+        }
+    }
+
+    // Dynamic Minimum Spanning Forest
+    DynamicMST* Create_DynamicMST(){
+        return new DynamicMST();
+    }
+
+    DynamicMST* Create_DynamicMST_FrozenGraph(FrozenGraph* g){
+        try{
+            return new DynamicMST(g);
+        } catch(const std::invalid_argument& e) {
+            std::cerr << "Error: " << e.what() << std::endl;
+            return nullptr;
+        }
+    }
+
+    DynamicMST* Create_DynamicMST_Graph(Graph* g){
+        return Create_DynamicMST_FrozenGraph(g->Snapshot());
+    }
+
+    void Destroy_DynamicMST(DynamicMST* m){
+        delete m;
+    }
+
+    void AddVertex_DynamicMST(DynamicMST* m, int v){
+        m->AddVertex(v);
+    }
+
+    // Returns a DynamicMSTChange; removed receives the endpoints of a
+    // replaced edge and removedWeight its weight
+    int AddEdge_DynamicMST(DynamicMST* m, int u, int v, double w, int removed[], double* removedWeight){
+        return m->AddEdge(u, v, w, removed[0], removed[1], *removedWeight);
+    }
+
+    int GetSize_DynamicMST(DynamicMST* m){
+        return m->GetSize();
+    }
+
+    int GetEdgeCount_DynamicMST(DynamicMST* m){
+        return m->GetEdgeCount();
+    }
+
+    double GraphWeight_DynamicMST(DynamicMST* m){
+        return m->GraphWeight();
+    }
+
+    int IsConnected_DynamicMST(DynamicMST* m, int u, int v){
+        try{
+            return m->IsConnected(u, v);
+        } catch(const std::invalid_argument& e) {
+            std::cerr << "Error: " << e.what() << std::endl;
+            return -1;
+        }
+    }
+
+    // Arrays must hold GetEdgeCount_DynamicMST elements
+    void GetEdges_DynamicMST(DynamicMST* m, int src[], int dst[], double weights[]){
+        std::vector<int> s, d;
+        std::vector<double> w;
+        m->GetEdges(s, d, w);
+        std::copy(s.begin(), s.end(), src);
+        std::copy(d.begin(), d.end(), dst);
+        std::copy(w.begin(), w.end(), weights);
+    }
+
+    Graph* ToGraph_DynamicMST(DynamicMST* m){
+        std::vector<int> s, d;
+        std::vector<double> w;
+        m->GetEdges(s, d, w);
+        return SpanningTreeGraph(m->GetIds(), s, d, w);
+    }
 }
\ No newline at end of file
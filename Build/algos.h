@@ -1,7 +1,26 @@
 #include <climits>
+#include <algorithm>
+#include <limits>
+#include <numeric>
+#include <cmath>
+#include <queue>
+#include <cstdio>
+#include <cstdint>
+#include <cstring>
+#include <thread>
+#include <atomic>
+#include <fcntl.h>
+#include <unistd.h>
+#include <sys/mman.h>
+#include <sys/stat.h>
+#include <type_traits>
 
 #include "dataStructures.h"
 
 #include "../Algos_cpp/Sorts.cpp"
+#include "../Algos_cpp/ExternalSort.cpp"
+#include "../Algos_cpp/KWayMerge.cpp"
 #include "../Algos_cpp/Kruskal.cpp"
-#include "../Algos_cpp/Prim.cpp"
\ No newline at end of file
+#include "../Algos_cpp/Prim.cpp"
+#include "../Algos_cpp/Boruvka.cpp"
+#include "../Algos_cpp/DynamicMST.cpp"
\ No newline at end of file
@@ -1,10 +1,21 @@
 using namespace std;
 
 #include <map>
+#include <list>
+#include <memory>
 #include <ctime>
+#include <mutex>
+#include <atomic>
+#include <thread>
+#include <exception>
 #include <tuple>
 #include <vector>
+#include <numeric>
+#include <unordered_map>
 #include <climits>
+#include <limits>
+#include <cstdint>
+#include <algorithm>
 #include <iostream>
 #include <functional>
 
@@ -20,6 +31,10 @@ using namespace std;
 #include "../DataStructures_cpp/PriorityQueue.cpp"
 #include "../DataStructures_cpp/Edge.cpp"
 #include "../DataStructures_cpp/GraphVertex.cpp"
+#include "../DataStructures_cpp/Tasks.cpp"
+#include "../DataStructures_cpp/IndexedPriorityQueue.cpp"
+#include "../DataStructures_cpp/ShortestPathCache.cpp"
+#include "../DataStructures_cpp/FrozenGraph.cpp"
 #include "../DataStructures_cpp/Graph.cpp"
 #include "../DataStructures_cpp/DisjointSetsItem.cpp"
 #include "../DataStructures_cpp/DisjointSets.cpp"
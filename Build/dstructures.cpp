@@ -557,6 +557,31 @@ extern "C" {
         graph->CreateEdge(v, u, weight);
     }
 
+    // Build a graph from edge arrays in one call. rejected receives the input
+    // indices that did not create an edge and summary the number rejected as
+    // [duplicates, self-loops]. With an error policy the graph is discarded,
+    // nullptr is returned and rejected[0] holds the offending index
+    Graph* FromEdges_Graph(const int src[], const int dst[], const double weights[], int count, bool directed,
+                           const int vertices[], int vertexCount, int duplicatePolicy, int selfLoopPolicy,
+                           int rejected[], int summary[]){
+        Graph* graph = new Graph(directed);
+        graph->AddVertices(vertices, vertexCount);
+
+        std::vector<int> indices;
+        int duplicates = 0, selfLoops = 0;
+        try {
+            graph->AddEdges(src, dst, weights, count, duplicatePolicy, selfLoopPolicy, indices, duplicates, selfLoops);
+        } catch (const std::invalid_argument& e) {
+            delete graph;
+            graph = nullptr;
+            indices.assign(1, indices.back());
+        }
+        std::copy(indices.begin(), indices.end(), rejected);
+        summary[0] = duplicates;
+        summary[1] = selfLoops;
+        return graph;
+    }
+
     void DeleteEdge_Graph(Graph* graph, int v, int u){
         graph->DeleteEdge(v, u);
     }
@@ -582,52 +607,14 @@ extern "C" {
         graph->Display();
     }
 
-    struct BFSResult {
-        std::map<int, std::string> colors;
-        std::map<int, int> distances;
-        std::map<int, GraphVertex*> parents;
-    };
-
-    BFSResult* BFS_Graph(Graph* graph, int s){
+    bool BFSArrays_Graph(Graph* graph, int s, int ids[], int distances[], int parents[], unsigned char colors[], bool directionOptimizing){
         try {
-            auto [colors, distances, parents] = graph->BFS(s);
-            BFSResult* res = new BFSResult();
-            res->colors = colors;
-            res->distances = distances;
-            res->parents = parents;
-            return res;
+            graph->BFS(s, ids, distances, parents, colors, directionOptimizing);
+            return true;
         } catch (const std::invalid_argument& e) {
             std::cerr << "Error: " << e.what() << std::endl;
-            return nullptr;
-        }
-    }
-
-    const char* GetBFSColor(BFSResult* res, int vertex){
-        if (res == nullptr) return "";
-        if (res->colors.find(vertex) != res->colors.end()) {
-            return res->colors[vertex].c_str();
+            return false;
         }
-        return "";
-    }
-
-    int GetBFSDistance(BFSResult* res, int vertex){
-        if (res == nullptr) return -1;
-        if (res->distances.find(vertex) != res->distances.end()) {
-            return res->distances[vertex];
-        }
-        return -1;
-    }
-
-    int GetBFSParent(BFSResult* res, int vertex){
-        if (res == nullptr) return -1;
-        if (res->parents.find(vertex) != res->parents.end() && res->parents[vertex] != nullptr) {
-            return res->parents[vertex]->GetData();
-        }
-        return -1;
-    }
-
-    void Destroy_BFSResult(BFSResult* res){
-        delete res;
     }
 
     LinkedList* GetPath_Graph(Graph* graph, int s, int v){
@@ -685,6 +672,269 @@ extern "C" {
         graph->Clear();
     }
 
+    // FrozenGraph
+    FrozenGraph* Freeze_Graph(Graph* graph){
+        return graph->Freeze();
+    }
+
+    // The graph's own cached snapshot; owned by the graph and only valid
+    // until its next mutation
+    FrozenGraph* Snapshot_Graph(Graph* graph){
+        return graph->Snapshot();
+    }
+
+    // Shortest path cache
+    void SetCacheBudget_Graph(Graph* graph, long long bytes){
+        graph->GetCache().SetBudget(bytes > 0 ? bytes : 0);
+    }
+
+    // stats = {hits, misses, entries, bytes, budget}
+    void GetCacheStats_Graph(Graph* graph, long long stats[]){
+        ShortestPathCache& cache = graph->GetCache();
+        stats[0] = cache.GetHits();
+        stats[1] = cache.GetMisses();
+        stats[2] = cache.GetSize();
+        stats[3] = cache.GetBytes();
+        stats[4] = cache.GetBudget();
+    }
+
+    void ResetCacheStats_Graph(Graph* graph){
+        graph->GetCache().ResetStats();
+    }
+
+    void Destroy_FrozenGraph(FrozenGraph* graph){
+        delete graph;
+    }
+
+    bool IsDirected_FrozenGraph(FrozenGraph* graph){
+        return graph->IsDirected();
+    }
+
+    int GetSize_FrozenGraph(FrozenGraph* graph){
+        return graph->GetSize();
+    }
+
+    int GetEdgeCount_FrozenGraph(FrozenGraph* graph){
+        return graph->GetEdgeCount();
+    }
+
+    void GetIds_FrozenGraph(FrozenGraph* graph, int ids[]){
+        std::copy(graph->GetIds().begin(), graph->GetIds().end(), ids);
+    }
+
+    LinkedList* GetNeighbors_FrozenGraph(FrozenGraph* graph, int value){
+        try {
+            return graph->GetNeighbors(value);
+        } catch (const std::invalid_argument& e) {
+            std::cerr << "Error: " << e.what() << std::endl;
+            return nullptr;
+        }
+    }
+
+    LinkedList* GetVertices_FrozenGraph(FrozenGraph* graph){
+        return graph->GetVertices();
+    }
+
+    // Results are written by dense index; parents hold dense indices and
+    // colors may be nullptr
+    bool BFS_FrozenGraph(FrozenGraph* graph, int s, int distances[], int parents[], unsigned char colors[], bool directionOptimizing){
+        int source = graph->IndexOf(s);
+        if(source == -1){
+            std::cerr << "Error: Vertex " << s << " does not exist" << std::endl;
+            return false;
+        }
+        std::vector<int> d, p;
+        graph->BFS(source, d, p, directionOptimizing);
+        std::copy(d.begin(), d.end(), distances);
+        std::copy(p.begin(), p.end(), parents);
+        if(colors)
+            for(size_t i = 0; i < d.size(); i++)
+                colors[i] = d[i] == INT_MAX ? BFS_WHITE : BFS_BLACK;
+        return true;
+    }
+
+    bool MultiSourceBFS_FrozenGraph(FrozenGraph* graph, int sources[], int count, int distances[], int parents[]){
+        try {
+            std::vector<int> d, p;
+            graph->MultiSourceBFS(sources, count, d, p);
+            std::copy(d.begin(), d.end(), distances);
+            std::copy(p.begin(), p.end(), parents);
+            return true;
+        } catch (const std::exception& e) {
+            std::cerr << "Error: " << e.what() << std::endl;
+            return false;
+        }
+    }
+
+    bool Distances_FrozenGraph(FrozenGraph* graph, int sources[], int sourceCount, int targets[], int targetCount, int out[], int threads){
+        try {
+            graph->Distances(sources, sourceCount, targets, targetCount, out, threads);
+            return true;
+        } catch (const std::exception& e) {
+            std::cerr << "Error: " << e.what() << std::endl;
+            return false;
+        }
+    }
+
+    bool AllPairsShortestPaths_FrozenGraph(FrozenGraph* graph, int out[], int threads){
+        try {
+            graph->AllPairsShortestPaths(out, threads);
+            return true;
+        } catch (const std::exception& e) {
+            std::cerr << "Error: " << e.what() << std::endl;
+            return false;
+        }
+    }
+
+    long long AllPairsMemory_FrozenGraph(FrozenGraph* graph, int threads){
+        return graph->AllPairsMemory(threads);
+    }
+
+    // Distances and parents are written by dense index
+    bool Dijkstra_FrozenGraph(FrozenGraph* graph, int s, double distances[], int parents[]){
+        try {
+            int source = graph->IndexOf(s);
+            if(source == -1)
+                throw std::invalid_argument("Vertex " + std::to_string(s) + " does not exist");
+            auto tree = graph->GetShortestPathTree(source, true);
+            std::copy(tree->distances.begin(), tree->distances.end(), distances);
+            std::copy(tree->parents.begin(), tree->parents.end(), parents);
+            return true;
+        } catch (const std::invalid_argument& e) {
+            std::cerr << "Error: " << e.what() << std::endl;
+            return false;
+        }
+    }
+
+    // The path is written as vertex values; returns its length, 0 if there is
+    // no path and -1 on error
+    int ShortestPath_FrozenGraph(FrozenGraph* graph, int s, int t, int mode, int path[], double* distance){
+        try {
+            std::vector<int> p = graph->ShortestPath(s, t, mode, *distance);
+            for(size_t i = 0; i < p.size(); i++)
+                path[i] = graph->GetIds()[p[i]];
+            return p.size();
+        } catch (const std::invalid_argument& e) {
+            std::cerr << "Error: " << e.what() << std::endl;
+            return -1;
+        }
+    }
+
+    int AStar_FrozenGraph(FrozenGraph* graph, int s, int t, ShortestPathHeuristic heuristic, int path[], double* distance){
+        try {
+            int source = graph->IndexOf(s);
+            int target = graph->IndexOf(t);
+            if(source == -1 || target == -1)
+                throw std::invalid_argument("Vertex " + std::to_string(s) + " or " + std::to_string(t) + " does not exist");
+            std::vector<int> p = graph->AStar(source, target, heuristic, *distance);
+            for(size_t i = 0; i < p.size(); i++)
+                path[i] = graph->GetIds()[p[i]];
+            return p.size();
+        } catch (const std::invalid_argument& e) {
+            std::cerr << "Error: " << e.what() << std::endl;
+            return -1;
+        }
+    }
+
+    LinkedList* GetPath_FrozenGraph(FrozenGraph* graph, int s, int v){
+        try {
+            return graph->GetPath(s, v);
+        } catch (const std::exception& e) {
+            std::cerr << "Error: " << e.what() << std::endl;
+            return nullptr;
+        }
+    }
+
+    int Distance_FrozenGraph(FrozenGraph* graph, int s, int t){
+        try {
+            return graph->Distance(s, t);
+        } catch (const std::invalid_argument& e) {
+            std::cerr << "Error: " << e.what() << std::endl;
+            return -1;
+        }
+    }
+
+    LinkedList* GetReachableVertices_FrozenGraph(FrozenGraph* graph, int s){
+        try {
+            return graph->GetReachableVertices(s);
+        } catch (const std::invalid_argument& e) {
+            std::cerr << "Error: " << e.what() << std::endl;
+            return nullptr;
+        }
+    }
+
+    bool IsConnected_FrozenGraph(FrozenGraph* graph){
+        return graph->IsConnected();
+    }
+
+    // Labels are written by dense index; returns the number of components
+    int StronglyConnectedComponents_FrozenGraph(FrozenGraph* graph, int labels[]){
+        std::vector<int> l;
+        int count = graph->StronglyConnectedComponents(l);
+        std::copy(l.begin(), l.end(), labels);
+        return count;
+    }
+
+    int WeaklyConnectedComponents_FrozenGraph(FrozenGraph* graph, int labels[]){
+        std::vector<int> l;
+        int count = graph->WeaklyConnectedComponents(l);
+        std::copy(l.begin(), l.end(), labels);
+        return count;
+    }
+
+    // The order is written as vertex values; returns its length, or -1 if the
+    // graph is undirected or has a cycle
+    int TopologicalSort_FrozenGraph(FrozenGraph* graph, int order[]){
+        try {
+            std::vector<int> o;
+            if(!graph->TopologicalSort(o))
+                throw std::invalid_argument("Graph has a cycle");
+            for(size_t i = 0; i < o.size(); i++)
+                order[i] = graph->GetIds()[o[i]];
+            return o.size();
+        } catch (const std::invalid_argument& e) {
+            std::cerr << "Error: " << e.what() << std::endl;
+            return -1;
+        }
+    }
+
+    bool HasCycle_FrozenGraph(FrozenGraph* graph){
+        return graph->HasCycle();
+    }
+
+    int DAGLongestPath_FrozenGraph(FrozenGraph* graph, bool weighted, int path[], double* length){
+        try {
+            std::vector<int> p = graph->DAGLongestPath(weighted, *length);
+            for(size_t i = 0; i < p.size(); i++)
+                path[i] = graph->GetIds()[p[i]];
+            return p.size();
+        } catch (const std::invalid_argument& e) {
+            std::cerr << "Error: " << e.what() << std::endl;
+            return -1;
+        }
+    }
+
+    FrozenGraph* Condensation_FrozenGraph(FrozenGraph* graph, int labels[]){
+        std::vector<int> l;
+        int count;
+        FrozenGraph* dag = graph->Condensation(l, count);
+        std::copy(l.begin(), l.end(), labels);
+        return dag;
+    }
+
+    double EdgeWeight_FrozenGraph(FrozenGraph* graph, int v, int u){
+        try {
+            return graph->EdgeWeight(v, u);
+        } catch (const std::invalid_argument& e) {
+            std::cerr << "Error: " << e.what() << std::endl;
+            return -1;
+        }
+    }
+
+    double GraphWeight_FrozenGraph(FrozenGraph* graph){
+        return graph->GraphWeight();
+    }
+
     // SetItem
     SetItem* Create_SetItem(int value){
         return new SetItem(value, 0);
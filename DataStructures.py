@@ -9,5 +9,6 @@ from DataStructures_py.SkipListNode import SkipListNode
 from DataStructures_py.SkipList import SkipList
 from DataStructures_py.PriorityQueue import PriorityQueue
 from DataStructures_py.Graph import Graph
+from DataStructures_py.FrozenGraph import FrozenGraph
 from DataStructures_py.DisjointSetsItem import DisjointSetsItem
 from DataStructures_py.DisjointSets import DisjointSets
\ No newline at end of file
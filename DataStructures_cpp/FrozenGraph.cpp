@@ -0,0 +1,843 @@
+// Visited set of the BFS core, one bit per vertex
+class Bitset{
+    private:
+        std::vector<uint64_t> words;
+
+    public:
+        Bitset(int size): words((size + 63) / 64, 0) {}
+
+        bool Test(int i) const{
+            return (words[i >> 6] >> (i & 63)) & 1;
+        }
+
+        void Set(int i){
+            words[i >> 6] |= uint64_t(1) << (i & 63);
+        }
+};
+
+// Direction-optimizing BFS switches to bottom-up steps once the frontier's
+// edges exceed 1/BFS_ALPHA of the edges left to explore, and back to
+// top-down once the frontier holds fewer than 1/BFS_BETA of the vertices
+const int BFS_ALPHA = 14;
+const int BFS_BETA = 24;
+
+// Admissible estimate of the distance from vertex to target, both given as
+// vertex values, for A* searches
+typedef double (*ShortestPathHeuristic)(int vertex, int target);
+
+// Search used by FrozenGraph::ShortestPath
+enum ShortestPathMode{SHORTEST_PATH_BFS, SHORTEST_PATH_DIJKSTRA, SHORTEST_PATH_BIDIRECTIONAL};
+
+// Immutable graph snapshot in compressed sparse row (CSR) form. Vertices are
+// renumbered densely 0..n-1 in insertion order; the neighbors of vertex i are
+// targets[offsets[i] .. offsets[i + 1]) with the matching weights, so every
+// traversal walks contiguous arrays instead of linked list nodes
+class FrozenGraph{
+    private:
+        bool directed;
+        // Dense index -> vertex value, and back
+        std::vector<int> ids;
+        std::unordered_map<int, int> index;
+        std::vector<int> offsets;
+        std::vector<int> targets;
+        std::vector<double> weights;
+        // Edges in their original order, by dense index
+        std::vector<int> edgeFrom;
+        std::vector<int> edgeTo;
+        std::vector<double> edgeWeights;
+        // In-neighbor CSR arrays of a directed graph, built on first use
+        std::vector<int> reverseOffsets;
+        std::vector<int> reverseTargets;
+        std::vector<double> reverseWeights;
+        std::once_flag reverseBuilt;
+        bool negativeWeights;
+        // Shortest path trees of the single-source queries are kept here when
+        // the snapshot belongs to a Graph with caching enabled
+        ShortestPathCache* cache;
+        long long cacheVersion;
+
+        int IndexOrThrow(int value){
+            auto it = index.find(value);
+            if(it == index.end())
+                throw std::invalid_argument("Vertex " + std::to_string(value) + " does not exist");
+            return it->second;
+        }
+
+        void BuildReverse(){
+            int n = ids.size();
+            reverseOffsets.assign(n + 1, 0);
+            for(int t : targets)
+                reverseOffsets[t + 1]++;
+            for(int i = 0; i < n; i++)
+                reverseOffsets[i + 1] += reverseOffsets[i];
+            reverseTargets.resize(targets.size());
+            reverseWeights.resize(targets.size());
+            std::vector<int> next(reverseOffsets.begin(), reverseOffsets.end() - 1);
+            for(int u = 0; u < n; u++){
+                for(int i = offsets[u]; i < offsets[u + 1]; i++){
+                    int slot = next[targets[i]]++;
+                    reverseTargets[slot] = u;
+                    reverseWeights[slot] = weights[i];
+                }
+            }
+        }
+
+        void RequireNonNegativeWeights(){
+            if(negativeWeights)
+                throw std::invalid_argument("Weighted shortest paths require non-negative edge weights");
+        }
+
+        // Dense path from the root of a parents array to t
+        static std::vector<int> TracePath(const std::vector<int>& parents, int t){
+            std::vector<int> path;
+            for(int x = t; x != -1; x = parents[x])
+                path.push_back(x);
+            std::reverse(path.begin(), path.end());
+            return path;
+        }
+
+        std::vector<int> IndicesOrThrow(const int values[], int count){
+            std::vector<int> result(count);
+            for(int i = 0; i < count; i++)
+                result[i] = IndexOrThrow(values[i]);
+            return result;
+        }
+
+        // Run one BFS per entry of sources on up to threads threads (0 = one
+        // per hardware core); visit(i, distances) is called with the distances
+        // from sources[i], concurrently for different i
+        void ForEachSourceBFS(const std::vector<int>& sources, int threads, const std::function<void(int, const std::vector<int>&)>& visit){
+            int count = sources.size();
+            threads = std::min(ResolveThreads(threads), std::max(1, count));
+
+            // A failing worker drains the counter so the others stop early;
+            // RunTasks rethrows its exception once every thread is joined
+            std::atomic<int> next(0);
+            std::vector<std::function<void()>> tasks(threads, [&]{
+                try{
+                    std::vector<int> distances, parents;
+                    for(int i = next++; i < count; i = next++){
+                        BFS(sources[i], distances, parents);
+                        visit(i, distances);
+                    }
+                } catch(...) {
+                    next = count;
+                    throw;
+                }
+            });
+            RunTasks(tasks);
+        }
+
+    public:
+        // Build the snapshot from vertex values and an edge list given by
+        // dense index. An undirected edge is stored once in the edge list and
+        // in both directions in the CSR arrays
+        FrozenGraph(bool directed, std::vector<int> ids, std::vector<int> from, std::vector<int> to, std::vector<double> w)
+            : directed(directed), ids(std::move(ids)), edgeFrom(std::move(from)), edgeTo(std::move(to)), edgeWeights(std::move(w)){
+            cache = nullptr;
+            cacheVersion = 0;
+            negativeWeights = std::any_of(edgeWeights.begin(), edgeWeights.end(), [](double x){ return x < 0; });
+            int n = this->ids.size();
+            index.reserve(n);
+            for(int i = 0; i < n; i++)
+                index[this->ids[i]] = i;
+
+            // Counting sort of the edges by source keeps each neighbor list in
+            // edge order
+            offsets.assign(n + 1, 0);
+            for(size_t e = 0; e < edgeFrom.size(); e++){
+                offsets[edgeFrom[e] + 1]++;
+                if(!directed)
+                    offsets[edgeTo[e] + 1]++;
+            }
+            for(int i = 0; i < n; i++)
+                offsets[i + 1] += offsets[i];
+
+            targets.resize(offsets[n]);
+            weights.resize(offsets[n]);
+            std::vector<int> next(offsets.begin(), offsets.end() - 1);
+            for(size_t e = 0; e < edgeFrom.size(); e++){
+                int slot = next[edgeFrom[e]]++;
+                targets[slot] = edgeTo[e];
+                weights[slot] = edgeWeights[e];
+                if(!directed){
+                    slot = next[edgeTo[e]]++;
+                    targets[slot] = edgeFrom[e];
+                    weights[slot] = edgeWeights[e];
+                }
+            }
+        }
+
+        bool IsDirected(){
+            return directed;
+        }
+
+        int GetSize(){
+            return ids.size();
+        }
+
+        int GetEdgeCount(){
+            return edgeFrom.size();
+        }
+
+        // Dense index of a vertex value, or -1
+        int IndexOf(int value){
+            auto it = index.find(value);
+            return it == index.end() ? -1 : it->second;
+        }
+
+        const std::vector<int>& GetIds(){
+            return ids;
+        }
+
+        const std::vector<int>& GetOffsets(){
+            return offsets;
+        }
+
+        const std::vector<int>& GetTargets(){
+            return targets;
+        }
+
+        const std::vector<double>& GetWeights(){
+            return weights;
+        }
+
+        const std::vector<int>& GetEdgeFrom(){
+            return edgeFrom;
+        }
+
+        const std::vector<int>& GetEdgeTo(){
+            return edgeTo;
+        }
+
+        const std::vector<double>& GetEdgeWeights(){
+            return edgeWeights;
+        }
+
+        // In-neighbor CSR arrays; the out-neighbor ones for undirected graphs
+        const std::vector<int>& GetReverseOffsets(){
+            if(!directed)
+                return offsets;
+            std::call_once(reverseBuilt, [this]{ BuildReverse(); });
+            return reverseOffsets;
+        }
+
+        const std::vector<int>& GetReverseTargets(){
+            if(!directed)
+                return targets;
+            std::call_once(reverseBuilt, [this]{ BuildReverse(); });
+            return reverseTargets;
+        }
+
+        const std::vector<double>& GetReverseWeights(){
+            if(!directed)
+                return weights;
+            std::call_once(reverseBuilt, [this]{ BuildReverse(); });
+            return reverseWeights;
+        }
+
+        // BFS from the vertex with dense index s over the out-neighbors, or
+        // the in-neighbors when reverse is set. distances[i] is INT_MAX and
+        // parents[i] is -1 for unreachable vertices; parents are dense indices.
+        // Visited vertices live in a bitset and the frontier in one array that
+        // holds the vertices in visiting order, each level a contiguous slice.
+        // With directionOptimizing, levels with a heavy frontier are expanded
+        // bottom-up: every unvisited vertex looks for a parent in the frontier.
+        // Distances are the same either way, parents may differ between ties
+        void BFS(int s, std::vector<int>& distances, std::vector<int>& parents, bool directionOptimizing = false, bool reverse = false){
+            BFS(std::vector<int>{s}, distances, parents, directionOptimizing, reverse);
+        }
+
+        // Multi-source BFS: every vertex in sources starts at distance 0 with
+        // no parent, so distances[i] is the distance to the nearest source
+        void BFS(const std::vector<int>& sources, std::vector<int>& distances, std::vector<int>& parents, bool directionOptimizing = false, bool reverse = false){
+            const std::vector<int>& out = reverse ? GetReverseOffsets() : offsets;
+            const std::vector<int>& outTargets = reverse ? GetReverseTargets() : targets;
+            int n = ids.size();
+            distances.assign(n, INT_MAX);
+            parents.assign(n, -1);
+
+            Bitset visited(n);
+            std::vector<int> frontier(n);
+            int head = 0, tail = 0;
+            for(int s : sources){
+                if(visited.Test(s))
+                    continue;
+                frontier[tail++] = s;
+                visited.Set(s);
+                distances[s] = 0;
+            }
+
+            long long unexploredEdges = outTargets.size();
+            bool bottomUp = false;
+            for(int level = 1; head < tail; level++){
+                int levelEnd = tail;
+                long long frontierEdges = 0;
+                for(int i = head; i < levelEnd; i++)
+                    frontierEdges += out[frontier[i] + 1] - out[frontier[i]];
+                unexploredEdges -= frontierEdges;
+
+                if(directionOptimizing){
+                    if(!bottomUp && frontierEdges > unexploredEdges / BFS_ALPHA)
+                        bottomUp = true;
+                    else if(bottomUp && levelEnd - head < n / BFS_BETA)
+                        bottomUp = false;
+                }
+
+                if(bottomUp){
+                    const std::vector<int>& in = reverse ? offsets : GetReverseOffsets();
+                    const std::vector<int>& inTargets = reverse ? targets : GetReverseTargets();
+                    Bitset inFrontier(n);
+                    for(int i = head; i < levelEnd; i++)
+                        inFrontier.Set(frontier[i]);
+                    for(int v = 0; v < n; v++){
+                        if(visited.Test(v))
+                            continue;
+                        for(int i = in[v]; i < in[v + 1]; i++){
+                            int u = inTargets[i];
+                            if(inFrontier.Test(u)){
+                                visited.Set(v);
+                                distances[v] = level;
+                                parents[v] = u;
+                                frontier[tail++] = v;
+                                break;
+                            }
+                        }
+                    }
+                }
+                else{
+                    for(int i = head; i < levelEnd; i++){
+                        int u = frontier[i];
+                        for(int e = out[u]; e < out[u + 1]; e++){
+                            int v = outTargets[e];
+                            if(!visited.Test(v)){
+                                visited.Set(v);
+                                distances[v] = level;
+                                parents[v] = u;
+                                frontier[tail++] = v;
+                            }
+                        }
+                    }
+                }
+                head = levelEnd;
+            }
+        }
+
+        // Serve the single-source queries from cache, as graph version version
+        void AttachCache(ShortestPathCache* shortestPathCache, long long version){
+            cache = shortestPathCache;
+            cacheVersion = version;
+        }
+
+        // Full BFS (hops) or Dijkstra (distances) tree from dense index
+        // source, through the attached cache if there is one
+        std::shared_ptr<const ShortestPathTree> GetShortestPathTree(int source, bool weighted){
+            auto compute = [&](ShortestPathTree& tree){
+                if(weighted)
+                    Dijkstra(source, tree.distances, tree.parents);
+                else
+                    BFS(source, tree.hops, tree.parents);
+            };
+            if(cache == nullptr){
+                auto tree = std::make_shared<ShortestPathTree>();
+                compute(*tree);
+                return tree;
+            }
+            return cache->Get(cacheVersion, source, weighted, compute);
+        }
+
+        // BFS from every vertex value in sources at once, see BFS
+        void MultiSourceBFS(const int sources[], int count, std::vector<int>& distances, std::vector<int>& parents){
+            BFS(IndicesOrThrow(sources, count), distances, parents);
+        }
+
+        // Hop distances between vertex values, written row-major to out: one
+        // row per source and one column per target, INT_MAX if unreachable.
+        // One BFS runs per distinct source, spread over threads threads
+        void Distances(const int sources[], int sourceCount, const int targets[], int targetCount, int out[], int threads = 1){
+            std::vector<int> sourceIndices = IndicesOrThrow(sources, sourceCount);
+            std::vector<int> targetIndices = IndicesOrThrow(targets, targetCount);
+
+            // First row of every distinct source; repeated rows are copied
+            std::unordered_map<int, int> firstRow;
+            std::vector<int> unique, uniqueRows;
+            for(int i = 0; i < sourceCount; i++){
+                if(firstRow.emplace(sourceIndices[i], i).second){
+                    unique.push_back(sourceIndices[i]);
+                    uniqueRows.push_back(i);
+                }
+            }
+
+            ForEachSourceBFS(unique, threads, [&](int i, const std::vector<int>& distances){
+                int* row = out + (long long)uniqueRows[i] * targetCount;
+                for(int j = 0; j < targetCount; j++)
+                    row[j] = distances[targetIndices[j]];
+            });
+            for(int i = 0; i < sourceCount; i++){
+                int first = firstRow[sourceIndices[i]];
+                if(first != i)
+                    std::copy(out + (long long)first * targetCount, out + (long long)(first + 1) * targetCount, out + (long long)i * targetCount);
+            }
+        }
+
+        // n x n hop distance matrix by dense index, row-major, one BFS per
+        // vertex spread over threads threads
+        void AllPairsShortestPaths(int out[], int threads = 0){
+            int n = ids.size();
+            std::vector<int> sources(n);
+            std::iota(sources.begin(), sources.end(), 0);
+            ForEachSourceBFS(sources, threads, [&](int i, const std::vector<int>& distances){
+                std::copy(distances.begin(), distances.end(), out + (long long)i * n);
+            });
+        }
+
+        // Bytes needed by AllPairsShortestPaths: the matrix itself plus the
+        // BFS scratch of every thread
+        long long AllPairsMemory(int threads = 0){
+            long long n = ids.size();
+            threads = std::min<long long>(ResolveThreads(threads), std::max(1LL, n));
+            long long scratch = 3 * n * sizeof(int) + (n + 63) / 64 * sizeof(uint64_t);
+            return n * n * sizeof(int) + threads * scratch;
+        }
+
+        // Dijkstra from the vertex with dense index s on an indexed heap.
+        // distances[i] is infinity and parents[i] -1 for unreachable vertices.
+        // With a target, the search stops as soon as the target is settled, so
+        // only the target's distance and path are final
+        void Dijkstra(int s, std::vector<double>& distances, std::vector<int>& parents, int target = -1){
+            RequireNonNegativeWeights();
+            int n = ids.size();
+            distances.assign(n, std::numeric_limits<double>::infinity());
+            parents.assign(n, -1);
+
+            IndexedPriorityQueue pq(n);
+            distances[s] = 0;
+            pq.Push(s, 0);
+            while(!pq.IsEmpty()){
+                int u = pq.Pop();
+                if(u == target)
+                    break;
+                for(int e = offsets[u]; e < offsets[u + 1]; e++){
+                    int v = targets[e];
+                    double d = distances[u] + weights[e];
+                    if(d < distances[v]){
+                        distances[v] = d;
+                        parents[v] = u;
+                        pq.Push(v, d);
+                    }
+                }
+            }
+        }
+
+        // Bidirectional Dijkstra between dense indices s and t: a forward
+        // search over out-edges and a backward one over in-edges, expanding the
+        // smaller queue, until the two queue tops together reach the best
+        // meeting distance. Returns the dense path, empty if t is unreachable
+        std::vector<int> BidirectionalDijkstra(int s, int t, double& distance){
+            RequireNonNegativeWeights();
+            const double infinity = std::numeric_limits<double>::infinity();
+            int n = ids.size();
+            distance = infinity;
+            if(s == t){
+                distance = 0;
+                return {s};
+            }
+
+            const std::vector<int>& reverseOff = GetReverseOffsets();
+            const std::vector<int>& reverseTgt = GetReverseTargets();
+            const std::vector<double>& reverseW = GetReverseWeights();
+
+            std::vector<double> forward(n, infinity), backward(n, infinity);
+            std::vector<int> forwardParents(n, -1), backwardParents(n, -1);
+            IndexedPriorityQueue forwardQueue(n), backwardQueue(n);
+            forward[s] = 0;
+            forwardQueue.Push(s, 0);
+            backward[t] = 0;
+            backwardQueue.Push(t, 0);
+
+            int meet = -1;
+            while(!forwardQueue.IsEmpty() && !backwardQueue.IsEmpty()){
+                if(forwardQueue.TopKey() + backwardQueue.TopKey() >= distance)
+                    break;
+
+                bool isForward = forwardQueue.GetSize() <= backwardQueue.GetSize();
+                IndexedPriorityQueue& queue = isForward ? forwardQueue : backwardQueue;
+                std::vector<double>& dist = isForward ? forward : backward;
+                std::vector<double>& other = isForward ? backward : forward;
+                std::vector<int>& parents = isForward ? forwardParents : backwardParents;
+                const std::vector<int>& off = isForward ? offsets : reverseOff;
+                const std::vector<int>& tgt = isForward ? targets : reverseTgt;
+                const std::vector<double>& w = isForward ? weights : reverseW;
+
+                int u = queue.Pop();
+                for(int e = off[u]; e < off[u + 1]; e++){
+                    int v = tgt[e];
+                    double d = dist[u] + w[e];
+                    if(d < dist[v]){
+                        dist[v] = d;
+                        parents[v] = u;
+                        queue.Push(v, d);
+                        if(d + other[v] < distance){
+                            distance = d + other[v];
+                            meet = v;
+                        }
+                    }
+                }
+            }
+
+            if(meet == -1)
+                return {};
+            std::vector<int> path = TracePath(forwardParents, meet);
+            for(int x = backwardParents[meet]; x != -1; x = backwardParents[x])
+                path.push_back(x);
+            return path;
+        }
+
+        // A* between dense indices s and t. The heuristic is called once per
+        // vertex with vertex values and must never overestimate; vertices are
+        // reopened when a shorter path to them is found, so it need not be
+        // consistent. Returns the dense path, empty if t is unreachable
+        std::vector<int> AStar(int s, int t, ShortestPathHeuristic heuristic, double& distance){
+            RequireNonNegativeWeights();
+            int n = ids.size();
+            std::vector<double> g(n, std::numeric_limits<double>::infinity());
+            std::vector<double> h(n, 0);
+            std::vector<char> estimated(n, 0);
+            std::vector<int> parents(n, -1);
+            auto H = [&](int v){
+                if(!estimated[v]){
+                    h[v] = heuristic(ids[v], ids[t]);
+                    estimated[v] = 1;
+                }
+                return h[v];
+            };
+
+            IndexedPriorityQueue pq(n);
+            g[s] = 0;
+            pq.Push(s, H(s));
+            while(!pq.IsEmpty()){
+                int u = pq.Pop();
+                if(u == t)
+                    break;
+                for(int e = offsets[u]; e < offsets[u + 1]; e++){
+                    int v = targets[e];
+                    double d = g[u] + weights[e];
+                    if(d < g[v]){
+                        g[v] = d;
+                        parents[v] = u;
+                        pq.Push(v, d + H(v));
+                    }
+                }
+            }
+
+            distance = g[t];
+            if(distance == std::numeric_limits<double>::infinity())
+                return {};
+            return TracePath(parents, t);
+        }
+
+        // Shortest path between two vertex values, by hops (SHORTEST_PATH_BFS)
+        // or by weight. Returns the dense path, empty if there is none
+        std::vector<int> ShortestPath(int s, int t, int mode, double& distance){
+            int source = IndexOrThrow(s);
+            int target = IndexOrThrow(t);
+
+            if(mode == SHORTEST_PATH_BIDIRECTIONAL)
+                return BidirectionalDijkstra(source, target, distance);
+
+            // Without a cache Dijkstra stops at the target; a cached tree is
+            // computed in full so it can answer later targets too
+            if(mode != SHORTEST_PATH_BFS && cache == nullptr){
+                std::vector<double> distances;
+                std::vector<int> parents;
+                Dijkstra(source, distances, parents, target);
+                distance = distances[target];
+                if(distance == std::numeric_limits<double>::infinity())
+                    return {};
+                return TracePath(parents, target);
+            }
+
+            auto tree = GetShortestPathTree(source, mode != SHORTEST_PATH_BFS);
+            if(mode == SHORTEST_PATH_BFS)
+                distance = tree->hops[target] == INT_MAX ? std::numeric_limits<double>::infinity() : tree->hops[target];
+            else
+                distance = tree->distances[target];
+            if(distance == std::numeric_limits<double>::infinity())
+                return {};
+            return TracePath(tree->parents, target);
+        }
+
+        LinkedList* GetNeighbors(int value){
+            int u = IndexOrThrow(value);
+            LinkedList* l = new LinkedList();
+            for(int i = offsets[u + 1] - 1; i >= offsets[u]; i--)
+                l->Insert(ids[targets[i]]);
+            return l;
+        }
+
+        LinkedList* GetVertices(){
+            LinkedList* l = new LinkedList();
+            for(int i = ids.size() - 1; i >= 0; i--)
+                l->Insert(ids[i]);
+            return l;
+        }
+
+        LinkedList* GetPath(int s, int v){
+            int source = IndexOrThrow(s);
+            int target = IndexOrThrow(v);
+
+            auto tree = GetShortestPathTree(source, false);
+            if(tree->hops[target] == INT_MAX)
+                throw std::runtime_error("No path from " + std::to_string(s) + " to " + std::to_string(v) + " exists");
+
+            LinkedList* l = new LinkedList();
+            for(int x = target; x != -1; x = tree->parents[x])
+                l->Insert(ids[x]);
+            return l;
+        }
+
+        int Distance(int s, int t){
+            int source = IndexOrThrow(s);
+            int target = IndexOrThrow(t);
+
+            return GetShortestPathTree(source, false)->hops[target];
+        }
+
+        LinkedList* GetReachableVertices(int s){
+            int source = IndexOrThrow(s);
+
+            auto tree = GetShortestPathTree(source, false);
+
+            LinkedList* l = new LinkedList();
+            for(int i = ids.size() - 1; i >= 0; i--)
+                if(tree->hops[i] != INT_MAX && i != source)
+                    l->Insert(ids[i]);
+            return l;
+        }
+
+        // Connected for undirected graphs, strongly connected for directed ones
+        bool IsConnected(){
+            if(ids.size() <= 1)
+                return true;
+            std::vector<int> labels;
+            return StronglyConnectedComponents(labels) == 1;
+        }
+
+        // Label every dense index with its weakly connected component (the
+        // connected component when undirected) in one union-find pass over
+        // the edges. Components are numbered in order of their first vertex;
+        // returns their count
+        int WeaklyConnectedComponents(std::vector<int>& labels){
+            int n = ids.size();
+            std::vector<int> root(n);
+            std::iota(root.begin(), root.end(), 0);
+            auto find = [&](int x){
+                while(root[x] != x){
+                    root[x] = root[root[x]];
+                    x = root[x];
+                }
+                return x;
+            };
+            for(size_t e = 0; e < edgeFrom.size(); e++){
+                int a = find(edgeFrom[e]);
+                int b = find(edgeTo[e]);
+                if(a != b)
+                    root[std::max(a, b)] = std::min(a, b);
+            }
+
+            labels.assign(n, -1);
+            int count = 0;
+            for(int v = 0; v < n; v++){
+                int r = find(v);
+                if(labels[r] == -1)
+                    labels[r] = count++;
+                labels[v] = labels[r];
+            }
+            return count;
+        }
+
+        // Label every dense index with its strongly connected component using
+        // an iterative Tarjan's algorithm over the CSR arrays, so deep graphs
+        // cannot overflow the call stack. Components are numbered in
+        // topological order: every edge between two components goes from the
+        // lower label to the higher one. Undirected graphs get their connected
+        // components. Returns the number of components
+        int StronglyConnectedComponents(std::vector<int>& labels){
+            if(!directed)
+                return WeaklyConnectedComponents(labels);
+
+            int n = ids.size();
+            std::vector<int> order(n, -1), low(n);
+            std::vector<char> onStack(n, 0);
+            std::vector<int> stack;
+            // DFS call stack of (vertex, next edge to explore)
+            std::vector<std::pair<int, int>> calls;
+            labels.assign(n, -1);
+            int counter = 0, count = 0;
+
+            for(int root = 0; root < n; root++){
+                if(order[root] != -1)
+                    continue;
+                order[root] = low[root] = counter++;
+                stack.push_back(root);
+                onStack[root] = 1;
+                calls.emplace_back(root, offsets[root]);
+
+                while(!calls.empty()){
+                    int v = calls.back().first;
+                    int e = calls.back().second;
+                    if(e < offsets[v + 1]){
+                        calls.back().second++;
+                        int w = targets[e];
+                        if(order[w] == -1){
+                            order[w] = low[w] = counter++;
+                            stack.push_back(w);
+                            onStack[w] = 1;
+                            calls.emplace_back(w, offsets[w]);
+                        }
+                        else if(onStack[w])
+                            low[v] = std::min(low[v], order[w]);
+                        continue;
+                    }
+
+                    calls.pop_back();
+                    if(!calls.empty())
+                        low[calls.back().first] = std::min(low[calls.back().first], low[v]);
+                    if(low[v] == order[v]){
+                        int w;
+                        do{
+                            w = stack.back();
+                            stack.pop_back();
+                            onStack[w] = 0;
+                            labels[w] = count;
+                        } while(w != v);
+                        count++;
+                    }
+                }
+            }
+
+            // Tarjan finishes sink components first
+            for(int& label : labels)
+                label = count - 1 - label;
+            return count;
+        }
+
+        // Kahn's algorithm over in-degrees: order receives the dense indices in
+        // topological order, ties taken in index order. Returns false, with
+        // only the vertices outside every cycle in order, if there is a cycle
+        bool TopologicalSort(std::vector<int>& order){
+            if(!directed)
+                throw std::invalid_argument("Topological order requires a directed graph");
+            int n = ids.size();
+            std::vector<int> inDegree(n, 0);
+            for(int t : targets)
+                inDegree[t]++;
+
+            order.clear();
+            order.reserve(n);
+            for(int v = 0; v < n; v++)
+                if(inDegree[v] == 0)
+                    order.push_back(v);
+            for(size_t head = 0; head < order.size(); head++){
+                int u = order[head];
+                for(int e = offsets[u]; e < offsets[u + 1]; e++)
+                    if(--inDegree[targets[e]] == 0)
+                        order.push_back(targets[e]);
+            }
+            return (int)order.size() == n;
+        }
+
+        // A directed graph has a cycle when Kahn's algorithm cannot order every
+        // vertex; an undirected one when it has more edges than a spanning forest
+        bool HasCycle(){
+            if(directed){
+                std::vector<int> order;
+                return !TopologicalSort(order);
+            }
+            std::vector<int> labels;
+            int components = WeaklyConnectedComponents(labels);
+            return (long long)edgeFrom.size() > (long long)ids.size() - components;
+        }
+
+        // Heaviest path of a DAG (by edge weights, or by edge count when not
+        // weighted) relaxed in topological order; a path may start at any
+        // vertex. Returns the path as dense indices; a graph without a
+        // positive-length path yields its first vertex alone
+        std::vector<int> DAGLongestPath(bool weighted, double& length){
+            std::vector<int> order;
+            if(!TopologicalSort(order))
+                throw std::invalid_argument("Longest paths require a directed acyclic graph");
+            int n = ids.size();
+            length = 0;
+            if(n == 0)
+                return {};
+
+            std::vector<double> best(n, 0);
+            std::vector<int> parents(n, -1);
+            for(int u : order){
+                for(int e = offsets[u]; e < offsets[u + 1]; e++){
+                    int v = targets[e];
+                    double d = best[u] + (weighted ? weights[e] : 1);
+                    if(d > best[v]){
+                        best[v] = d;
+                        parents[v] = u;
+                    }
+                }
+            }
+
+            int end = 0;
+            for(int v = 1; v < n; v++)
+                if(best[v] > best[end])
+                    end = v;
+            length = best[end];
+            return TracePath(parents, end);
+        }
+
+        // Directed acyclic graph of the strongly connected components: vertex
+        // c stands for component c of labels, and each pair of components
+        // joined by edges gets one edge carrying the lightest of their weights
+        FrozenGraph* Condensation(std::vector<int>& labels, int& count){
+            count = StronglyConnectedComponents(labels);
+            std::vector<int> componentIds(count);
+            std::iota(componentIds.begin(), componentIds.end(), 0);
+
+            std::vector<int> from, to;
+            std::vector<double> w;
+            std::unordered_map<long long, int> seen;
+            for(size_t e = 0; e < edgeFrom.size(); e++){
+                int a = labels[edgeFrom[e]];
+                int b = labels[edgeTo[e]];
+                if(a == b)
+                    continue;
+                if(!directed && a > b)
+                    std::swap(a, b);
+                auto inserted = seen.emplace((long long)a * count + b, from.size());
+                if(inserted.second){
+                    from.push_back(a);
+                    to.push_back(b);
+                    w.push_back(edgeWeights[e]);
+                }
+                else
+                    w[inserted.first->second] = std::min(w[inserted.first->second], edgeWeights[e]);
+            }
+            return new FrozenGraph(directed, componentIds, from, to, w);
+        }
+
+        double EdgeWeight(int v, int u){
+            int from = IndexOf(v);
+            int to = IndexOf(u);
+            if(from != -1 && to != -1){
+                for(int i = offsets[from]; i < offsets[from + 1]; i++)
+                    if(targets[i] == to)
+                        return weights[i];
+            }
+            throw std::invalid_argument("Edge (" + std::to_string(v) + " -> " + std::to_string(u) + ") does not exist");
+        }
+
+        double GraphWeight(){
+            double weight = 0.0;
+            for(double w : edgeWeights)
+                weight += w;
+            return weight;
+        }
+};
@@ -1,59 +1,73 @@
+// What AddEdges does with an edge that already exists
+enum DuplicateEdgePolicy{DUPLICATE_ERROR, DUPLICATE_KEEP_FIRST, DUPLICATE_KEEP_LAST, DUPLICATE_MIN, DUPLICATE_MAX, DUPLICATE_SUM};
+
+// What AddEdges does with an edge from a vertex to itself
+enum SelfLoopPolicy{SELF_LOOP_ERROR, SELF_LOOP_DROP};
+
+// Vertex colors of the array BFS; every vertex ends white or black
+enum BFSColor{BFS_WHITE, BFS_GRAY, BFS_BLACK};
+
 class Graph{
     private:
         std::vector<GraphVertex*> vertices;
         std::vector<Edge*> edges;
+        // Vertex value -> its index in vertices
+        std::unordered_map<int, int> slots;
         int size;
         bool directed;
+        // Incremented by every mutation; the CSR snapshot used by the
+        // traversals is rebuilt when it was taken at an older version
+        long long version;
+        FrozenGraph* snapshot;
+        long long snapshotVersion;
+        // Opt-in LRU cache of the snapshot's shortest path trees
+        ShortestPathCache cache;
 
         bool IsExistVertex(int value){
-            for(GraphVertex* v : vertices){
-                if(v->GetData() == value)
-                    return true;
-            }
-            return false;
+            return slots.find(value) != slots.end();
         }
 
         bool IsExistEdge(int v, int u){
-            if(!IsExistVertex(v) || !IsExistVertex(u))
-                return false;
-            
-            for(GraphVertex* q : vertices){
-                if(q->GetData() == v && q->HasNeighbor(u))
-                    return true;
-            }
-            return false;
+            return FindEdge(v, u) != nullptr;
         }
 
         int FindVertexIndex(int value){
-            for(int i = 0; i < size; i++){
-                if(vertices[i]->GetData() == value)
-                    return i;
-            }
-            return -1;
+            auto it = slots.find(value);
+            return it == slots.end() ? -1 : it->second;
+        }
+
+        Edge* FindEdge(int v, int u){
+            GraphVertex* q = GetVertex(v);
+            if(q == nullptr)
+                return nullptr;
+            return q->GetEdge(u);
         }
 
         int FindEdgeIndex(int v, int u){
-            for(int i = 0; i < edges.size(); i++){
-                if(edges[i]->GetV() == v && edges[i]->GetU() == u)
-                    return i;
-                else if(!directed)
-                    if((edges[i]->GetV() == v && edges[i]->GetU() == u) || (edges[i]->GetV() == u && edges[i]->GetU() == v))
-                        return i;
-            }
-            return -1;
+            Edge* e = FindEdge(v, u);
+            if(e == nullptr)
+                return -1;
+            return std::find(edges.begin(), edges.end(), e) - edges.begin();
         }
 
         GraphVertex* GetVertex(int value){
-            for(GraphVertex* q : vertices)
-                if(q->GetData() == value)
-                    return q;
-            return nullptr;
+            int index = FindVertexIndex(value);
+            return index == -1 ? nullptr : vertices[index];
+        }
+
+        void AddEdge(Edge* e){
+            GetVertex(e->GetV())->AddNeighbor(e->GetU(), e);
+            if(!directed)
+                GetVertex(e->GetU())->AddNeighbor(e->GetV(), e);
+            edges.push_back(e);
+            version++;
         }
 
     public:
-        Graph(bool directed = true): vertices(), edges(), size(0), directed(directed) {}
+        Graph(bool directed = true): vertices(), edges(), slots(), size(0), directed(directed), version(0), snapshot(nullptr), snapshotVersion(-1) {}
 
         ~Graph(){
+            delete snapshot;
             for(GraphVertex* v : vertices)
                 delete v;
             for(Edge* e : edges)
@@ -75,8 +89,10 @@ class Graph{
             }
 
             GraphVertex* new_vertex = new GraphVertex(value);
+            slots[value] = vertices.size();
             vertices.push_back(new_vertex);
             size++;
+            version++;
         }
 
         void DeleteVertex(int value){
@@ -102,7 +118,11 @@ class Graph{
             int index = FindVertexIndex(value);
             delete vertices[index];
             vertices.erase(vertices.begin() + index);
+            slots.erase(value);
+            for(int i = index; i < vertices.size(); i++)
+                slots[vertices[i]->GetData()] = i;
             size--;
+            version++;
         }
 
         void CreateEdge(int v, int u){
@@ -121,16 +141,7 @@ class Graph{
                 return;
             }
 
-            for(GraphVertex* q : vertices){
-                if(q->GetData() == v)
-                    q->AddNeighbor(u);
-                if(!directed)
-                    if(q->GetData() == u)
-                        q->AddNeighbor(v);
-            }
-
-            Edge* new_edge = new Edge(v, u, directed);
-            edges.push_back(new_edge);
+            AddEdge(new Edge(v, u, directed));
         }
 
         void CreateEdge(int v, int u, double weight){
@@ -149,16 +160,77 @@ class Graph{
                 return;
             }
 
-            for(GraphVertex* q : vertices){
-                if(q->GetData() == v)
-                    q->AddNeighbor(u);
-                if(!directed)
-                    if(q->GetData() == u)
-                        q->AddNeighbor(v);
-            }
+            AddEdge(new Edge(v, u, weight, directed));
+        }
 
-            Edge* new_edge = new Edge(v, u, weight, directed);
-            edges.push_back(new_edge);
+        // Create every vertex of values that does not exist yet
+        void AddVertices(const int values[], int count){
+            slots.reserve(slots.size() + count);
+            for(int i = 0; i < count; i++)
+                if(!IsExistVertex(values[i]))
+                    CreateVertex(values[i]);
+        }
+
+        // Add count edges src[i] -> dst[i] in one pass, creating missing
+        // endpoints in order of first appearance. weights may be nullptr for
+        // unweighted edges. Indices of edges that did not create a new edge are
+        // appended to rejected; duplicates and selfLoops count them by cause.
+        // With an error policy, the index of the first offending edge is
+        // appended to rejected and std::invalid_argument is thrown
+        void AddEdges(const int src[], const int dst[], const double weights[], int count,
+                      int duplicatePolicy, int selfLoopPolicy, std::vector<int>& rejected, int& duplicates, int& selfLoops){
+            slots.reserve(slots.size() + count);
+            for(int i = 0; i < count; i++){
+                int v = src[i];
+                int u = dst[i];
+                double weight = weights ? weights[i] : 0;
+
+                if(v == u){
+                    if(selfLoopPolicy == SELF_LOOP_ERROR){
+                        rejected.push_back(i);
+                        throw std::invalid_argument("Edge " + std::to_string(i) + " (" + std::to_string(v) + ", " + std::to_string(u) + ") is a self-loop");
+                    }
+                    if(!IsExistVertex(v))
+                        CreateVertex(v);
+                    rejected.push_back(i);
+                    selfLoops++;
+                    continue;
+                }
+
+                if(!IsExistVertex(v))
+                    CreateVertex(v);
+                if(!IsExistVertex(u))
+                    CreateVertex(u);
+
+                Edge* e = FindEdge(v, u);
+                if(e == nullptr){
+                    AddEdge(new Edge(v, u, weight, directed));
+                    continue;
+                }
+
+                switch(duplicatePolicy){
+                    case DUPLICATE_ERROR:
+                        rejected.push_back(i);
+                        throw std::invalid_argument("Edge " + std::to_string(i) + " (" + std::to_string(v) + ", " + std::to_string(u) + ") already exists");
+                    case DUPLICATE_KEEP_LAST:
+                        e->SetWeight(weight);
+                        break;
+                    case DUPLICATE_MIN:
+                        e->SetWeight(std::min(e->GetWeight(), weight));
+                        break;
+                    case DUPLICATE_MAX:
+                        e->SetWeight(std::max(e->GetWeight(), weight));
+                        break;
+                    case DUPLICATE_SUM:
+                        e->SetWeight(e->GetWeight() + weight);
+                        break;
+                    default:
+                        break;
+                }
+                version++;
+                rejected.push_back(i);
+                duplicates++;
+            }
         }
 
         void DeleteEdge(int v, int u){
@@ -172,46 +244,27 @@ class Graph{
                 return;
             }
 
-            for(GraphVertex* q : vertices){
-                if(q->GetData() == v)
-                    q->DeleteNeighbor(u);
-                if(!directed)
-                    if(q->GetData() == u)
-                        q->DeleteNeighbor(v);
-            }
+            int index = FindEdgeIndex(v, u);
+            GetVertex(v)->DeleteNeighbor(u);
+            if(!directed)
+                GetVertex(u)->DeleteNeighbor(v);
 
-            for(auto it = edges.begin(); it != edges.end(); ++it){
-                Edge* e = *it;
-                if(e->GetV() == v && e->GetU() == u){
-                    delete e;
-                    edges.erase(it);
-                    break;
-                }
-                else if(!directed && e->GetV() == u && e->GetU() == v){
-                    delete e;
-                    edges.erase(it);
-                    break;
-                }
-            }
+            delete edges[index];
+            edges.erase(edges.begin() + index);
+            version++;
         }
 
         LinkedList* GetNeighbors(int value){
             if(!IsExistVertex(value))
                 throw std::runtime_error("Vertex does not exist");
 
-            for(GraphVertex* q : vertices){
-                if(q->GetData() == value){
-                    LinkedList* copy = new LinkedList();
-                    LinkedList* neighbors = q->GetNeighbors();
-                    Node<int>* current = neighbors->GetHead();
-                    while(current){
-                        copy->Insert(current->GetData());
-                        current = current->GetNext();
-                    }
-                    return copy;
-                }
+            LinkedList* copy = new LinkedList();
+            Node<int>* current = GetVertex(value)->GetNeighbors()->GetHead();
+            while(current){
+                copy->Insert(current->GetData());
+                current = current->GetNext();
             }
-            return nullptr;
+            return copy;
         }
 
         LinkedList* GetVertices(){
@@ -219,9 +272,9 @@ class Graph{
             if(size == 0)
                 return vertices;
 
-            for(GraphVertex* q : this->vertices){
-                vertices->InsertLast(q->GetData());
-            }
+            // Insert at the head from the back, keeping insertion order in O(V)
+            for(int i = size - 1; i >= 0; i--)
+                vertices->Insert(this->vertices[i]->GetData());
             return vertices;
         }
 
@@ -269,130 +322,70 @@ class Graph{
         }
 
         std::tuple<std::map<int, std::string>, std::map<int, int>, std::map<int, GraphVertex*>> BFS(int s){
-            if(!IsExistVertex(s)){
+            int source = FindVertexIndex(s);
+            if(source == -1){
                 throw std::invalid_argument("Vertex " + std::to_string(s) + " does not exist");
             }
-            
+
+            std::vector<int> dist, par;
+            Snapshot()->BFS(source, dist, par);
+
             std::map<int, std::string> colors;
             std::map<int, int> distances;
             std::map<int, GraphVertex*> parents;
-            
-            for(GraphVertex* v : vertices){
-                if(v->GetData() == s){
-                    colors[v->GetData()] = "gray";
-                    distances[v->GetData()] = 0;
-                }
-                else{
-                    colors[v->GetData()] = "white";
-                    distances[v->GetData()] = INT_MAX;
-                }
-                parents[v->GetData()] = nullptr;
-            }
-            
-            Queue* Q = new Queue();
-            Q->Enqueue(s);
-
-            while(!Q->IsEmpty()){
-                int u = Q->Dequeue();
-                GraphVertex* u_vertex = GetVertex(u);
-
-                Node<int>* v = u_vertex->GetNeighbors()->GetHead(); 
-                while(v != nullptr){
-                    GraphVertex* v_vertex = GetVertex(v->GetData());
-                    if(colors[v->GetData()] == "white"){
-                        colors[v_vertex->GetData()] = "gray";
-                        distances[v_vertex->GetData()] = distances[u] + 1;
-                        parents[v_vertex->GetData()] = u_vertex;
-                        Q->Enqueue(v->GetData());
-                    }
-                    v = v->GetNext();
-                }
-
-                colors[u] = "black";
+            for(int i = 0; i < size; i++){
+                int v = vertices[i]->GetData();
+                colors[v] = dist[i] == INT_MAX ? "white" : "black";
+                distances[v] = dist[i];
+                parents[v] = par[i] == -1 ? nullptr : vertices[par[i]];
             }
 
-            delete Q;
-            
             return {colors, distances, parents};
         }
 
-        LinkedList* GetPath(int s, int v){
-            if(!IsExistVertex(s) || !IsExistVertex(v)){
-                throw std::invalid_argument("Vertex " + std::to_string(s) + " or " + std::to_string(v) + " does not exist");
-            }
-            
-            if(s == v){
-                LinkedList* l = new LinkedList();
-                l->Insert(s);
-                return l;
-            }
-            
-            auto [colors, distances, parents] = BFS(s);
+        // BFS into arrays indexed like the vertex list: ids[i] is the i-th
+        // vertex, distances[i] its distance from s (INT_MAX if unreachable)
+        // and parents[i] the index of its parent (-1 for s and unreachable
+        // vertices). colors may be nullptr; otherwise it receives BFSColor
+        // values. directionOptimizing selects the top-down/bottom-up traversal
+        void BFS(int s, int ids[], int distances[], int parents[], unsigned char colors[], bool directionOptimizing = false){
+            int source = FindVertexIndex(s);
+            if(source == -1)
+                throw std::invalid_argument("Vertex " + std::to_string(s) + " does not exist");
 
-            LinkedList* l = new LinkedList();
+            std::vector<int> dist, par;
+            Snapshot()->BFS(source, dist, par, directionOptimizing);
+            for(int i = 0; i < size; i++)
+                ids[i] = vertices[i]->GetData();
+            std::copy(dist.begin(), dist.end(), distances);
+            std::copy(par.begin(), par.end(), parents);
 
-            GraphVertex* v_vertex = GetVertex(v);
-            while(v_vertex != nullptr){
-                l->Insert(v_vertex->GetData());
-                v_vertex = parents[v_vertex->GetData()];
-            }
+            if(colors)
+                for(int i = 0; i < size; i++)
+                    colors[i] = distances[i] == INT_MAX ? BFS_WHITE : BFS_BLACK;
+        }
 
-            if(l->GetHead()->GetData() == s){
-                return l;
-            }
-            else{
-                delete l;
-                throw std::runtime_error("No path from " + std::to_string(s) + " to " + std::to_string(v) + " exists");
+        LinkedList* GetPath(int s, int v){
+            if(!IsExistVertex(s) || !IsExistVertex(v)){
+                throw std::invalid_argument("Vertex " + std::to_string(s) + " or " + std::to_string(v) + " does not exist");
             }
+            return Snapshot()->GetPath(s, v);
         }
 
         int Distance(int s, int t){
             if(!IsExistVertex(s) || !IsExistVertex(t))
                 throw std::invalid_argument("One or both vertices do not exist");
-
-            auto [colors, distances, parents] = BFS(s);
-
-            GraphVertex* t_vertex = GetVertex(t);
-            return distances[t_vertex->GetData()];
+            return Snapshot()->Distance(s, t);
         }
 
         LinkedList* GetReachableVertices(int s){
             if(!IsExistVertex(s))
                 throw std::invalid_argument("Vertex does not exist");
-
-            auto [colors, distances, parents] = BFS(s);
-
-            LinkedList* l = new LinkedList();
-
-            for(GraphVertex* v : vertices)
-                if(distances[v->GetData()] != INT_MAX && v->GetData() != s)
-                    l->InsertLast(v->GetData());
-            
-            return l;
+            return Snapshot()->GetReachableVertices(s);
         }
 
         bool IsConnected(){
-            if(size <= 1)
-                return true;
-
-            GraphVertex* v = vertices[0];
-            LinkedList* l = GetReachableVertices(v->GetData());
-            bool connected = l->Size() == size - 1;
-            delete l;
-
-            if(!connected)
-                return false;
-
-            if(directed){
-                Graph* transposed = GetTransposed();
-                LinkedList* l_rev = transposed->GetReachableVertices(v->GetData());
-                bool stronglyConnected = l_rev->Size() == size - 1;
-                delete l_rev;
-                delete transposed;
-                return stronglyConnected;
-            }
-
-            return true;
+            return Snapshot()->IsConnected();
         }
 
         Graph* GetTransposed(){
@@ -406,20 +399,50 @@ class Graph{
             return transposed;
         }
 
-        double EdgeWeight(int v, int u){
-            if(!IsExistEdge(v, u))
-                throw std::invalid_argument("Edge (" + std::to_string(v) + " -> " + std::to_string(u) + ") does not exist");
+        long long GetVersion(){
+            return version;
+        }
 
+        ShortestPathCache& GetCache(){
+            return cache;
+        }
+
+        // CSR snapshot of the current state, owned by the graph and rebuilt
+        // only after a mutation. Dense indices are the vertex slots
+        FrozenGraph* Snapshot(){
+            if(snapshot == nullptr || snapshotVersion != version){
+                delete snapshot;
+                snapshot = Freeze();
+                snapshot->AttachCache(&cache, version);
+                snapshotVersion = version;
+            }
+            return snapshot;
+        }
+
+        // Immutable CSR snapshot of the graph; vertices keep their insertion order
+        FrozenGraph* Freeze(){
+            std::vector<int> ids(size);
+            for(int i = 0; i < size; i++)
+                ids[i] = vertices[i]->GetData();
+
+            std::vector<int> from, to;
+            std::vector<double> weights;
+            from.reserve(edges.size());
+            to.reserve(edges.size());
+            weights.reserve(edges.size());
             for(Edge* e : edges){
-                if(directed){
-                    if(e->GetV() == v && e->GetU() == u)
-                        return e->GetWeight();
-                }
-                else
-                    if((e->GetV() == v && e->GetU() == u) || (e->GetV() == u && e->GetU() == v))
-                        return e->GetWeight();
+                from.push_back(slots[e->GetV()]);
+                to.push_back(slots[e->GetU()]);
+                weights.push_back(e->GetWeight());
             }
-            return 0;
+            return new FrozenGraph(directed, std::move(ids), std::move(from), std::move(to), std::move(weights));
+        }
+
+        double EdgeWeight(int v, int u){
+            Edge* e = FindEdge(v, u);
+            if(e == nullptr)
+                throw std::invalid_argument("Edge (" + std::to_string(v) + " -> " + std::to_string(u) + ") does not exist");
+            return e->GetWeight();
         }
 
         double GraphWeight(){
@@ -441,6 +464,8 @@ class Graph{
 
             vertices.clear();
             edges.clear();
+            slots.clear();
+            version++;
 
             size = 0;
         }
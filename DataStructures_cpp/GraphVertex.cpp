@@ -2,9 +2,13 @@ class GraphVertex{
     private:
         const int data;
         LinkedList* neighbors;
+        // Last node of neighbors, so appending a neighbor does not walk the list
+        Node<int>* last;
+        // Neighbor -> edge leading to it, for O(1) expected edge lookups
+        std::unordered_map<int, Edge*> edges;
         
     public:
-        GraphVertex(int value): data(value) {
+        GraphVertex(int value): data(value), last(nullptr) {
             neighbors = new LinkedList();
         }
 
@@ -20,21 +24,36 @@ class GraphVertex{
             return neighbors;
         }
 
-        void AddNeighbor(int value){
-            neighbors->InsertLast(value);
+        void AddNeighbor(int value, Edge* edge){
+            if(last == nullptr){
+                neighbors->Insert(value);
+                last = neighbors->GetHead();
+            }
+            else{
+                Node<int>* node = new Node<int>(value);
+                last->SetNext(node);
+                last = node;
+            }
+            edges[value] = edge;
         }
 
         void DeleteNeighbor(int value){
+            if(edges.erase(value) == 0)
+                return;
             neighbors->Delete(value);
+
+            last = neighbors->GetHead();
+            while(last != nullptr && last->GetNext() != nullptr)
+                last = last->GetNext();
         }
 
         bool HasNeighbor(int value){
-            Node<int>* current = neighbors->GetHead();
-            while(current != nullptr){
-                if(current->GetData() == value)
-                    return true;
-                current = current->GetNext();
-            }
-            return false;
+            return edges.find(value) != edges.end();
+        }
+
+        // Edge leading to the given neighbor, or nullptr
+        Edge* GetEdge(int value){
+            auto it = edges.find(value);
+            return it == edges.end() ? nullptr : it->second;
         }
     };
\ No newline at end of file
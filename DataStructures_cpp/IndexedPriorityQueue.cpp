@@ -0,0 +1,107 @@
+// Binary min-heap over the items 0..capacity-1, each with a double key. The
+// heap position of every item is tracked, so a key can be decreased (or
+// increased) in O(log n) without searching the heap. Equal keys are ordered
+// by item, which keeps the pop order deterministic
+class IndexedPriorityQueue{
+    private:
+        std::vector<int> heap;
+        std::vector<int> position;
+        std::vector<double> keys;
+
+        bool Before(int a, int b){
+            if(keys[a] != keys[b])
+                return keys[a] < keys[b];
+            return a < b;
+        }
+
+        void Place(int i, int item){
+            heap[i] = item;
+            position[item] = i;
+        }
+
+        void SiftUp(int i){
+            int item = heap[i];
+            while(i > 0){
+                int parent = (i - 1) / 2;
+                if(!Before(item, heap[parent]))
+                    break;
+                Place(i, heap[parent]);
+                i = parent;
+            }
+            Place(i, item);
+        }
+
+        void SiftDown(int i){
+            int item = heap[i];
+            int size = heap.size();
+            while(true){
+                int child = 2 * i + 1;
+                if(child >= size)
+                    break;
+                if(child + 1 < size && Before(heap[child + 1], heap[child]))
+                    child++;
+                if(!Before(heap[child], item))
+                    break;
+                Place(i, heap[child]);
+                i = child;
+            }
+            Place(i, item);
+        }
+
+    public:
+        IndexedPriorityQueue(int capacity): position(capacity, -1), keys(capacity, 0) {
+            heap.reserve(capacity);
+        }
+
+        bool IsEmpty(){
+            return heap.empty();
+        }
+
+        int GetSize(){
+            return heap.size();
+        }
+
+        bool Contains(int item){
+            return position[item] != -1;
+        }
+
+        double GetKey(int item){
+            return keys[item];
+        }
+
+        int Top(){
+            return heap[0];
+        }
+
+        double TopKey(){
+            return keys[heap[0]];
+        }
+
+        // Insert item, or move it to its new key if it is already queued
+        void Push(int item, double key){
+            if(position[item] == -1){
+                keys[item] = key;
+                heap.push_back(item);
+                SiftUp(heap.size() - 1);
+                return;
+            }
+            double old = keys[item];
+            keys[item] = key;
+            if(key < old)
+                SiftUp(position[item]);
+            else
+                SiftDown(position[item]);
+        }
+
+        int Pop(){
+            int top = heap[0];
+            int last = heap.back();
+            heap.pop_back();
+            position[top] = -1;
+            if(!heap.empty()){
+                Place(0, last);
+                SiftDown(0);
+            }
+            return top;
+        }
+};
@@ -0,0 +1,112 @@
+// Shortest path tree from one source, by dense index: hop distances for BFS
+// trees, weighted distances for Dijkstra trees, and the parents of both
+struct ShortestPathTree{
+    std::vector<int> hops;
+    std::vector<double> distances;
+    std::vector<int> parents;
+
+    size_t Bytes() const{
+        return sizeof(ShortestPathTree) + hops.capacity() * sizeof(int) + distances.capacity() * sizeof(double) + parents.capacity() * sizeof(int);
+    }
+};
+
+// LRU cache of shortest path trees keyed by source and search kind, limited
+// to a memory budget in bytes; a budget of 0 disables it. Every entry belongs
+// to the graph version it was computed at, and a lookup at any other version
+// drops the whole cache first, so mutations never serve stale trees
+class ShortestPathCache{
+    private:
+        typedef std::shared_ptr<const ShortestPathTree> Tree;
+        // Most recently used first; the key is source * 2 + weighted
+        std::list<std::pair<long long, Tree>> order;
+        std::unordered_map<long long, std::list<std::pair<long long, Tree>>::iterator> entries;
+        size_t budget;
+        size_t used;
+        long long version;
+        long long hits;
+        long long misses;
+
+        void Evict(){
+            while(used > budget && !order.empty()){
+                used -= order.back().second->Bytes();
+                entries.erase(order.back().first);
+                order.pop_back();
+            }
+        }
+
+    public:
+        ShortestPathCache(): budget(0), used(0), version(-1), hits(0), misses(0) {}
+
+        bool IsEnabled(){
+            return budget > 0;
+        }
+
+        void SetBudget(size_t bytes){
+            budget = bytes;
+            Evict();
+        }
+
+        size_t GetBudget(){
+            return budget;
+        }
+
+        size_t GetBytes(){
+            return used;
+        }
+
+        int GetSize(){
+            return order.size();
+        }
+
+        long long GetHits(){
+            return hits;
+        }
+
+        long long GetMisses(){
+            return misses;
+        }
+
+        void ResetStats(){
+            hits = 0;
+            misses = 0;
+        }
+
+        void Clear(){
+            order.clear();
+            entries.clear();
+            used = 0;
+        }
+
+        // Tree of source at graph version graphVersion, computed by compute on
+        // a miss. Trees larger than the whole budget are returned uncached
+        Tree Get(long long graphVersion, int source, bool weighted, const std::function<void(ShortestPathTree&)>& compute){
+            if(!IsEnabled()){
+                auto tree = std::make_shared<ShortestPathTree>();
+                compute(*tree);
+                return tree;
+            }
+            if(graphVersion != version){
+                Clear();
+                version = graphVersion;
+            }
+
+            long long key = (long long)source * 2 + weighted;
+            auto it = entries.find(key);
+            if(it != entries.end()){
+                hits++;
+                order.splice(order.begin(), order, it->second);
+                return it->second->second;
+            }
+
+            misses++;
+            auto tree = std::make_shared<ShortestPathTree>();
+            compute(*tree);
+            if(tree->Bytes() > budget)
+                return tree;
+            order.emplace_front(key, tree);
+            entries[key] = order.begin();
+            used += tree->Bytes();
+            Evict();
+            return tree;
+        }
+};
\ No newline at end of file
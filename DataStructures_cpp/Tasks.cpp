@@ -0,0 +1,38 @@
+// Run every task on its own thread, the first one on the calling thread. An
+// exception thrown by a task, or by starting its thread, is kept until every
+// started thread has been joined and then rethrown on the calling thread,
+// the earliest task's taking precedence
+inline void RunTasks(std::vector<std::function<void()>>& tasks){
+    std::vector<std::exception_ptr> errors(tasks.size());
+    auto run = [&](size_t i){
+        try{
+            tasks[i]();
+        } catch(...) {
+            errors[i] = std::current_exception();
+        }
+    };
+    std::vector<std::thread> workers;
+    for(size_t i = 1; i < tasks.size(); i++){
+        try{
+            workers.emplace_back(run, i);
+        } catch(...) {
+            errors[i] = std::current_exception();
+            break;
+        }
+    }
+    if(!tasks.empty())
+        run(0);
+    for(std::thread& worker : workers)
+        worker.join();
+    for(std::exception_ptr& error : errors)
+        if(error)
+            std::rethrow_exception(error);
+}
+
+// Thread count to use for a request of threads (0 or less = one per core)
+inline int ResolveThreads(int threads){
+    if(threads > 0)
+        return threads;
+    int available = std::thread::hardware_concurrency();
+    return available > 0 ? available : 1;
+}
@@ -0,0 +1,425 @@
+from __future__ import annotations
+
+import os
+import array
+import ctypes
+from DataStructures_py.Utils import INT_MAX, C_INT_MAX, BFS_COLORS, as_input_array, as_output_array
+from DataStructures_py.LinkedList import LinkedList
+
+# Load the library
+lib = ctypes.CDLL(os.path.join(os.path.dirname(__file__), "../Build/dstructures.so"))
+
+# --- C Library Signatures ---
+lib.Destroy_FrozenGraph.argtypes = [ctypes.c_void_p]
+lib.Destroy_FrozenGraph.restype = None
+
+lib.IsDirected_FrozenGraph.argtypes = [ctypes.c_void_p]
+lib.IsDirected_FrozenGraph.restype = ctypes.c_bool
+
+lib.GetSize_FrozenGraph.argtypes = [ctypes.c_void_p]
+lib.GetSize_FrozenGraph.restype = ctypes.c_int
+
+lib.GetEdgeCount_FrozenGraph.argtypes = [ctypes.c_void_p]
+lib.GetEdgeCount_FrozenGraph.restype = ctypes.c_int
+
+lib.GetIds_FrozenGraph.argtypes = [ctypes.c_void_p, ctypes.POINTER(ctypes.c_int)]
+lib.GetIds_FrozenGraph.restype = None
+
+lib.GetNeighbors_FrozenGraph.argtypes = [ctypes.c_void_p, ctypes.c_int]
+lib.GetNeighbors_FrozenGraph.restype = ctypes.c_void_p
+
+lib.GetVertices_FrozenGraph.argtypes = [ctypes.c_void_p]
+lib.GetVertices_FrozenGraph.restype = ctypes.c_void_p
+
+lib.BFS_FrozenGraph.argtypes = [ctypes.c_void_p, ctypes.c_int, ctypes.POINTER(ctypes.c_int), ctypes.POINTER(ctypes.c_int),
+                                ctypes.POINTER(ctypes.c_ubyte), ctypes.c_bool]
+lib.BFS_FrozenGraph.restype = ctypes.c_bool
+
+lib.MultiSourceBFS_FrozenGraph.argtypes = [ctypes.c_void_p, ctypes.POINTER(ctypes.c_int), ctypes.c_int, ctypes.POINTER(ctypes.c_int),
+                                           ctypes.POINTER(ctypes.c_int)]
+lib.MultiSourceBFS_FrozenGraph.restype = ctypes.c_bool
+
+lib.Distances_FrozenGraph.argtypes = [ctypes.c_void_p, ctypes.POINTER(ctypes.c_int), ctypes.c_int, ctypes.POINTER(ctypes.c_int), ctypes.c_int,
+                                      ctypes.POINTER(ctypes.c_int), ctypes.c_int]
+lib.Distances_FrozenGraph.restype = ctypes.c_bool
+
+lib.AllPairsShortestPaths_FrozenGraph.argtypes = [ctypes.c_void_p, ctypes.POINTER(ctypes.c_int), ctypes.c_int]
+lib.AllPairsShortestPaths_FrozenGraph.restype = ctypes.c_bool
+
+lib.AllPairsMemory_FrozenGraph.argtypes = [ctypes.c_void_p, ctypes.c_int]
+lib.AllPairsMemory_FrozenGraph.restype = ctypes.c_longlong
+
+lib.Dijkstra_FrozenGraph.argtypes = [ctypes.c_void_p, ctypes.c_int, ctypes.POINTER(ctypes.c_double), ctypes.POINTER(ctypes.c_int)]
+lib.Dijkstra_FrozenGraph.restype = ctypes.c_bool
+
+lib.ShortestPath_FrozenGraph.argtypes = [ctypes.c_void_p, ctypes.c_int, ctypes.c_int, ctypes.c_int, ctypes.POINTER(ctypes.c_int),
+                                         ctypes.POINTER(ctypes.c_double)]
+lib.ShortestPath_FrozenGraph.restype = ctypes.c_int
+
+HEURISTIC = ctypes.CFUNCTYPE(ctypes.c_double, ctypes.c_int, ctypes.c_int)
+
+lib.AStar_FrozenGraph.argtypes = [ctypes.c_void_p, ctypes.c_int, ctypes.c_int, HEURISTIC, ctypes.POINTER(ctypes.c_int),
+                                  ctypes.POINTER(ctypes.c_double)]
+lib.AStar_FrozenGraph.restype = ctypes.c_int
+
+# ShortestPathMode values
+_SHORTEST_PATH_BFS = 0
+_SHORTEST_PATH_DIJKSTRA = 1
+_SHORTEST_PATH_BIDIRECTIONAL = 2
+
+lib.GetPath_FrozenGraph.argtypes = [ctypes.c_void_p, ctypes.c_int, ctypes.c_int]
+lib.GetPath_FrozenGraph.restype = ctypes.c_void_p
+
+lib.Distance_FrozenGraph.argtypes = [ctypes.c_void_p, ctypes.c_int, ctypes.c_int]
+lib.Distance_FrozenGraph.restype = ctypes.c_int
+
+lib.GetReachableVertices_FrozenGraph.argtypes = [ctypes.c_void_p, ctypes.c_int]
+lib.GetReachableVertices_FrozenGraph.restype = ctypes.c_void_p
+
+lib.IsConnected_FrozenGraph.argtypes = [ctypes.c_void_p]
+lib.IsConnected_FrozenGraph.restype = ctypes.c_bool
+
+lib.StronglyConnectedComponents_FrozenGraph.argtypes = [ctypes.c_void_p, ctypes.POINTER(ctypes.c_int)]
+lib.StronglyConnectedComponents_FrozenGraph.restype = ctypes.c_int
+
+lib.WeaklyConnectedComponents_FrozenGraph.argtypes = [ctypes.c_void_p, ctypes.POINTER(ctypes.c_int)]
+lib.WeaklyConnectedComponents_FrozenGraph.restype = ctypes.c_int
+
+lib.Condensation_FrozenGraph.argtypes = [ctypes.c_void_p, ctypes.POINTER(ctypes.c_int)]
+lib.Condensation_FrozenGraph.restype = ctypes.c_void_p
+
+lib.TopologicalSort_FrozenGraph.argtypes = [ctypes.c_void_p, ctypes.POINTER(ctypes.c_int)]
+lib.TopologicalSort_FrozenGraph.restype = ctypes.c_int
+
+lib.HasCycle_FrozenGraph.argtypes = [ctypes.c_void_p]
+lib.HasCycle_FrozenGraph.restype = ctypes.c_bool
+
+lib.DAGLongestPath_FrozenGraph.argtypes = [ctypes.c_void_p, ctypes.c_bool, ctypes.POINTER(ctypes.c_int), ctypes.POINTER(ctypes.c_double)]
+lib.DAGLongestPath_FrozenGraph.restype = ctypes.c_int
+
+lib.EdgeWeight_FrozenGraph.argtypes = [ctypes.c_void_p, ctypes.c_int, ctypes.c_int]
+lib.EdgeWeight_FrozenGraph.restype = ctypes.c_double
+
+lib.GraphWeight_FrozenGraph.argtypes = [ctypes.c_void_p]
+lib.GraphWeight_FrozenGraph.restype = ctypes.c_double
+
+def _native_threads(threads: int | None) -> int:
+    """Translate the threads option into a native thread count (0 = all cores)."""
+    if threads is None:
+        return 0
+    if threads < 1:
+        raise ValueError("threads must be a positive integer")
+    return threads
+
+class FrozenGraph:
+    """
+    Immutable graph snapshot stored in compressed sparse row (CSR) form.
+
+    Created with Graph.Freeze(). Vertices are renumbered densely in insertion
+    order and every neighbor list is a contiguous slice of one array, so
+    traversals are far more cache friendly than on the mutable Graph. The
+    query methods mirror those of Graph, and the MST algorithms accept a
+    FrozenGraph directly.
+    """
+    def __init__(self, ptr: ctypes.c_void_p, owner=None) -> None:
+        self.ptr = ptr
+        # A snapshot borrowed from a Graph is freed by that graph, not here
+        self.owner = owner
+
+    def __del__(self) -> None:
+        """Automatically destroy the graph when the object is collected."""
+        if hasattr(self, 'ptr') and self.ptr and getattr(self, 'owner', None) is None:
+            lib.Destroy_FrozenGraph(self.ptr)
+            self.ptr = None
+
+    def IsDirected(self) -> bool:
+        """Check if the graph is directed."""
+        return lib.IsDirected_FrozenGraph(self.ptr)
+
+    def GetSize(self) -> int:
+        """Get the number of vertices in the graph."""
+        return lib.GetSize_FrozenGraph(self.ptr)
+
+    def GetEdgeCount(self) -> int:
+        """Get the number of edges in the graph."""
+        return lib.GetEdgeCount_FrozenGraph(self.ptr)
+
+    def GetIds(self) -> list[int]:
+        """Get the vertex values in dense index order."""
+        ids = (ctypes.c_int * self.GetSize())()
+        lib.GetIds_FrozenGraph(self.ptr, ids)
+        return list(ids)
+
+    def GetNeighbors(self, vertex: int) -> LinkedList | None:
+        """Get the neighbors of a specific vertex."""
+        ll_ptr = lib.GetNeighbors_FrozenGraph(self.ptr, vertex)
+        return LinkedList(ptr=ll_ptr) if ll_ptr else None
+
+    def GetVertices(self) -> LinkedList:
+        """Get all vertices in the graph."""
+        ll_ptr = lib.GetVertices_FrozenGraph(self.ptr)
+        return LinkedList(ptr=ll_ptr)
+
+    def BFS(self, vertex: int) -> tuple[dict[int, str], dict[int, int], dict[int, int | None]]:
+        """Perform Breadth-First Search (BFS) on the graph, in a single native call."""
+        result = self.BFSArrays(vertex, colors=True)
+        if result is None:
+            return {}, {}, {}
+
+        ids, distances_arr, parents_arr, colors_arr = result
+        colors = {}
+        distances = {}
+        parents = {}
+        for i, v_val in enumerate(ids):
+            colors[v_val] = BFS_COLORS[colors_arr[i]]
+            distances[v_val] = INT_MAX if distances_arr[i] == C_INT_MAX else distances_arr[i]
+            parents[v_val] = ids[parents_arr[i]] if parents_arr[i] != -1 else None
+        return colors, distances, parents
+
+    def BFSArrays(self, vertex: int, ids=None, distances=None, parents=None, colors=None,
+                  direction_optimizing: bool = False) -> tuple | None:
+        """
+        Perform BFS and return the results as flat arrays, like Graph.BFSArrays.
+
+        Arrays are indexed by dense vertex index, so ids matches GetIds() and
+        parents[i] is the dense index of the parent of ids[i], or -1. With
+        direction_optimizing, heavy levels are expanded bottom-up.
+        """
+        size = self.GetSize()
+        ids, c_ids = as_output_array(ids, size, ctypes.c_int, "i")
+        distances, c_distances = as_output_array(distances, size, ctypes.c_int, "i")
+        parents, c_parents = as_output_array(parents, size, ctypes.c_int, "i")
+        c_colors = None
+        if colors is not None and colors is not False:
+            colors, c_colors = as_output_array(None if colors is True else colors, size, ctypes.c_ubyte, "B")
+        else:
+            colors = None
+
+        if not lib.BFS_FrozenGraph(self.ptr, vertex, c_distances, c_parents, c_colors, direction_optimizing):
+            return None
+        lib.GetIds_FrozenGraph(self.ptr, c_ids)
+        return ids, distances, parents, colors
+
+    def MultiSourceBFS(self, sources, ids=None, distances=None, parents=None) -> tuple | None:
+        """
+        Perform one BFS seeded with every vertex in sources at once.
+
+        distances[i] is the hop distance from ids[i] to its nearest source
+        (C_INT_MAX if unreachable) and parents[i] the dense index of its BFS
+        parent, -1 for sources and unreachable vertices. Output buffers work as
+        in BFSArrays. Returns (ids, distances, parents), or None if a source
+        does not exist.
+        """
+        c_sources = as_input_array(sources, ctypes.c_int, "i")
+        size = self.GetSize()
+        ids, c_ids = as_output_array(ids, size, ctypes.c_int, "i")
+        distances, c_distances = as_output_array(distances, size, ctypes.c_int, "i")
+        parents, c_parents = as_output_array(parents, size, ctypes.c_int, "i")
+        if not lib.MultiSourceBFS_FrozenGraph(self.ptr, c_sources, len(c_sources), c_distances, c_parents):
+            return None
+        lib.GetIds_FrozenGraph(self.ptr, c_ids)
+        return ids, distances, parents
+
+    def Distances(self, sources, targets, out=None, threads: int | None = None):
+        """
+        Compute the hop distance from every source to every target.
+
+        One BFS runs per distinct source, spread over `threads` native threads
+        (all cores by default). Returns a row-major len(sources) x len(targets)
+        int32 buffer, `out` if given, with C_INT_MAX for unreachable pairs, or
+        None if a vertex does not exist or the native computation failed.
+        """
+        c_sources = as_input_array(sources, ctypes.c_int, "i")
+        c_targets = as_input_array(targets, ctypes.c_int, "i")
+        out, c_out = as_output_array(out, len(c_sources) * len(c_targets), ctypes.c_int, "i")
+        if not lib.Distances_FrozenGraph(self.ptr, c_sources, len(c_sources), c_targets, len(c_targets), c_out,
+                                         _native_threads(threads)):
+            return None
+        return out
+
+    def AllPairsMemory(self, threads: int | None = None) -> int:
+        """Estimate the bytes AllPairsShortestPaths needs: the n x n matrix plus per-thread scratch."""
+        return lib.AllPairsMemory_FrozenGraph(self.ptr, _native_threads(threads))
+
+    def AllPairsShortestPaths(self, out=None, threads: int | None = None, max_bytes: int | None = None) -> tuple | None:
+        """
+        Compute the hop distance between every pair of vertices.
+
+        One BFS per vertex runs across `threads` native threads (all cores by
+        default). The memory estimate of AllPairsMemory is checked first and
+        MemoryError is raised if it exceeds max_bytes. Returns (ids, matrix)
+        where matrix is a row-major n x n int32 buffer, `out` if given, and
+        matrix[i * n + j] is the distance from ids[i] to ids[j], or None if
+        the native computation failed.
+        """
+        native_threads = _native_threads(threads)
+        if max_bytes is not None:
+            estimate = lib.AllPairsMemory_FrozenGraph(self.ptr, native_threads)
+            if estimate > max_bytes:
+                raise MemoryError(f"All-pairs distances need about {estimate} bytes, more than max_bytes={max_bytes}")
+        size = self.GetSize()
+        out, c_out = as_output_array(out, size * size, ctypes.c_int, "i")
+        if not lib.AllPairsShortestPaths_FrozenGraph(self.ptr, c_out, native_threads):
+            return None
+        return array.array("i", self.GetIds()), out
+
+    def Dijkstra(self, source: int) -> tuple[dict[int, float], dict[int, int | None]] | None:
+        """
+        Compute weighted shortest distances from source with Dijkstra's algorithm.
+
+        Returns (distances, parents) keyed by vertex value, with INT_MAX for
+        unreachable vertices, or None if source does not exist or an edge
+        weight is negative.
+        """
+        size = self.GetSize()
+        distances_arr = (ctypes.c_double * size)()
+        parents_arr = (ctypes.c_int * size)()
+        if not lib.Dijkstra_FrozenGraph(self.ptr, source, distances_arr, parents_arr):
+            return None
+
+        ids = self.GetIds()
+        distances = {}
+        parents = {}
+        for i, v_val in enumerate(ids):
+            distances[v_val] = distances_arr[i]
+            parents[v_val] = ids[parents_arr[i]] if parents_arr[i] != -1 else None
+        return distances, parents
+
+    def ShortestPath(self, start: int, end: int, weighted: bool = True,
+                     bidirectional: bool = False) -> tuple[list[int], float] | None:
+        """
+        Find a shortest path from start to end.
+
+        Weighted searches run Dijkstra and stop as soon as end is settled, or
+        a bidirectional Dijkstra when bidirectional is set; unweighted ones
+        count edges with BFS. Returns (path, distance), ([], INT_MAX) if end is
+        unreachable, or None if a vertex does not exist or a weighted search
+        meets a negative edge weight.
+        """
+        if not weighted:
+            mode = _SHORTEST_PATH_BFS
+        elif bidirectional:
+            mode = _SHORTEST_PATH_BIDIRECTIONAL
+        else:
+            mode = _SHORTEST_PATH_DIJKSTRA
+        path = (ctypes.c_int * self.GetSize())()
+        distance = ctypes.c_double()
+        length = lib.ShortestPath_FrozenGraph(self.ptr, start, end, mode, path, ctypes.byref(distance))
+        if length == -1:
+            return None
+        return list(path[:length]), distance.value if length else INT_MAX
+
+    def AStar(self, start: int, end: int, heuristic) -> tuple[list[int], float] | None:
+        """
+        Find a weighted shortest path from start to end with A*.
+
+        heuristic(vertex, end) must never overestimate the remaining distance;
+        it is called at most once per vertex. Returns the same as ShortestPath.
+        """
+        callback = HEURISTIC(heuristic)
+        path = (ctypes.c_int * self.GetSize())()
+        distance = ctypes.c_double()
+        length = lib.AStar_FrozenGraph(self.ptr, start, end, callback, path, ctypes.byref(distance))
+        if length == -1:
+            return None
+        return list(path[:length]), distance.value if length else INT_MAX
+
+    def GetPath(self, start: int, end: int) -> LinkedList | None:
+        """Get the path between two vertices."""
+        ll_ptr = lib.GetPath_FrozenGraph(self.ptr, start, end)
+        return LinkedList(ptr=ll_ptr) if ll_ptr else None
+
+    def Distance(self, start: int, end: int) -> int | float:
+        """Calculate the shortest distance between two vertices."""
+        result = lib.Distance_FrozenGraph(self.ptr, start, end)
+        return INT_MAX if result == C_INT_MAX else result
+
+    def GetReachableVertices(self, vertex: int) -> LinkedList | None:
+        """Get all vertices reachable from a specific vertex."""
+        ll_ptr = lib.GetReachableVertices_FrozenGraph(self.ptr, vertex)
+        return LinkedList(ptr=ll_ptr) if ll_ptr else None
+
+    def IsConnected(self) -> bool:
+        """Check if the graph is connected (strongly connected when directed)."""
+        return lib.IsConnected_FrozenGraph(self.ptr)
+
+    def StronglyConnectedComponents(self, labels=None) -> tuple:
+        """
+        Label every vertex with its strongly connected component.
+
+        Returns (ids, labels, count): labels[i] is the component of ids[i],
+        numbered 0..count-1 in topological order, so edges between components
+        always go from a lower label to a higher one. Undirected graphs get
+        their connected components. `labels` may be a writable int32 buffer.
+        """
+        labels, c_labels = as_output_array(labels, self.GetSize(), ctypes.c_int, "i")
+        count = lib.StronglyConnectedComponents_FrozenGraph(self.ptr, c_labels)
+        return array.array("i", self.GetIds()), labels, count
+
+    def WeaklyConnectedComponents(self, labels=None) -> tuple:
+        """
+        Label every vertex with its weakly connected component, ignoring edge directions.
+
+        Returns (ids, labels, count) like StronglyConnectedComponents, with the
+        components numbered in order of their first vertex.
+        """
+        labels, c_labels = as_output_array(labels, self.GetSize(), ctypes.c_int, "i")
+        count = lib.WeaklyConnectedComponents_FrozenGraph(self.ptr, c_labels)
+        return array.array("i", self.GetIds()), labels, count
+
+    def Condensation(self) -> tuple:
+        """
+        Contract every strongly connected component into a single vertex.
+
+        Returns (ids, labels, dag) where labels are those of
+        StronglyConnectedComponents and dag is a FrozenGraph whose vertex c is
+        component c, with one edge per pair of joined components carrying the
+        lightest weight between them.
+        """
+        labels, c_labels = as_output_array(None, self.GetSize(), ctypes.c_int, "i")
+        dag = FrozenGraph(lib.Condensation_FrozenGraph(self.ptr, c_labels))
+        return array.array("i", self.GetIds()), labels, dag
+
+    def TopologicalSort(self, order=None):
+        """
+        Order the vertices so that every edge goes from an earlier to a later one.
+
+        Uses Kahn's algorithm, taking ready vertices in dense index order.
+        Returns an int32 buffer of vertex values, `order` if given, or None if
+        the graph is undirected or has a cycle.
+        """
+        order, c_order = as_output_array(order, self.GetSize(), ctypes.c_int, "i")
+        if lib.TopologicalSort_FrozenGraph(self.ptr, c_order) == -1:
+            return None
+        return order
+
+    def HasCycle(self) -> bool:
+        """Check if the graph has a cycle (directed cycle when directed)."""
+        return lib.HasCycle_FrozenGraph(self.ptr)
+
+    def DAGLongestPath(self, weighted: bool = True) -> tuple | None:
+        """
+        Find the heaviest path of a directed acyclic graph.
+
+        Path lengths are sums of edge weights, or edge counts when weighted is
+        False, and paths may start at any vertex. Returns (path, length) with
+        path an int32 buffer of vertex values, or None if the graph is
+        undirected or has a cycle.
+        """
+        path = array.array("i", bytes(4 * self.GetSize()))
+        c_path = (ctypes.c_int * len(path)).from_buffer(path)
+        length = ctypes.c_double()
+        count = lib.DAGLongestPath_FrozenGraph(self.ptr, weighted, c_path, ctypes.byref(length))
+        del c_path
+        if count == -1:
+            return None
+        del path[count:]
+        return path, length.value
+
+    def EdgeWeight(self, v: int, u: int) -> float:
+        """Get the weight of an edge."""
+        return lib.EdgeWeight_FrozenGraph(self.ptr, v, u)
+
+    def GraphWeight(self) -> float:
+        """Get the sum of the weights of the edges."""
+        return lib.GraphWeight_FrozenGraph(self.ptr)
\ No newline at end of file
@@ -2,8 +2,9 @@ from __future__ import annotations
 
 import os
 import ctypes
-from DataStructures_py.Utils import INT_MAX, C_INT_MAX
+from DataStructures_py.Utils import INT_MAX, C_INT_MAX, BFS_COLORS, as_input_array, as_output_array
 from DataStructures_py.LinkedList import LinkedList
+from DataStructures_py.FrozenGraph import FrozenGraph
 
 # Load the library
 lib = ctypes.CDLL(os.path.join(os.path.dirname(__file__), "../Build/dstructures.so"))
@@ -48,20 +49,21 @@ lib.DisplayEdges_Graph.restype = None
 lib.Display_Graph.argtypes = [ctypes.c_void_p]
 lib.Display_Graph.restype = None
 
-lib.BFS_Graph.argtypes = [ctypes.c_void_p, ctypes.c_int]
-lib.BFS_Graph.restype = ctypes.c_void_p
+lib.BFSArrays_Graph.argtypes = [ctypes.c_void_p, ctypes.c_int, ctypes.POINTER(ctypes.c_int), ctypes.POINTER(ctypes.c_int),
+                                ctypes.POINTER(ctypes.c_int), ctypes.POINTER(ctypes.c_ubyte), ctypes.c_bool]
+lib.BFSArrays_Graph.restype = ctypes.c_bool
 
-lib.GetBFSColor.argtypes = [ctypes.c_void_p, ctypes.c_int]
-lib.GetBFSColor.restype = ctypes.c_char_p
+lib.Snapshot_Graph.argtypes = [ctypes.c_void_p]
+lib.Snapshot_Graph.restype = ctypes.c_void_p
 
-lib.GetBFSDistance.argtypes = [ctypes.c_void_p, ctypes.c_int]
-lib.GetBFSDistance.restype = ctypes.c_int
+lib.SetCacheBudget_Graph.argtypes = [ctypes.c_void_p, ctypes.c_longlong]
+lib.SetCacheBudget_Graph.restype = None
 
-lib.GetBFSParent.argtypes = [ctypes.c_void_p, ctypes.c_int]
-lib.GetBFSParent.restype = ctypes.c_int
+lib.GetCacheStats_Graph.argtypes = [ctypes.c_void_p, ctypes.POINTER(ctypes.c_longlong)]
+lib.GetCacheStats_Graph.restype = None
 
-lib.Destroy_BFSResult.argtypes = [ctypes.c_void_p]
-lib.Destroy_BFSResult.restype = None
+lib.ResetCacheStats_Graph.argtypes = [ctypes.c_void_p]
+lib.ResetCacheStats_Graph.restype = None
 
 lib.GetPath_Graph.argtypes = [ctypes.c_void_p, ctypes.c_int, ctypes.c_int]
 lib.GetPath_Graph.restype = ctypes.c_void_p
@@ -87,6 +89,18 @@ lib.GraphWeight_Graph.restype = ctypes.c_double
 lib.Clear_Graph.argtypes = [ctypes.c_void_p]
 lib.Clear_Graph.restype = None
 
+lib.FromEdges_Graph.argtypes = [ctypes.POINTER(ctypes.c_int), ctypes.POINTER(ctypes.c_int), ctypes.POINTER(ctypes.c_double),
+                                ctypes.c_int, ctypes.c_bool, ctypes.POINTER(ctypes.c_int), ctypes.c_int, ctypes.c_int,
+                                ctypes.c_int, ctypes.POINTER(ctypes.c_int), ctypes.POINTER(ctypes.c_int)]
+lib.FromEdges_Graph.restype = ctypes.c_void_p
+
+lib.Freeze_Graph.argtypes = [ctypes.c_void_p]
+lib.Freeze_Graph.restype = ctypes.c_void_p
+
+# Duplicate and self-loop policies of Graph.FromEdges, matching the C++ enums
+_DUPLICATE_POLICIES = {"error": 0, "first": 1, "last": 2, "min": 3, "max": 4, "sum": 5}
+_SELF_LOOP_POLICIES = {"error": 0, "drop": 1}
+
 class Graph:
     """
     Graph operations for graph data structures.
@@ -157,32 +171,134 @@ class Graph:
 
     def BFS(self, vertex: int) -> tuple[dict[int, str], dict[int, int], dict[int, int | None]]:
         """Perform Breadth-First Search (BFS) on the graph."""
-        res_ptr = lib.BFS_Graph(self.ptr, vertex)
-        if res_ptr is None:
+        result = self.BFSArrays(vertex, colors=True)
+        if result is None:
             return {}, {}, {}
-        
+
+        ids, distances_arr, parents_arr, colors_arr = result
         colors = {}
         distances = {}
         parents = {}
-        
-        try:
-            ll = self.GetVertices()
-            if ll:
-                current = ll.GetHead()
-                while current:
-                    v_val = current.GetData()
-                    colors[v_val] = lib.GetBFSColor(res_ptr, v_val).decode('utf-8')
-                    dist = lib.GetBFSDistance(res_ptr, v_val)
-                    distances[v_val] = dist if dist != C_INT_MAX else INT_MAX
-                    
-                    parent_val = lib.GetBFSParent(res_ptr, v_val)
-                    parents[v_val] = parent_val if parent_val != -1 else None
-                    
-                    current = current.GetNext()
-            
-            return colors, distances, parents
-        finally:
-            lib.Destroy_BFSResult(res_ptr)
+        for i, v_val in enumerate(ids):
+            colors[v_val] = BFS_COLORS[colors_arr[i]]
+            distances[v_val] = INT_MAX if distances_arr[i] == C_INT_MAX else distances_arr[i]
+            parents[v_val] = ids[parents_arr[i]] if parents_arr[i] != -1 else None
+        return colors, distances, parents
+
+    def BFSArrays(self, vertex: int, ids=None, distances=None, parents=None, colors=None,
+                  direction_optimizing: bool = False) -> tuple | None:
+        """
+        Perform BFS and return the results as flat arrays, in a single native call.
+
+        Parameters
+        ----------
+        vertex : int
+            The source vertex.
+        ids, distances, parents : writable int32 buffer, optional
+            Output buffers of at least GetSize() elements, e.g. array.array('i')
+            or NumPy int32 arrays. New array.array('i') objects are allocated
+            for those not given.
+        colors : bool or writable uint8 buffer, optional
+            If True (or a buffer), also fill the final colors as indices into
+            Utils.BFS_COLORS (0 = white, 2 = black); skipped by default.
+        direction_optimizing : bool, optional
+            Expand levels with a heavy frontier bottom-up, where every unvisited
+            vertex looks for a parent in the frontier. Much faster on large
+            low-diameter graphs; distances are identical, but a vertex with
+            several parents in the previous level may report a different one.
+
+        Returns
+        -------
+        tuple
+            (ids, distances, parents, colors). ids[i] is the i-th vertex,
+            distances[i] its distance from `vertex` (C_INT_MAX if unreachable)
+            and parents[i] the index into ids of its parent, or -1. colors is
+            None unless requested. None if `vertex` does not exist.
+
+        Notes
+        -----
+        - Time complexity: O(V + E); the graph's CSR snapshot is rebuilt first
+            if it changed since the last traversal
+        """
+        size = self.GetSize()
+        ids, c_ids = as_output_array(ids, size, ctypes.c_int, "i")
+        distances, c_distances = as_output_array(distances, size, ctypes.c_int, "i")
+        parents, c_parents = as_output_array(parents, size, ctypes.c_int, "i")
+        c_colors = None
+        if colors is not None and colors is not False:
+            colors, c_colors = as_output_array(None if colors is True else colors, size, ctypes.c_ubyte, "B")
+        else:
+            colors = None
+
+        if not lib.BFSArrays_Graph(self.ptr, vertex, c_ids, c_distances, c_parents, c_colors, direction_optimizing):
+            return None
+        return ids, distances, parents, colors
+
+    def _snapshot(self) -> FrozenGraph:
+        """
+        Get the graph's cached FrozenGraph snapshot, rebuilt after mutations.
+
+        The snapshot is borrowed from this graph and freed by the first query
+        after the next mutation, so it is only used for the duration of one
+        delegated call; Freeze() returns an independent copy.
+        """
+        return FrozenGraph(lib.Snapshot_Graph(self.ptr), owner=self)
+
+    def GetIds(self) -> list[int]:
+        """Get the vertex values in insertion order, see FrozenGraph.GetIds."""
+        return self._snapshot().GetIds()
+
+    def MultiSourceBFS(self, sources, ids=None, distances=None, parents=None) -> tuple | None:
+        """Perform one BFS from all sources at once, see FrozenGraph.MultiSourceBFS."""
+        return self._snapshot().MultiSourceBFS(sources, ids, distances, parents)
+
+    def Distances(self, sources, targets, out=None, threads: int | None = None):
+        """Compute hop distances from every source to every target, see FrozenGraph.Distances."""
+        return self._snapshot().Distances(sources, targets, out, threads)
+
+    def AllPairsShortestPaths(self, out=None, threads: int | None = None, max_bytes: int | None = None) -> tuple | None:
+        """Compute hop distances between all pairs of vertices, see FrozenGraph.AllPairsShortestPaths."""
+        return self._snapshot().AllPairsShortestPaths(out, threads, max_bytes)
+
+    def EnableCache(self, max_bytes: int = 64 * 1024 * 1024) -> None:
+        """
+        Cache shortest path trees per source, within max_bytes of memory.
+
+        GetPath, Distance, GetReachableVertices, Dijkstra and ShortestPath
+        then reuse the BFS or Dijkstra tree of a recently queried source,
+        evicting the least recently used trees beyond the budget. Any mutation
+        of the graph invalidates every cached tree.
+        """
+        if max_bytes < 1:
+            raise ValueError("max_bytes must be a positive integer")
+        lib.SetCacheBudget_Graph(self.ptr, max_bytes)
+
+    def DisableCache(self) -> None:
+        """Stop caching shortest path trees and free the cached ones."""
+        lib.SetCacheBudget_Graph(self.ptr, 0)
+
+    def CacheStats(self) -> dict[str, int]:
+        """Get the shortest path cache hits, misses, entries, bytes used and budget."""
+        stats = (ctypes.c_longlong * 5)()
+        lib.GetCacheStats_Graph(self.ptr, stats)
+        return dict(zip(("hits", "misses", "entries", "bytes", "budget"), stats))
+
+    def ResetCacheStats(self) -> None:
+        """Reset the shortest path cache hit and miss counters."""
+        lib.ResetCacheStats_Graph(self.ptr)
+
+    def Dijkstra(self, source: int) -> tuple[dict[int, float], dict[int, int | None]] | None:
+        """Compute weighted shortest distances from source, see FrozenGraph.Dijkstra."""
+        return self._snapshot().Dijkstra(source)
+
+    def ShortestPath(self, start: int, end: int, weighted: bool = True,
+                     bidirectional: bool = False) -> tuple[list[int], float] | None:
+        """Find a shortest path from start to end, see FrozenGraph.ShortestPath."""
+        return self._snapshot().ShortestPath(start, end, weighted, bidirectional)
+
+    def AStar(self, start: int, end: int, heuristic) -> tuple[list[int], float] | None:
+        """Find a weighted shortest path from start to end with A*, see FrozenGraph.AStar."""
+        return self._snapshot().AStar(start, end, heuristic)
 
     def GetPath(self, start: int, end: int) -> LinkedList | None:
         """Get the path between two vertices."""
@@ -203,6 +319,30 @@ class Graph:
         """Check if the graph is connected."""
         return lib.IsConnected_Graph(self.ptr)
 
+    def StronglyConnectedComponents(self, labels=None) -> tuple:
+        """Label vertices with their strongly connected component, see FrozenGraph.StronglyConnectedComponents."""
+        return self._snapshot().StronglyConnectedComponents(labels)
+
+    def WeaklyConnectedComponents(self, labels=None) -> tuple:
+        """Label vertices with their weakly connected component, see FrozenGraph.WeaklyConnectedComponents."""
+        return self._snapshot().WeaklyConnectedComponents(labels)
+
+    def Condensation(self) -> tuple:
+        """Contract strongly connected components into a DAG, see FrozenGraph.Condensation."""
+        return self._snapshot().Condensation()
+
+    def TopologicalSort(self, order=None):
+        """Order the vertices of a DAG topologically, see FrozenGraph.TopologicalSort."""
+        return self._snapshot().TopologicalSort(order)
+
+    def HasCycle(self) -> bool:
+        """Check if the graph has a cycle."""
+        return self._snapshot().HasCycle()
+
+    def DAGLongestPath(self, weighted: bool = True) -> tuple | None:
+        """Find the heaviest path of a DAG, see FrozenGraph.DAGLongestPath."""
+        return self._snapshot().DAGLongestPath(weighted)
+
     def GetTransposed(self) -> Graph | None:
         """Get the transposed graph."""
         g_ptr = lib.GetTransposed_Graph(self.ptr)
@@ -219,3 +359,82 @@ class Graph:
     def Clear(self) -> None:
         """Clear all vertices and edges from the graph."""
         lib.Clear_Graph(self.ptr)
+
+    def Freeze(self) -> FrozenGraph:
+        """Get an immutable CSR snapshot of the graph for fast repeated queries."""
+        return FrozenGraph(lib.Freeze_Graph(self.ptr))
+
+    @staticmethod
+    def FromEdges(src, dst, weights=None, directed: bool = False, vertices=None,
+                  duplicates: str = "first", self_loops: str = "drop") -> tuple[Graph, dict]:
+        """
+        Build a graph from edge arrays in a single native call.
+
+        Parameters
+        ----------
+        src, dst : list[int] or buffer
+            Endpoints of the edges, e.g. array.array('i') or int32 NumPy arrays,
+            which are passed to C++ without a copy. Missing vertices are created
+            in order of first appearance.
+        weights : list[float] or buffer, optional
+            Edge weights (float64 buffers are passed without a copy). Edges are
+            unweighted (weight 0) when omitted.
+        directed : bool, optional
+            Whether the graph is directed.
+        vertices : list[int] or buffer, optional
+            Vertices to create before the edges, e.g. isolated vertices.
+        duplicates : str, optional
+            What to do with an edge that already exists: "first" keeps the
+            first weight (default), "last" keeps the last one, "min", "max" and
+            "sum" combine them, and "error" raises ValueError.
+        self_loops : str, optional
+            "drop" (default) skips edges from a vertex to itself, "error" raises
+            ValueError. Graph does not store self-loops.
+
+        Returns
+        -------
+        tuple
+            The graph and a summary dict with the number of "vertices" and
+            "edges" created, the number of rejected "duplicates" and
+            "self_loops", and the input indices of all "rejected" edges.
+
+        Notes
+        -----
+        - Time complexity: O(V + E) expected
+        - Nothing is printed; invalid edges are only reported in the summary
+        """
+        if duplicates not in _DUPLICATE_POLICIES:
+            raise ValueError(f"Unknown duplicate policy '{duplicates}', expected one of {', '.join(_DUPLICATE_POLICIES)}")
+        if self_loops not in _SELF_LOOP_POLICIES:
+            raise ValueError(f"Unknown self-loop policy '{self_loops}', expected one of {', '.join(_SELF_LOOP_POLICIES)}")
+
+        c_src = as_input_array(src, ctypes.c_int, "il")
+        c_dst = as_input_array(dst, ctypes.c_int, "il")
+        count = len(c_src)
+        if len(c_dst) != count:
+            raise ValueError("Graph.FromEdges requires src and dst of the same length")
+        c_weights = None
+        if weights is not None:
+            c_weights = as_input_array(weights, ctypes.c_double, "d")
+            if len(c_weights) != count:
+                raise ValueError("Graph.FromEdges requires one weight per edge")
+        c_vertices = as_input_array(vertices if vertices is not None else [], ctypes.c_int, "il")
+
+        rejected = (ctypes.c_int * max(count, 1))()
+        summary = (ctypes.c_int * 2)()
+        ptr = lib.FromEdges_Graph(c_src, c_dst, c_weights, count, directed, c_vertices, len(c_vertices),
+                                  _DUPLICATE_POLICIES[duplicates], _SELF_LOOP_POLICIES[self_loops], rejected, summary)
+        if not ptr:
+            index = rejected[0]
+            cause = "is a self-loop" if c_src[index] == c_dst[index] else "already exists"
+            raise ValueError(f"Edge {index} ({c_src[index]}, {c_dst[index]}) {cause}")
+
+        graph = Graph(ptr=ptr)
+        count_rejected = summary[0] + summary[1]
+        return graph, {
+            "vertices": graph.GetSize(),
+            "edges": count - count_rejected,
+            "duplicates": summary[0],
+            "self_loops": summary[1],
+            "rejected": rejected[:count_rejected],
+        }
\ No newline at end of file
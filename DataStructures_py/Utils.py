@@ -1,9 +1,66 @@
 """
-Shared utility constants for Python wrappers.
+Shared utility constants and helpers for Python wrappers.
 """
+import sys
+import array
+import ctypes
+import struct
 
 INT_MAX = float("inf")
 INT_MIN = float("-inf")
 
 C_INT_MAX = 2147483647
 C_INT_MIN = -2147483648
+
+
+C_LONG_LONG_MAX = 9223372036854775807
+C_LONG_LONG_MIN = -9223372036854775808
+
+# Names of the BFSColor values filled by the array BFS modes
+BFS_COLORS = ("white", "gray", "black")
+
+# Buffer format prefixes that denote native byte order on this machine
+NATIVE_PREFIXES = "@=" + ("<" if sys.byteorder == "little" else ">")
+
+def as_input_array(values, c_type, formats: str):
+    """
+    Return a ctypes array of `c_type` holding `values`.
+
+    Contiguous buffers whose format is one of `formats` in native byte order
+    with the matching item size are wrapped without a copy (or copied with one
+    memcpy when read-only); lists and other buffers, including buffers in the
+    other byte order, are converted element by element.
+    """
+    try:
+        view = memoryview(values)
+    except TypeError:
+        return (c_type * len(values))(*values)
+
+    if view.ndim != 1:
+        raise TypeError("Expected a one-dimensional buffer")
+    if view.c_contiguous and view.format.lstrip(NATIVE_PREFIXES) in formats and view.itemsize == ctypes.sizeof(c_type):
+        array_type = c_type * len(view)
+        return array_type.from_buffer_copy(view) if view.readonly else array_type.from_buffer(view)
+    try:
+        items = view.tolist()
+    except NotImplementedError:
+        # memoryview only decodes native formats; the other byte order goes through struct
+        items = [item[0] for item in struct.iter_unpack(view.format, view.tobytes())]
+    return (c_type * len(view))(*items)
+
+def as_output_array(buffer, size: int, c_type, typecode: str):
+    """
+    Return (python_object, ctypes_array) for an output of `size` elements.
+
+    A new array.array of `typecode` is allocated when `buffer` is None;
+    otherwise `buffer` must be a writable contiguous buffer with room for
+    `size` elements of `c_type`, and is filled in place.
+    """
+    if buffer is None:
+        buffer = array.array(typecode, bytes(size * ctypes.sizeof(c_type)))
+    view = memoryview(buffer)
+    if view.readonly or view.ndim != 1 or not view.c_contiguous or view.itemsize != ctypes.sizeof(c_type):
+        raise TypeError(f"Expected a writable one-dimensional buffer of {ctypes.sizeof(c_type)}-byte elements")
+    if len(view) < size:
+        raise ValueError(f"Output buffer must hold at least {size} elements")
+    return buffer, (c_type * len(view)).from_buffer(view)
\ No newline at end of file
@@ -0,0 +1,40 @@
+"""
+Benchmark the serial and parallel paths of Sorts.MergeSort and Sorts.QuickSort.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_sorts [size] [threads]
+"""
+import os
+import sys
+import time
+import array
+import random
+from Algos import Sorts
+
+def best_of(runs: int, sort, data: array.array, **options) -> float:
+    """Return the best wall time of sorting a fresh copy of `data` in place."""
+    best = float("inf")
+    for _ in range(runs):
+        values = array.array(data.typecode, data)
+        start = time.perf_counter()
+        sort(values, inplace=True, **options)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def main() -> None:
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 5_000_000
+    threads = int(sys.argv[2]) if len(sys.argv) > 2 else (os.cpu_count() or 1)
+
+    random.seed(0)
+    data = array.array("i", (random.randint(-2 ** 31, 2 ** 31 - 1) for _ in range(size)))
+
+    print(f"{size} random int32 values, {threads} threads")
+    for name in ("MergeSort", "QuickSort"):
+        sort = getattr(Sorts, name)
+        serial = best_of(3, sort, data)
+        parallel = best_of(3, sort, data, threads=threads)
+        print(f"{name:>10}: serial {serial:.3f}s, parallel {parallel:.3f}s, speedup {serial / parallel:.2f}x")
+
+if __name__ == "__main__":
+    main()
@@ -1,3 +1,3 @@
-g++ -shared -fPIC -o Build/dstructures.so Build/dstructures.cpp
+g++ -O2 -pthread -shared -fPIC -o Build/dstructures.so Build/dstructures.cpp
 
-g++ -shared -fPIC -o Build/algos.so Build/algos.cpp
\ No newline at end of file
+g++ -O2 -pthread -shared -fPIC -o Build/algos.so Build/algos.cpp
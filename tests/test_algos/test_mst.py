@@ -1,5 +1,5 @@
 import unittest
-from Algos import MST
+from Algos import MST, DynamicMST
 from DataStructures import Graph
 
 class TestMST(unittest.TestCase):
@@ -105,5 +105,132 @@ class TestMST(unittest.TestCase):
         mst = MST.Prim(g)
         self.assertIsNone(mst)
 
+    def test_kruskal_ties_follow_edge_order(self):
+        # A 4-cycle of equal weights: the last edge inserted is the one left out
+        g, _ = Graph.FromEdges([0, 1, 2, 3], [1, 2, 3, 0], [2.0, 2.0, 2.0, 2.0])
+        mst = MST.Kruskal(g)
+        self.assertEqual(mst.GraphWeight(), 6.0)
+        self.assertEqual(mst.EdgeWeight(3, 0), -1)
+
+        n = 300
+        big, _ = Graph.FromEdges(list(range(n - 1)), list(range(1, n)), [float(v % 3) for v in range(n - 1)])
+        self.assertEqual(MST.Kruskal(big).GraphWeight(), sum(v % 3 for v in range(n - 1)))
+
+    def test_boruvka_matches_kruskal(self):
+        # Enough edges for several threads, with many tied weights
+        n = 40000
+        src = list(range(1, n)) + [(v * 7919) % n for v in range(2 * n)]
+        dst = [v // 2 for v in range(1, n)] + [(v * 104729 + 1) % n for v in range(2 * n)]
+        weights = [float(v % 5) for v in range(len(src))]
+        g, _ = Graph.FromEdges(src, dst, weights)
+
+        kruskal = MST.Kruskal(g).Freeze()
+        boruvka = MST.Boruvka(g, threads=4).Freeze()
+        self.assertEqual(boruvka.GetSize(), n)
+        self.assertEqual(boruvka.GraphWeight(), kruskal.GraphWeight())
+        self.assertEqual([list(a) for a in boruvka.BFSArrays(0)[:3]], [list(a) for a in kruskal.BFSArrays(0)[:3]])
+
+        directed, _ = Graph.FromEdges([0], [1], directed=True)
+        self.assertIsNone(MST.Boruvka(directed))
+        with self.assertRaises(ValueError):
+            MST.Boruvka(g, threads=0)
+
+    def test_boruvka_small_graphs(self):
+        g, _ = Graph.FromEdges([0, 1, 0], [1, 2, 2], [1.0, 1.0, 1.0], vertices=range(4))
+        self.assertIsNone(MST.Boruvka(g))
+        g.CreateWeightedEdge(2, 3, 2.0)
+        self.assertEqual(MST.Boruvka(g).GraphWeight(), 4.0)
+        self.assertEqual(MST.Boruvka(Graph()).GetSize(), 0)
+
+    def test_minimum_spanning_forest(self):
+        # Triangle {0, 1, 2}, edge {3, 4} and an isolated vertex 5
+        g, _ = Graph.FromEdges([0, 1, 0, 3], [1, 2, 2, 4], [1.0, 2.0, 5.0, 7.0], vertices=range(6))
+        src, dst, weights, component_weights = MST.MinimumSpanningForest(g)
+        self.assertEqual(list(zip(src, dst, weights)), [(0, 1, 1.0), (1, 2, 2.0), (3, 4, 7.0)])
+        self.assertEqual(list(component_weights), [3.0, 7.0, 0.0])
+
+        forest, component_weights = MST.MinimumSpanningForest(g.Freeze(), output="graph")
+        self.assertEqual(forest.GetSize(), 6)
+        self.assertEqual(forest.GraphWeight(), 10.0)
+        self.assertEqual(len(component_weights), 3)
+
+        self.assertIsNone(MST.MinimumSpanningForest(Graph(directed=True)))
+        with self.assertRaises(ValueError):
+            MST.MinimumSpanningForest(g, output="tree")
+
+    def test_dynamic_mst(self):
+        # Path 0 - 1 - 2 - 3 with weights 4, 5, 6
+        g, _ = Graph.FromEdges([0, 1, 2], [1, 2, 3], [4.0, 5.0, 6.0])
+        forest = DynamicMST(g)
+        self.assertEqual((forest.GetSize(), forest.GetEdgeCount(), forest.GraphWeight()), (4, 3, 15.0))
+
+        # Closing the cycle 0-1-2-3 with a lighter edge drops the weight-6 edge
+        self.assertEqual(forest.AddEdge(3, 0, 1.0), (True, (2, 3, 6.0)))
+        self.assertEqual(forest.GraphWeight(), 10.0)
+        # A heavier or equal edge on a cycle is not added
+        self.assertEqual(forest.AddEdge(0, 2, 5.0), (False, None))
+        # A new vertex joins its tree
+        self.assertEqual(forest.AddEdge(3, 9, 2.0), (True, None))
+        self.assertEqual(forest.GraphWeight(), 12.0)
+        self.assertFalse(forest.AddEdge(9, 9, 0.0)[0])
+
+        forest.AddVertex(7)
+        self.assertFalse(forest.IsConnected(0, 7))
+        self.assertTrue(forest.IsConnected(0, 9))
+        self.assertIsNone(forest.IsConnected(0, 42))
+
+        src, dst, weights = forest.GetEdges()
+        self.assertEqual(list(zip(src, dst, weights)), [(0, 1, 4.0), (1, 2, 5.0), (3, 0, 1.0), (3, 9, 2.0)])
+        self.assertEqual(forest.ToGraph().GraphWeight(), 12.0)
+
+        g.CreateVertex(9)
+        g.CreateWeightedEdge(3, 0, 1.0)
+        g.CreateWeightedEdge(0, 2, 5.0)
+        g.CreateWeightedEdge(3, 9, 2.0)
+        self.assertEqual(MST.Kruskal(g).GraphWeight(), forest.GraphWeight())
+
+        with self.assertRaises(ValueError):
+            DynamicMST(Graph.FromEdges([0], [1], directed=True)[0])
+
+    def test_prim_large_graph(self):
+        # A path 0 - 1 - ... - 499 of weight 1 plus heavier chords, with
+        # many equal keys in the heap at once
+        n = 500
+        src = list(range(n - 1)) + [v for v in range(0, n - 2, 2)]
+        dst = list(range(1, n)) + [v + 2 for v in range(0, n - 2, 2)]
+        weights = [1.0] * (n - 1) + [5.0] * ((n - 1) // 2)
+        g, _ = Graph.FromEdges(src, dst, weights)
+
+        mst = MST.Prim(g)
+        self.assertIsNotNone(mst)
+        self.assertEqual(mst.GetSize(), n)
+        self.assertEqual(mst.GraphWeight(), n - 1)
+        self.assertEqual(mst.GraphWeight(), MST.Kruskal(g).GraphWeight())
+
+    def test_frozen_graph(self):
+        g = Graph(directed=False)
+        for i in range(5):
+            g.CreateVertex(i)
+        g.CreateWeightedEdge(0, 1, 10.0)
+        g.CreateWeightedEdge(0, 2, 6.0)
+        g.CreateWeightedEdge(0, 3, 5.0)
+        g.CreateWeightedEdge(1, 3, 15.0)
+        g.CreateWeightedEdge(2, 3, 4.0)
+        g.CreateWeightedEdge(3, 4, 1.0)
+        frozen = g.Freeze()
+
+        for algorithm in (MST.Kruskal, MST.Prim):
+            mst = algorithm(frozen)
+            self.assertIsNotNone(mst)
+            self.assertEqual(mst.GetSize(), 5)
+            self.assertEqual(mst.GraphWeight(), 20.0)
+            self.assertEqual(mst.EdgeWeight(3, 4), 1.0)
+            self.assertEqual(mst.EdgeWeight(0, 2), -1.0)
+
+        g.DeleteEdge(3, 4)
+        frozen = g.Freeze()
+        self.assertIsNone(MST.Kruskal(frozen))
+        self.assertIsNone(MST.Prim(frozen))
+
 if __name__ == "__main__":
     unittest.main()
@@ -1,3 +1,7 @@
+import os
+import array
+import itertools
+import tempfile
 import unittest
 from Algos import Sorts
 
@@ -33,6 +37,53 @@ class TestSorts(unittest.TestCase):
         self.assertEqual(Sorts.QuickSort([]), [])
         self.assertEqual(Sorts.QuickSort([1]), [1])
 
+    def test_merge_sort_runs_and_buffer(self):
+        n = 5000
+        ascending = list(range(n))
+        self.assertEqual(Sorts.MergeSort(ascending[::-1]), ascending)
+
+        runs = list(range(0, n, 2)) + list(range(1, n, 2))
+        self.assertEqual(Sorts.MergeSort(runs), ascending)
+
+        extremes = [2147483647, -2147483648, 2147483647, 0, -2147483648]
+        self.assertEqual(Sorts.MergeSort(extremes), sorted(extremes))
+
+        scratch = array.array('i', [0] * n)
+        values = array.array('i', runs)
+        Sorts.MergeSort(values, inplace=True, buffer=scratch)
+        self.assertEqual(list(values), ascending)
+
+        with self.assertRaises(ValueError):
+            Sorts.MergeSort(values, buffer=array.array('i', [0]))
+        with self.assertRaises(ValueError):
+            Sorts.MergeSort([3, 1, 2], buffer=[0], threads=2)
+
+        # The parallel sort merges through the caller's buffer too
+        large = array.array('q', [(i * 7919) % 100003 - 50000 for i in range(100000)])
+        expected = sorted(large)
+        scratch = array.array('q', [0] * len(large))
+        Sorts.MergeSort(large, inplace=True, buffer=scratch, threads=4)
+        self.assertEqual(list(large), expected)
+
+    def test_lomuto_quick_sort(self):
+        self.assertEqual(Sorts.LomutoQuickSort(self.unsorted), self.sorted)
+        self.assertEqual(Sorts.LomutoQuickSort(self.reverse), self.sorted)
+        self.assertEqual(Sorts.LomutoQuickSort(self.duplicates), self.sorted_duplicates)
+        self.assertEqual(Sorts.LomutoQuickSort([]), [])
+
+    def test_quick_sort_adversarial_inputs(self):
+        n = 200000
+        ascending = list(range(n))
+        self.assertEqual(Sorts.QuickSort(ascending), ascending)
+        self.assertEqual(Sorts.QuickSort(ascending[::-1]), ascending)
+        self.assertEqual(Sorts.QuickSort([7] * n), [7] * n)
+
+        organ_pipe = list(range(n // 2)) + list(range(n // 2, 0, -1))
+        self.assertEqual(Sorts.QuickSort(organ_pipe), sorted(organ_pipe))
+
+        few_unique = [(i * 7919) % 5 for i in range(n)]
+        self.assertEqual(Sorts.QuickSort(few_unique), sorted(few_unique))
+
     def test_counting_sort(self):
         self.assertEqual(Sorts.CountingSort(self.unsorted), self.sorted)
         self.assertEqual(Sorts.CountingSort(self.sorted), self.sorted)
@@ -41,7 +92,42 @@ class TestSorts(unittest.TestCase):
         self.assertEqual(Sorts.CountingSort([]), [])
         self.assertEqual(Sorts.CountingSort([1]), [1])
         
-        self.assertIsNone(Sorts.CountingSort([-1, 2, 3]))
+        self.assertEqual(Sorts.CountingSort([3, -1, 2]), [-1, 2, 3])
+
+    def test_counting_sort_offset_range(self):
+        shifted = [2000000003, 2000000001, 2000000002, 2000000001]
+        self.assertEqual(Sorts.CountingSort(shifted), sorted(shifted))
+        self.assertEqual(Sorts.CountingSort([-5, -1, -3]), [-5, -3, -1])
+        self.assertIsNone(Sorts.CountingSort([-2000000000, 2000000000]))
+
+    def test_counting_sort_int64_extreme_range(self):
+        self.assertIsNone(Sorts.CountingSort(array.array('q', [-2 ** 63, 2 ** 63 - 1, 3])))
+        self.assertIsNone(Sorts.CountingSort(array.array('q', [-2 ** 62, 2 ** 62 + 5])))
+        self.assertIsNone(Sorts.CountingSort([-2 ** 63, 2 ** 63 - 1]))
+        near_max = array.array('q', [2 ** 63 - 1, 2 ** 63 - 3, 2 ** 63 - 2])
+        self.assertEqual(Sorts.CountingSort(near_max), sorted(near_max))
+        near_min = array.array('q', [-2 ** 63 + 2, -2 ** 63, -2 ** 63 + 1])
+        self.assertEqual(Sorts.CountingSort(near_min), sorted(near_min))
+
+    def test_radix_sort(self):
+        self.assertEqual(Sorts.RadixSort(self.unsorted), self.sorted)
+        self.assertEqual(Sorts.RadixSort(self.duplicates), self.sorted_duplicates)
+        self.assertEqual(Sorts.RadixSort([]), [])
+
+        mixed = [2147483647, -2147483648, 0, -1, 1, 123456789, -987654321]
+        self.assertEqual(Sorts.RadixSort(mixed), sorted(mixed))
+
+        wide = [2 ** 62, -(2 ** 63), 5, -(2 ** 40), 2 ** 63 - 1, 0]
+        self.assertEqual(Sorts.RadixSort(wide), sorted(wide))
+
+    def test_radix_sort_buffers(self):
+        buf32 = array.array('i', [5, -3, 2000000000, -2000000000, 0])
+        Sorts.RadixSort(buf32, inplace=True)
+        self.assertEqual(list(buf32), [-2000000000, -3, 0, 5, 2000000000])
+
+        buf64 = array.array('q', [2 ** 40, -(2 ** 50), 7, -7])
+        self.assertIs(Sorts.RadixSort(buf64, inplace=True), buf64)
+        self.assertEqual(list(buf64), [-(2 ** 50), -7, 7, 2 ** 40])
 
     def test_identical_elements(self):
         identical = [5, 5, 5, 5, 5]
@@ -72,5 +158,304 @@ class TestSorts(unittest.TestCase):
         self.assertEqual(Sorts.QuickSort(large_array), expected)
         self.assertEqual(Sorts.CountingSort(large_array), expected)
 
+    def test_buffer_input_returns_new_list(self):
+        buf = array.array('i', self.unsorted)
+        self.assertEqual(Sorts.QuickSort(buf), self.sorted)
+        self.assertEqual(list(buf), self.unsorted)
+        self.assertEqual(Sorts.MergeSort(memoryview(buf)), self.sorted)
+        self.assertEqual(Sorts.InsertionSort(buf), self.sorted)
+        self.assertEqual(Sorts.CountingSort(buf), self.sorted)
+
+    def test_inplace_buffers(self):
+        for sort in (Sorts.InsertionSort, Sorts.MergeSort, Sorts.QuickSort, Sorts.CountingSort):
+            buf = array.array('i', self.duplicates)
+            result = sort(buf, inplace=True)
+            self.assertIs(result, buf)
+            self.assertEqual(list(buf), self.sorted_duplicates)
+
+    def test_inplace_memoryview_and_bytearray(self):
+        buf = array.array('i', self.reverse)
+        view = memoryview(buf)
+        self.assertIs(Sorts.QuickSort(view, inplace=True), view)
+        self.assertEqual(list(buf), self.sorted)
+
+        raw = bytearray(array.array('i', self.unsorted).tobytes())
+        Sorts.MergeSort(raw, inplace=True)
+        self.assertEqual(list(memoryview(raw).cast('i')), self.sorted)
+
+    def test_inplace_list(self):
+        values = list(self.unsorted)
+        self.assertIs(Sorts.QuickSort(values, inplace=True), values)
+        self.assertEqual(values, self.sorted)
+
+    def test_invalid_buffers(self):
+        with self.assertRaises(TypeError):
+            Sorts.QuickSort(array.array('h', [1, 2]))
+        with self.assertRaises(TypeError):
+            Sorts.QuickSort(bytes(array.array('i', [2, 1])), inplace=True)
+        with self.assertRaises(TypeError):
+            Sorts.QuickSort((2, 1), inplace=True)
+
+    def test_argsort_all_algorithms(self):
+        keys = [30, -10, 20, -10, 30, 0]
+        for algorithm in ("insertion", "merge", "quick", "lomuto", "counting", "radix"):
+            idx = Sorts.ArgSort(keys, algorithm=algorithm)
+            self.assertEqual(sorted(idx), list(range(len(keys))))
+            self.assertEqual([keys[i] for i in idx], sorted(keys))
+
+        self.assertEqual(Sorts.ArgSort(keys), [1, 3, 5, 2, 0, 4])
+        self.assertEqual(Sorts.ArgSort([]), [])
+        with self.assertRaises(ValueError):
+            Sorts.ArgSort(keys, algorithm="bogo")
+
+    def test_argsort_out_buffer(self):
+        keys = array.array('q', [2 ** 40, -5, 3])
+        out = array.array('i', [0, 0, 0])
+        self.assertIs(Sorts.ArgSort(keys, algorithm="radix", out=out), out)
+        self.assertEqual(list(out), [1, 2, 0])
+
+    def test_sort_by_key_is_stable(self):
+        keys = [3, 1, 2, 1, 3, 1]
+        values = [0, 1, 2, 3, 4, 5]
+        for algorithm in ("insertion", "merge", "counting", "radix"):
+            sorted_keys, sorted_values = Sorts.SortByKey(keys, values, algorithm=algorithm)
+            self.assertEqual(sorted_keys, [1, 1, 1, 2, 3, 3])
+            self.assertEqual(sorted_values, [1, 3, 5, 2, 0, 4])
+
+        for algorithm in ("quick", "lomuto"):
+            sorted_keys, sorted_values = Sorts.SortByKey(keys, values, algorithm=algorithm)
+            self.assertEqual(sorted_keys, [1, 1, 1, 2, 3, 3])
+            self.assertEqual([keys[v] for v in sorted_values], sorted_keys)
+
+    def test_sort_by_key_buffers(self):
+        keys = array.array('i', [5, 2, 9])
+        values = array.array('d', [0.5, 0.25, 0.75])
+        self.assertEqual(Sorts.SortByKey(keys, values), ([2, 5, 9], [0.25, 0.5, 0.75]))
+        self.assertEqual(list(values), [0.5, 0.25, 0.75])
+
+        row_ids = array.array('q', [10 ** 12, 7, -1])
+        result = Sorts.SortByKey(keys, row_ids, algorithm="radix", inplace=True)
+        self.assertIs(result[0], keys)
+        self.assertIs(result[1], row_ids)
+        self.assertEqual(list(keys), [2, 5, 9])
+        self.assertEqual(list(row_ids), [7, 10 ** 12, -1])
+
+        with self.assertRaises(ValueError):
+            Sorts.SortByKey([1, 2], [1])
+
+    def test_float_sorts_order_nans_last(self):
+        nan = float('nan')
+        values = [3.5, nan, -1.25, float('inf'), nan, -float('inf'), 0.0]
+        for sort in (Sorts.InsertionSort, Sorts.MergeSort, Sorts.QuickSort, Sorts.LomutoQuickSort, Sorts.RadixSort):
+            result = sort(values)
+            self.assertEqual(result[:5], [-float('inf'), -1.25, 0.0, 3.5, float('inf')])
+            self.assertTrue(all(x != x for x in result[5:]))
+
+        for typecode in ('f', 'd'):
+            buf = array.array(typecode, [2.5, nan, -7.0, 1.0])
+            Sorts.RadixSort(buf, inplace=True)
+            self.assertEqual(list(buf)[:3], [-7.0, 1.0, 2.5])
+            self.assertNotEqual(buf[3], buf[3])
+
+        self.assertIsNone(Sorts.CountingSort([1.5, 0.5]))
+
+    def test_typed_buffers(self):
+        unsigned = array.array('I', [4000000000, 1, 3000000000, 0])
+        self.assertEqual(Sorts.QuickSort(unsigned), [0, 1, 3000000000, 4000000000])
+        self.assertEqual(Sorts.RadixSort(unsigned), [0, 1, 3000000000, 4000000000])
+
+        wide = array.array('q', [2 ** 62, -(2 ** 62), 0])
+        Sorts.MergeSort(wide, inplace=True)
+        self.assertEqual(list(wide), [-(2 ** 62), 0, 2 ** 62])
+
+        self.assertEqual(Sorts.QuickSort([2 ** 40, 1, -(2 ** 40)]), [-(2 ** 40), 1, 2 ** 40])
+        self.assertEqual(Sorts.ArgSort(array.array('f', [0.5, -0.5, float('nan'), 0.0])), [1, 3, 0, 2])
+
+        with self.assertRaises(OverflowError):
+            Sorts.QuickSort([2 ** 64, 1])
+        with self.assertRaises(TypeError):
+            Sorts.MergeSort(array.array('d', [2.0, 1.0]), buffer=array.array('i', [0, 0]))
+
+    def test_parallel_sorts(self):
+        threshold = Sorts.PARALLEL_THRESHOLD
+        Sorts.PARALLEL_THRESHOLD = 0
+        try:
+            values = [(i * 7919) % 10007 - 5000 for i in range(20000)]
+            expected = sorted(values)
+            for threads in (2, 3, 8):
+                self.assertEqual(Sorts.MergeSort(values, threads=threads), expected)
+                self.assertEqual(Sorts.QuickSort(values, threads=threads), expected)
+            self.assertEqual(Sorts.MergeSort(values, parallel=True), expected)
+
+            buf = array.array('d', values)
+            self.assertIs(Sorts.QuickSort(buf, inplace=True, threads=4), buf)
+            self.assertEqual(list(buf), expected)
+
+            self.assertEqual(Sorts.MergeSort([3, 1, 2], threads=4), [1, 2, 3])
+            with self.assertRaises(ValueError):
+                Sorts.QuickSort(values, threads=0)
+        finally:
+            Sorts.PARALLEL_THRESHOLD = threshold
+
+    def test_parallel_below_threshold_is_serial(self):
+        self.assertEqual(Sorts.MergeSort(self.unsorted, parallel=True), self.sorted)
+        self.assertEqual(Sorts.QuickSort(self.duplicates, threads=4), self.sorted_duplicates)
+
+    def test_select(self):
+        values = [(i * 7919) % 1009 - 500 for i in range(1000)]
+        ordered = sorted(values)
+        for k in (0, 1, 499, 500, 998, 999):
+            self.assertEqual(Sorts.Select(values, k), ordered[k])
+
+        buffer = array.array('q', values)
+        median = Sorts.Select(buffer, 500, inplace=True)
+        self.assertEqual(median, ordered[500])
+        self.assertEqual(buffer[500], median)
+        self.assertTrue(all(x <= median for x in buffer[:500]))
+        self.assertTrue(all(x >= median for x in buffer[501:]))
+
+        with self.assertRaises(ValueError):
+            Sorts.Select(values, 1000)
+        with self.assertRaises(ValueError):
+            Sorts.Select([], 0)
+        with self.assertRaises(ValueError):
+            Sorts.Select(array.array('i'), 0)
+
+    def test_partial_sort(self):
+        values = [(i * 7919) % 1009 for i in range(1000)]
+        for k in (0, 5, 300, 1000):
+            result = Sorts.PartialSort(values, k)
+            self.assertEqual(result[:k], sorted(values)[:k])
+            self.assertEqual(sorted(result), sorted(values))
+
+        buffer = array.array('d', [3.0, float('nan'), -2.0, 1.0])
+        self.assertIs(Sorts.PartialSort(buffer, 2, inplace=True), buffer)
+        self.assertEqual(list(buffer[:2]), [-2.0, 1.0])
+        with self.assertRaises(ValueError):
+            Sorts.PartialSort(values, 1001)
+
+        self.assertEqual(Sorts.PartialSort([], 0), [])
+        empty = array.array('i')
+        self.assertIs(Sorts.PartialSort(empty, 0, inplace=True), empty)
+        with self.assertRaises(ValueError):
+            Sorts.PartialSort([], 1)
+
+    def test_top_k(self):
+        values = [(i * 7919) % 1009 - 500 for i in range(1000)]
+        self.assertEqual(Sorts.TopK(values, 10), sorted(values, reverse=True)[:10])
+        self.assertEqual(Sorts.TopK(values, 10, largest=False), sorted(values)[:10])
+        self.assertEqual(Sorts.TopK(values, 0), [])
+        self.assertEqual(Sorts.TopK([], 0), [])
+        self.assertEqual(Sorts.TopK(array.array('d'), 0, largest=False), [])
+        with self.assertRaises(ValueError):
+            Sorts.TopK([], 1)
+
+        buffer = array.array('I', [5, 1, 4, 2, 3])
+        self.assertEqual(Sorts.TopK(buffer, 2), [5, 4])
+        self.assertEqual(list(buffer), [5, 1, 4, 2, 3])
+
+        result = Sorts.TopK([1.5, float('nan'), 3.0, -1.0], 2)
+        self.assertNotEqual(result[0], result[0])
+        self.assertEqual(result[1], 3.0)
+        self.assertEqual(Sorts.TopK([1.5, float('nan'), 3.0], 2, largest=False), [1.5, 3.0])
+
+    def test_merge_k(self):
+        shards = [sorted((i * 7919) % 1009 for i in range(n)) for n in (0, 1, 17, 3000)]
+        expected = sorted(x for shard in shards for x in shard)
+        inputs = [array.array('i', shards[0]), iter(shards[1]), shards[2], array.array('i', shards[3])]
+        self.assertEqual(list(Sorts.MergeK(inputs, batch_size=64)), expected)
+        self.assertEqual(list(Sorts.MergeK(shards, batch_size=1)), expected)
+        self.assertEqual(list(Sorts.MergeK([])), [])
+
+        result = list(Sorts.MergeK([array.array('d', [1.0, float('nan')]), [0.5, 2.0]]))
+        self.assertEqual(result[:3], [0.5, 1.0, 2.0])
+        self.assertNotEqual(result[3], result[3])
+
+    def test_merge_k_late_floats(self):
+        # Lists are scanned whole, so a float past the first batch still promotes the merge
+        self.assertEqual(list(Sorts.MergeK([[1, 2, 3, 4.5], [0, 5]], batch_size=2)), [0, 1, 2, 3, 4.5, 5])
+
+        late = lambda: (x for x in [1, 2, 3, 4.5])
+        with self.assertRaises(TypeError):
+            list(Sorts.MergeK([late(), [0, 5]], batch_size=2))
+        self.assertEqual(list(Sorts.MergeK([late(), [0, 5]], dtype="d", batch_size=2)), [0, 1, 2, 3, 4.5, 5])
+
+    def test_merge_k_dtype_range(self):
+        with self.assertRaises(OverflowError):
+            list(Sorts.MergeK([[2 ** 40]], dtype="i"))
+        with self.assertRaises(OverflowError):
+            list(Sorts.MergeK([[-1, 0]], dtype="I"))
+        with self.assertRaises(OverflowError):
+            list(Sorts.MergeK([array.array('q', [1, 2 ** 33])], dtype="i"))
+        with self.assertRaises(TypeError):
+            list(Sorts.MergeK([[0.5]], dtype="q"))
+        self.assertEqual(list(Sorts.MergeK([[2 ** 40], [-1]], dtype="q")), [-1, 2 ** 40])
+
+    def test_merge_k_is_lazy(self):
+        merged = Sorts.MergeK([itertools.count(0, 2), itertools.count(1, 2)], batch_size=8)
+        self.assertEqual(list(itertools.islice(merged, 20)), list(range(20)))
+        merged.close()
+
+        with self.assertRaises(ValueError):
+            Sorts.MergeK([[1]], dtype="h")
+        with self.assertRaises(ValueError):
+            Sorts.MergeK([[1]], batch_size=0)
+
+    def test_sort_file_multiple_runs(self):
+        with tempfile.TemporaryDirectory() as directory:
+            in_path = os.path.join(directory, "in.bin")
+            out_path = os.path.join(directory, "out.bin")
+            for typecode in ('i', 'q'):
+                values = array.array(typecode, [(i * 7919) % 100003 - 50000 for i in range(50000)])
+                with open(in_path, "wb") as f:
+                    f.write(values.tobytes())
+
+                calls = []
+                ok = Sorts.SortFile(in_path, out_path, typecode, memory_limit=32 * 1024,
+                                    progress=lambda done, total: calls.append((done, total)),
+                                    temp_dir=directory)
+                self.assertTrue(ok)
+
+                result = array.array(typecode)
+                with open(out_path, "rb") as f:
+                    result.frombytes(f.read())
+                self.assertEqual(list(result), sorted(values))
+                self.assertEqual(calls[-1], (100000, 100000))
+                self.assertEqual(sorted(os.listdir(directory)), ["in.bin", "out.bin"])
+
+    def test_sort_file_single_run_and_errors(self):
+        with tempfile.TemporaryDirectory() as directory:
+            in_path = os.path.join(directory, "in.bin")
+            out_path = os.path.join(directory, "out.bin")
+            with open(in_path, "wb") as f:
+                f.write(array.array('d', [2.5, float('nan'), -1.0]).tobytes())
+            self.assertTrue(Sorts.SortFile(in_path, out_path, 'd'))
+            result = array.array('d')
+            with open(out_path, "rb") as f:
+                result.frombytes(f.read())
+            self.assertEqual(list(result)[:2], [-1.0, 2.5])
+
+            with open(in_path, "wb") as f:
+                f.write(b"\x01\x02\x03")
+            self.assertFalse(Sorts.SortFile(in_path, out_path, 'i'))
+            self.assertFalse(Sorts.SortFile(os.path.join(directory, "missing"), out_path))
+            with self.assertRaises(ValueError):
+                Sorts.SortFile(in_path, out_path, 'h')
+
+    def test_sort_file_same_path(self):
+        with tempfile.TemporaryDirectory() as directory:
+            in_path = os.path.join(directory, "in.bin")
+            link_path = os.path.join(directory, "link.bin")
+            values = array.array('i', [3, 1, 2])
+            with open(in_path, "wb") as f:
+                f.write(values.tobytes())
+            os.link(in_path, link_path)
+
+            for out_path in (in_path, link_path):
+                with self.assertRaises(ValueError):
+                    Sorts.SortFile(in_path, out_path, 'i')
+            with open(in_path, "rb") as f:
+                self.assertEqual(f.read(), values.tobytes())
+
 if __name__ == "__main__":
     unittest.main()
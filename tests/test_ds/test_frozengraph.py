@@ -0,0 +1,78 @@
+import unittest
+from DataStructures import Graph, FrozenGraph
+from DataStructures_py.Utils import INT_MAX
+
+class TestFrozenGraph(unittest.TestCase):
+    def setUp(self):
+        self.g = Graph(directed=False)
+        for v in (10, 20, 30, 40, 50):
+            self.g.CreateVertex(v)
+        self.g.CreateWeightedEdge(10, 20, 1.5)
+        self.g.CreateWeightedEdge(20, 30, 2.5)
+        self.g.CreateWeightedEdge(10, 40, 4.0)
+        self.frozen = self.g.Freeze()
+
+    def test_properties(self):
+        self.assertIsInstance(self.frozen, FrozenGraph)
+        self.assertFalse(self.frozen.IsDirected())
+        self.assertEqual(self.frozen.GetSize(), 5)
+        self.assertEqual(self.frozen.GetEdgeCount(), 3)
+        self.assertEqual(self.frozen.GetIds(), [10, 20, 30, 40, 50])
+        self.assertEqual(self.frozen.GraphWeight(), 8.0)
+
+    def test_snapshot_is_independent(self):
+        self.g.CreateEdge(30, 50)
+        self.g.DeleteVertex(40)
+        self.assertEqual(self.frozen.GetSize(), 5)
+        self.assertEqual(self.frozen.Distance(10, 50), INT_MAX)
+        self.assertEqual(self.frozen.EdgeWeight(40, 10), 4.0)
+
+    def test_neighbors_and_weights(self):
+        neighbors = self.frozen.GetNeighbors(10)
+        self.assertEqual(neighbors.GetHead().GetData(), 20)
+        self.assertEqual(neighbors.Size(), 2)
+        self.assertEqual(self.frozen.EdgeWeight(30, 20), 2.5)
+        self.assertEqual(self.frozen.EdgeWeight(10, 30), -1)
+        self.assertIsNone(self.frozen.GetNeighbors(99))
+
+    def test_bfs_matches_graph(self):
+        self.assertEqual(self.frozen.BFS(10), self.g.BFS(10))
+        colors, distances, parents = self.frozen.BFS(30)
+        self.assertEqual(distances[40], 3)
+        self.assertEqual(parents[40], 10)
+        self.assertEqual(colors[50], "white")
+        self.assertEqual(distances[50], INT_MAX)
+        self.assertEqual(self.frozen.BFS(99), ({}, {}, {}))
+
+    def test_paths_and_reachability(self):
+        path = self.frozen.GetPath(30, 40)
+        self.assertEqual(path.GetHead().GetData(), 30)
+        self.assertEqual(path.Size(), 4)
+        self.assertIsNone(self.frozen.GetPath(10, 50))
+        self.assertEqual(self.frozen.Distance(30, 40), 3)
+        self.assertEqual(self.frozen.GetReachableVertices(10).Size(), 3)
+
+    def test_connectivity(self):
+        self.assertFalse(self.frozen.IsConnected())
+        self.g.CreateEdge(40, 50)
+        self.assertTrue(self.g.Freeze().IsConnected())
+
+        directed = Graph(directed=True)
+        for v in range(3):
+            directed.CreateVertex(v)
+        directed.CreateEdge(0, 1)
+        directed.CreateEdge(1, 2)
+        self.assertFalse(directed.Freeze().IsConnected())
+        directed.CreateEdge(2, 0)
+        frozen = directed.Freeze()
+        self.assertTrue(frozen.IsConnected())
+        self.assertEqual(frozen.EdgeWeight(1, 0), -1)
+
+    def test_empty_graph(self):
+        frozen = Graph().Freeze()
+        self.assertEqual(frozen.GetSize(), 0)
+        self.assertTrue(frozen.IsConnected())
+        self.assertTrue(frozen.GetVertices().IsEmpty())
+
+if __name__ == "__main__":
+    unittest.main()
\ No newline at end of file
@@ -1,6 +1,8 @@
+import array
+import ctypes
 import unittest
 from DataStructures import Graph
-from DataStructures_py.Utils import INT_MAX
+from DataStructures_py.Utils import INT_MAX, C_INT_MAX, BFS_COLORS
 
 class TestGraph(unittest.TestCase):
     def setUp(self):
@@ -191,5 +193,268 @@ class TestGraph(unittest.TestCase):
         self.assertEqual(self.g_dir.Distance(1, 10), 9)
         self.assertEqual(self.g_dir.Distance(10, 1), INT_MAX)
 
+    def test_lookups_after_deleting_vertices(self):
+        for v in range(1, 7):
+            self.g_undir.CreateVertex(v)
+        for v in range(1, 6):
+            self.g_undir.CreateWeightedEdge(v, v + 1, float(v))
+        self.g_undir.CreateEdge(1, 6)
+        self.g_undir.CreateEdge(1, 6)
+        self.assertEqual(self.g_undir.GraphWeight(), 15.0)
+
+        self.g_undir.DeleteVertex(3)
+        self.assertEqual(self.g_undir.GetSize(), 5)
+        self.assertEqual(self.g_undir.EdgeWeight(2, 3), -1)
+        self.assertEqual(self.g_undir.EdgeWeight(5, 4), 4.0)
+        self.assertEqual(self.g_undir.Distance(2, 4), 4)
+
+        self.g_undir.DeleteEdge(6, 1)
+        self.assertEqual(self.g_undir.Distance(2, 4), INT_MAX)
+        self.g_undir.CreateVertex(3)
+        self.g_undir.CreateEdge(2, 3)
+        self.g_undir.CreateEdge(3, 4)
+        self.assertEqual(self.g_undir.Distance(1, 6), 5)
+
+    def test_large_graph_build(self):
+        n = 20000
+        for v in range(n):
+            self.g_dir.CreateVertex(v)
+        for v in range(n - 1):
+            self.g_dir.CreateWeightedEdge(v, v + 1, 1.0)
+        for v in range(0, n - 100, 100):
+            self.g_dir.CreateWeightedEdge(v, v + 100, 2.0)
+        self.assertEqual(self.g_dir.GetSize(), n)
+        self.assertEqual(self.g_dir.EdgeWeight(n - 2, n - 1), 1.0)
+        self.assertEqual(self.g_dir.EdgeWeight(n - 1, n - 2), -1)
+        self.assertEqual(self.g_dir.Distance(0, n - 1), 298)
+
+    def test_from_edges(self):
+        g, summary = Graph.FromEdges([1, 2, 2, 3, 1, 4], [2, 3, 1, 3, 2, 5],
+                                     [1.0, 2.0, 5.0, 1.0, 3.0, 1.0], vertices=[9], duplicates="min")
+        self.assertFalse(g.IsDirected())
+        self.assertEqual(g.GetSize(), 6)
+        self.assertEqual(g.EdgeWeight(2, 1), 1.0)
+        self.assertEqual(g.EdgeWeight(4, 5), 1.0)
+        self.assertEqual(g.Distance(1, 3), 2)
+        self.assertEqual(summary, {"vertices": 6, "edges": 3, "duplicates": 2, "self_loops": 1, "rejected": [2, 3, 4]})
+
+    def test_from_edges_buffers_and_policies(self):
+        src = array.array('i', [0, 1, 0, 0])
+        dst = array.array('i', [1, 2, 1, 1])
+        weights = array.array('d', [1.0, 2.0, 3.0, 4.0])
+        g, summary = Graph.FromEdges(src, dst, weights, directed=True, duplicates="sum")
+        self.assertTrue(g.IsDirected())
+        self.assertEqual(g.EdgeWeight(0, 1), 8.0)
+        self.assertEqual(g.EdgeWeight(1, 0), -1)
+        self.assertEqual(summary["rejected"], [2, 3])
+
+        g, _ = Graph.FromEdges(memoryview(src), dst, weights, duplicates="last")
+        self.assertEqual(g.EdgeWeight(1, 0), 4.0)
+
+        # Buffers in either explicit byte order are read by value, not reinterpreted
+        for order in (ctypes.c_int.__ctype_be__, ctypes.c_int.__ctype_le__):
+            g, _ = Graph.FromEdges((order * 2)(1, 2), (order * 2)(2, 300), directed=True)
+            self.assertEqual(g.GetSize(), 3)
+            self.assertEqual(g.EdgeWeight(2, 300), 0)
+
+        with self.assertRaises(ValueError):
+            Graph.FromEdges([1, 2], [1, 3], self_loops="error")
+        with self.assertRaises(ValueError):
+            Graph.FromEdges([1, 2, 2], [2, 3, 1], duplicates="error")
+        with self.assertRaises(ValueError):
+            Graph.FromEdges([1], [2, 3])
+        with self.assertRaises(ValueError):
+            Graph.FromEdges([1], [2], duplicates="average")
+
+    def test_bfs_arrays(self):
+        for v in (-1, 5, 7, 9):
+            self.g_dir.CreateVertex(v)
+        self.g_dir.CreateEdge(-1, 5)
+        self.g_dir.CreateEdge(5, 7)
+
+        ids, distances, parents, colors = self.g_dir.BFSArrays(-1)
+        self.assertEqual(list(ids), [-1, 5, 7, 9])
+        self.assertEqual(list(distances), [0, 1, 2, C_INT_MAX])
+        self.assertEqual(list(parents), [-1, 0, 1, -1])
+        self.assertIsNone(colors)
+
+        out = array.array('i', [0] * 6)
+        ids, distances, parents, colors = self.g_dir.BFSArrays(5, distances=out, colors=True)
+        self.assertIs(distances, out)
+        self.assertEqual(list(out[:4]), [C_INT_MAX, 0, 1, C_INT_MAX])
+        self.assertEqual([BFS_COLORS[c] for c in colors], ["white", "black", "black", "white"])
+        self.assertIsNone(self.g_dir.BFSArrays(42))
+
+        with self.assertRaises(ValueError):
+            self.g_dir.BFSArrays(5, ids=array.array('i', [0]))
+        with self.assertRaises(TypeError):
+            self.g_dir.BFSArrays(5, parents=array.array('d', [0] * 4))
+
+        colors, distances, parents = self.g_dir.BFS(-1)
+        self.assertEqual(parents, {-1: None, 5: -1, 7: 5, 9: None})
+        self.assertEqual(colors[9], "white")
+
+    def test_direction_optimizing_bfs(self):
+        n = 2000
+        src = [v for v in range(1, n) for _ in range(3)]
+        dst = [(v * 7 + k * 13) % v for v in range(1, n) for k in range(3)]
+        g, _ = Graph.FromEdges(src, dst, vertices=range(n))
+        _, top_down, _, _ = g.BFSArrays(0)
+        ids, distances, parents, _ = g.BFSArrays(0, direction_optimizing=True)
+        self.assertEqual(list(distances), list(top_down))
+        for i in range(1, n):
+            self.assertEqual(distances[parents[i]], distances[i] - 1)
+
+        frozen = g.Freeze()
+        self.assertEqual(list(frozen.BFSArrays(0, direction_optimizing=True)[1]), list(top_down))
+
+    def test_traversals_follow_mutations(self):
+        for v in range(4):
+            self.g_dir.CreateVertex(v)
+        self.g_dir.CreateEdge(0, 1)
+        self.assertEqual(self.g_dir.Distance(0, 1), 1)
+        self.assertFalse(self.g_dir.IsConnected())
+
+        self.g_dir.CreateEdge(1, 2)
+        self.g_dir.CreateEdge(2, 3)
+        self.g_dir.CreateEdge(3, 0)
+        self.assertEqual(self.g_dir.Distance(0, 3), 3)
+        self.assertTrue(self.g_dir.IsConnected())
+
+        self.g_dir.DeleteEdge(2, 3)
+        self.assertEqual(self.g_dir.Distance(0, 3), INT_MAX)
+        self.assertEqual(self.g_dir.GetReachableVertices(0).Size(), 2)
+
+        self.assertEqual(self.g_dir.GetIds(), [0, 1, 2, 3])
+
+        # Freeze() copies are owned by the caller and outlive the graph's own snapshots
+        frozen = self.g_dir.Freeze()
+        self.g_dir.CreateEdge(2, 3)
+        self.assertEqual(self.g_dir.Distance(0, 3), 3)
+        self.assertEqual(frozen.Distance(0, 3), INT_MAX)
+        self.assertFalse(hasattr(self.g_dir, "Snapshot"))
+
+        self.g_dir.Clear()
+        self.assertTrue(self.g_dir.IsConnected())
+
+    def test_weighted_shortest_paths(self):
+        # 0 -1- 1 -1- 2 -1- 3 is shorter than the direct 0 -5- 3 edge
+        for v in range(5):
+            self.g_dir.CreateVertex(v)
+        for u, v, w in [(0, 1, 1), (1, 2, 1), (2, 3, 1), (0, 3, 5), (3, 4, 2)]:
+            self.g_dir.CreateWeightedEdge(u, v, w)
+        self.g_dir.CreateVertex(9)
+
+        distances, parents = self.g_dir.Dijkstra(0)
+        self.assertEqual(distances, {0: 0, 1: 1, 2: 2, 3: 3, 4: 5, 9: INT_MAX})
+        self.assertEqual(parents[4], 3)
+        self.assertIsNone(parents[9])
+
+        self.assertEqual(self.g_dir.ShortestPath(0, 4), ([0, 1, 2, 3, 4], 5))
+        self.assertEqual(self.g_dir.ShortestPath(0, 4, bidirectional=True), ([0, 1, 2, 3, 4], 5))
+        self.assertEqual(self.g_dir.ShortestPath(0, 4, weighted=False), ([0, 3, 4], 2))
+        self.assertEqual(self.g_dir.ShortestPath(4, 0), ([], INT_MAX))
+        self.assertEqual(self.g_dir.AStar(0, 4, lambda v, t: abs(t - v)), ([0, 1, 2, 3, 4], 5))
+        self.assertIsNone(self.g_dir.ShortestPath(0, 42))
+
+        self.g_dir.CreateWeightedEdge(4, 9, -1)
+        self.assertIsNone(self.g_dir.Dijkstra(0))
+        self.assertEqual(self.g_dir.ShortestPath(0, 9, weighted=False), ([0, 3, 4, 9], 3))
+
+    def test_distance_batches(self):
+        # Directed path 0 -> 1 -> 2 -> 3 plus an isolated vertex 4
+        g, _ = Graph.FromEdges([0, 1, 2], [1, 2, 3], directed=True, vertices=range(5))
+        out = g.Distances([0, 2, 0], [3, 1, 4])
+        self.assertEqual(list(out), [3, 1, C_INT_MAX, 1, C_INT_MAX, C_INT_MAX, 3, 1, C_INT_MAX])
+        self.assertIsNone(g.Distances([0], [42]))
+
+        ids, distances, parents = g.MultiSourceBFS([0, 2])
+        self.assertEqual(list(ids), [0, 1, 2, 3, 4])
+        self.assertEqual(list(distances), [0, 1, 0, 1, C_INT_MAX])
+        self.assertEqual(list(parents), [-1, 0, -1, 2, -1])
+
+        ids, matrix = g.AllPairsShortestPaths(threads=2)
+        self.assertEqual(len(matrix), 25)
+        self.assertEqual(matrix[0 * 5 + 3], 3)
+        self.assertEqual(matrix[3 * 5 + 0], C_INT_MAX)
+        self.assertEqual(list(g.Distances(ids, ids)), list(matrix))
+        with self.assertRaises(MemoryError):
+            g.AllPairsShortestPaths(max_bytes=64)
+
+    def test_shortest_path_cache(self):
+        for v in range(4):
+            self.g_undir.CreateVertex(v)
+        self.g_undir.CreateEdge(0, 1)
+        self.g_undir.CreateEdge(1, 2)
+        self.g_undir.CreateEdge(2, 3)
+        self.g_undir.EnableCache(1 << 20)
+
+        self.assertEqual(self.g_undir.Distance(0, 3), 3)
+        self.assertEqual(self.g_undir.GetPath(0, 2).Size(), 3)
+        self.assertEqual(self.g_undir.GetReachableVertices(0).Size(), 3)
+        stats = self.g_undir.CacheStats()
+        self.assertEqual((stats["hits"], stats["misses"], stats["entries"]), (2, 1, 1))
+
+        # Mutations invalidate the cached trees
+        self.g_undir.CreateEdge(0, 3)
+        self.assertEqual(self.g_undir.Distance(0, 3), 1)
+        self.g_undir.DeleteVertex(3)
+        self.assertEqual(self.g_undir.GetReachableVertices(0).Size(), 2)
+        self.assertEqual(self.g_undir.CacheStats()["misses"], 3)
+
+        self.g_undir.ResetCacheStats()
+        self.g_undir.EnableCache(16)
+        self.g_undir.Distance(0, 2)
+        self.assertEqual(self.g_undir.CacheStats()["entries"], 0)
+        self.g_undir.DisableCache()
+        self.assertEqual(self.g_undir.CacheStats()["budget"], 0)
+
+    def test_components(self):
+        # Cycles {0, 1, 2} and {3, 4} joined by 2 -> 3, and an isolated 5
+        g, _ = Graph.FromEdges([0, 1, 2, 2, 3, 4], [1, 2, 0, 3, 4, 3], [1, 1, 1, 7, 1, 1],
+                               directed=True, vertices=range(6))
+        ids, labels, count = g.StronglyConnectedComponents()
+        self.assertEqual(list(ids), [0, 1, 2, 3, 4, 5])
+        self.assertEqual(count, 3)
+        self.assertEqual(labels[0], labels[1])
+        self.assertEqual(labels[3], labels[4])
+        self.assertLess(labels[2], labels[3])
+        self.assertFalse(g.IsConnected())
+
+        _, weak, weak_count = g.WeaklyConnectedComponents()
+        self.assertEqual((list(weak), weak_count), ([0, 0, 0, 0, 0, 1], 2))
+
+        _, _, dag = g.Condensation()
+        self.assertEqual(dag.GetSize(), 3)
+        self.assertEqual(dag.GetEdgeCount(), 1)
+        self.assertEqual(dag.EdgeWeight(labels[2], labels[3]), 7)
+
+        undirected, _ = Graph.FromEdges([0, 2], [1, 3], vertices=range(5))
+        _, labels, count = undirected.StronglyConnectedComponents()
+        self.assertEqual((list(labels), count), ([0, 0, 1, 1, 2], 3))
+
+    def test_topological_sort(self):
+        # Diamond 0 -> {1, 2} -> 3 with a heavier branch through 2
+        g, _ = Graph.FromEdges([0, 0, 1, 2], [1, 2, 3, 3], [1, 4, 1, 1], directed=True, vertices=range(5))
+        self.assertEqual(list(g.TopologicalSort()), [0, 4, 1, 2, 3])
+        self.assertFalse(g.HasCycle())
+        path, length = g.DAGLongestPath()
+        self.assertEqual((list(path), length), ([0, 2, 3], 5))
+        self.assertEqual(g.DAGLongestPath(weighted=False)[1], 2)
+
+        g.CreateEdge(3, 0)
+        self.assertTrue(g.HasCycle())
+        self.assertIsNone(g.TopologicalSort())
+        self.assertIsNone(g.DAGLongestPath())
+
+        chain, _ = Graph.FromEdges(range(99999), range(1, 100000), directed=True)
+        self.assertEqual(chain.DAGLongestPath(weighted=False)[1], 99999)
+
+        tree, _ = Graph.FromEdges([0, 0], [1, 2])
+        self.assertFalse(tree.HasCycle())
+        self.assertIsNone(tree.TopologicalSort())
+        tree.CreateEdge(1, 2)
+        self.assertTrue(tree.HasCycle())
+
 if __name__ == "__main__":
     unittest.main()